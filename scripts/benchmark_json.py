@@ -0,0 +1,135 @@
+"""Benchmark the JSON backends on realistic workflow payloads."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+# Third-party
+from fastapi.encoders import jsonable_encoder
+
+# Local Application
+from src.utils.json_backend import (
+    AUTO_BACKEND_ORDER,
+    BACKEND_STDLIB,
+    is_json_backend_installed,
+    load_json_backend,
+)
+
+
+# ================================== Functions ================================ #
+def build_result_payload(records: int) -> Dict[str, Any]:
+    """Build a workflow result body shaped like ``process_data_activity`` output.
+
+    Args:
+        records: Number of processed records in the result.
+
+    Returns:
+        Result response content.
+    """
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return {
+        "workflow_id": "simple_workflow_user_123_1704067200.0_1a2b3c4d",
+        "status": "COMPLETED",
+        "result": {
+            "processed_at": started.isoformat(),
+            "record_count": records,
+            "records": [
+                {
+                    "id": index,
+                    "user_id": f"user_{index % 97}",
+                    "name": f"Record {index} – ünïcode",
+                    "score": index * 0.731,
+                    "active": index % 3 == 0,
+                    "tags": ["alpha", "beta", "gamma"][: index % 4],
+                    "created_at": (started + timedelta(seconds=index)).isoformat(),
+                    "attributes": {"source": "ingest", "batch": index // 100},
+                }
+                for index in range(records)
+            ],
+        },
+    }
+
+
+def legacy_render(content: Any) -> bytes:
+    """Render a body the way the result route did before the JSON backend.
+
+    Args:
+        content: Response content.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def time_call(func: Callable[[], Any], repeat: int, number: int) -> float:
+    """Time a call, keeping the best of several runs.
+
+    Args:
+        func: Call to time.
+        repeat: Number of timing runs.
+        number: Calls per run.
+
+    Returns:
+        Best time per call in milliseconds.
+    """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Print encode and decode timings per backend and payload size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        type=int,
+        nargs="+",
+        default=[10, 1_000, 10_000],
+        help="Result sizes, in records, to benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs")
+    args = parser.parse_args()
+
+    backends = [
+        load_json_backend(name)
+        for name in AUTO_BACKEND_ORDER
+        if is_json_backend_installed(name)
+    ]
+
+    print(
+        f"{'records':>8} {'bytes':>10} {'operation':<22} {'ms/op':>10} {'speedup':>8}"
+    )
+    for records in args.records:
+        payload = build_result_payload(records)
+        body = legacy_render(payload)
+        number = max(1, 20_000 // records)
+
+        rows: List[tuple] = []
+        baseline = time_call(lambda: legacy_render(payload), args.repeat, number)
+        rows.append(("encode legacy", baseline, baseline))
+        for backend in backends:
+            elapsed = time_call(lambda: backend.dumps(payload), args.repeat, number)
+            rows.append((f"encode {backend.name}", elapsed, baseline))
+
+        decode_baseline = None
+        for backend in backends:
+            elapsed = time_call(lambda: backend.loads(body), args.repeat, number)
+            if backend.name == BACKEND_STDLIB:
+                decode_baseline = elapsed
+            rows.append((f"decode {backend.name}", elapsed, None))
+
+        for operation, elapsed, reference in rows:
+            reference = reference or decode_baseline or elapsed
+            print(
+                f"{records:>8} {len(body):>10} {operation:<22} "
+                f"{elapsed:>10.3f} {reference / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
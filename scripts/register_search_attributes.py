@@ -0,0 +1,73 @@
+"""Script to register the service's custom search attributes with Temporal."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+
+# Third-party
+import hydra
+from omegaconf import DictConfig, OmegaConf
+from temporalio.api.operatorservice.v1 import (
+    AddSearchAttributesRequest,
+    ListSearchAttributesRequest,
+)
+from temporalio.client import Client
+from loguru import logger
+
+# Local Application
+from src.services.visibility import CUSTOM_SEARCH_ATTRIBUTES
+from src.utils.logging import setup_logger
+
+
+# ================================== Functions ================================ #
+async def register_search_attributes(cfg: DictConfig) -> None:
+    """Add any missing custom search attributes to the configured namespace.
+
+    Args:
+        cfg: Hydra configuration object.
+    """
+    server = cfg.temporal.server
+    client = await Client.connect(
+        f"{server.host}:{server.port}", namespace=server.namespace
+    )
+
+    existing = await client.operator_service.list_search_attributes(
+        ListSearchAttributesRequest(namespace=server.namespace)
+    )
+    missing = {
+        key.name: key.indexed_value_type
+        for key in CUSTOM_SEARCH_ATTRIBUTES
+        if key.name not in existing.custom_attributes
+    }
+    if not missing:
+        logger.info("All custom search attributes are already registered")
+    else:
+        await client.operator_service.add_search_attributes(
+            AddSearchAttributesRequest(
+                namespace=server.namespace, search_attributes=missing
+            )
+        )
+        logger.info(f"Registered search attributes: {', '.join(sorted(missing))}")
+
+    if not OmegaConf.select(cfg, "temporal.search_attributes.enabled", default=False):
+        logger.info(
+            "Set temporal.search_attributes.enabled=true to index new workflows "
+            "by UserId and CorrelationId"
+        )
+
+
+@hydra.main(config_path="../conf", config_name="config", version_base=None)
+def main(cfg: DictConfig) -> None:
+    """Main function to register the custom search attributes.
+
+    Args:
+        cfg: Hydra configuration object.
+    """
+    # Setup logging
+    setup_logger()
+
+    asyncio.run(register_search_attributes(cfg))
+
+
+if __name__ == "__main__":
+    main()
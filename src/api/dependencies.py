@@ -0,0 +1,141 @@
+"""Shared FastAPI dependencies for the API routes."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import time
+from typing import AsyncIterator
+
+# Third-party
+from fastapi import HTTPException, Request
+from omegaconf import DictConfig
+
+# Local Application
+from src.services.admission import AdmissionController
+from src.services.batch_operations import BulkJobRegistry
+from src.services.workflow_cache import WorkflowResultCache, WorkflowStatusCache
+from src.services.workflow_events import WorkflowEventHub
+from src.services.workflow_starter import WorkflowStarter
+
+
+# ================================== Functions ================================ #
+def get_app_config(request: Request) -> DictConfig:
+    """Get the Hydra configuration the application was created with.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Hydra configuration object stored by ``create_app``.
+    """
+    return request.app.state.config
+
+
+def get_status_cache(request: Request) -> WorkflowStatusCache:
+    """Get the application's workflow status cache.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Status cache created by ``create_app``.
+    """
+    return request.app.state.status_cache
+
+
+def get_result_cache(request: Request) -> WorkflowResultCache:
+    """Get the application's workflow result cache.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Result cache created by ``create_app``.
+    """
+    return request.app.state.result_cache
+
+
+def get_event_hub(request: Request) -> WorkflowEventHub:
+    """Get the application's workflow event hub.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Event hub created by ``create_app``.
+    """
+    return request.app.state.event_hub
+
+
+def get_workflow_starter(request: Request) -> WorkflowStarter:
+    """Get the application's workflow starter.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Workflow starter created by ``create_app``.
+    """
+    return request.app.state.workflow_starter
+
+
+def get_bulk_jobs(request: Request) -> BulkJobRegistry:
+    """Get the application's bulk operation job registry.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Job registry created by ``create_app``.
+    """
+    return request.app.state.bulk_jobs
+
+
+def get_admission_controller(request: Request) -> AdmissionController:
+    """Get the application's admission controller.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Admission controller created by ``create_app``.
+    """
+    return request.app.state.admission
+
+
+async def admit_request(request: Request) -> AsyncIterator[None]:
+    """Admit a request that calls Temporal, or shed it with ``503``.
+
+    The request's duration and outcome feed the controller's limit. Client
+    errors and ``503`` rejections do not count as backend failures.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Raises:
+        HTTPException: If the concurrency limit is reached.
+    """
+    controller = get_admission_controller(request)
+    if not controller.enabled:
+        yield
+        return
+
+    if not controller.try_acquire():
+        raise HTTPException(
+            status_code=503,
+            detail="Server is overloaded, retry later",
+            headers={"Retry-After": str(controller.retry_after_seconds)},
+        )
+
+    started = time.monotonic()
+    failed = False
+    try:
+        yield
+    except HTTPException as e:
+        # 503s are this service shedding work, not Temporal failing
+        failed = e.status_code >= 500 and e.status_code != 503
+        raise
+    except Exception:
+        failed = True
+        raise
+    finally:
+        controller.release(time.monotonic() - started, failed=failed)
@@ -0,0 +1,82 @@
+"""Entity tags and conditional ``If-None-Match`` requests."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import hashlib
+from typing import Optional
+
+# Third-party
+from fastapi import Response
+
+# Local Application
+from src.models.workflow import WorkflowResponse
+
+# ================================== Constants ================================ #
+WEAK_ETAG_PREFIX = "W/"
+
+
+# ================================== Functions ================================ #
+def content_etag(body: bytes) -> str:
+    """Build a strong entity tag from a serialized body.
+
+    Args:
+        body: Response body.
+
+    Returns:
+        Quoted tag derived from a hash of the body.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def status_etag(response: WorkflowResponse) -> str:
+    """Build a strong entity tag for a workflow status response.
+
+    A run's status body is fully determined by the run and its status, so
+    the tag is computed without serializing the body.
+
+    Args:
+        response: Workflow status response.
+
+    Returns:
+        Quoted tag of the run ID and status, or of the body's hash if the
+        run ID is unknown.
+    """
+    if response.run_id is None:
+        return content_etag(response.model_dump_json().encode("utf-8"))
+    return f'"{response.run_id}.{response.status}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against the current entity tag.
+
+    Uses weak comparison as required for ``If-None-Match``, so a tag that
+    was weakened downstream, e.g. by response compression, still matches.
+
+    Args:
+        if_none_match: The request's ``If-None-Match`` header value.
+        etag: Current entity tag of the resource.
+
+    Returns:
+        Whether the client's cached representation is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix(WEAK_ETAG_PREFIX)
+    return any(
+        tag.strip().removeprefix(WEAK_ETAG_PREFIX) == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build a ``304 Not Modified`` response.
+
+    Args:
+        etag: Current entity tag of the resource.
+
+    Returns:
+        Bodyless response carrying the entity tag.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,48 @@
+"""Request parsing and response rendering through the JSON backend."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from typing import Any, Callable, Coroutine
+
+# Third-party
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+# Local Application
+from src.utils.json_backend import get_json_backend
+
+
+# ================================== Classes ================================== #
+class BackendJSONResponse(JSONResponse):
+    """JSON response rendered by the configured JSON backend."""
+
+    def render(self, content: Any) -> bytes:
+        return get_json_backend().dumps(content)
+
+
+class BackendJSONRequest(Request):
+    """Request whose JSON body is parsed by the configured JSON backend."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = get_json_backend().loads(await self.body())
+        return self._json
+
+
+class BackendJSONRoute(APIRoute):
+    """Route that hands its endpoint a ``BackendJSONRequest``.
+
+    FastAPI parses JSON request bodies with ``Request.json``, so this puts
+    body parsing on the configured backend as well.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def backend_json_route_handler(request: Request) -> Response:
+            return await route_handler(
+                BackendJSONRequest(request.scope, request.receive)
+            )
+
+        return backend_json_route_handler
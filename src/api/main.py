@@ -2,19 +2,49 @@
 
 # ================================== Imports ================================== #
 # Standard Library
+import os
 from contextlib import asynccontextmanager
 from typing import Any
 
 # Third-party
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 from loguru import logger
 
 # Local Application
-from src.api.routes import workflows, health
+from src.api.json_io import BackendJSONResponse
+from src.api.middleware import (
+    DEFAULT_COMPRESSION_CHUNK_SIZE,
+    DEFAULT_COMPRESSION_EXCLUDED_MEDIA_TYPES,
+    DEFAULT_COMPRESSION_MINIMUM_SIZE,
+    CompressionMiddleware,
+    RateLimitMiddleware,
+)
+from src.api.routes import workflows, health, users
 from src.models.workflow import ErrorResponse
+from src.services.admission import AdmissionController
+from src.services.batch_operations import BulkJobRegistry
+from src.services.rate_limiter import create_rate_limiter
+from src.services.temporal_service import (
+    close_temporal_client,
+    configure_temporal_client,
+)
+from src.services.workflow_cache import WorkflowResultCache, WorkflowStatusCache
+from src.services.workflow_events import WorkflowEventHub
+from src.services.workflow_starter import WorkflowStarter
+from src.utils.compression import (
+    DEFAULT_ENCODINGS,
+    DEFAULT_ZLIB_LEVEL,
+    DEFAULT_ZSTD_LEVEL,
+)
+from src.utils.json_backend import BACKEND_AUTO, configure_json_backend
+from src.utils.loop_lag import DEFAULT_LAG_INTERVAL_SECONDS, LoopLagMonitor
+from src.workers.embedded import EmbeddedWorker
+
+# ================================== Constants ================================ #
+# Environment variable carrying the resolved configuration to server processes
+APP_CONFIG_ENV_VAR = "TEMPORAL_API_CONFIG"
 
 
 # ================================== Functions ================================ #
@@ -22,10 +52,28 @@ from src.models.workflow import ErrorResponse
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    client_manager = configure_temporal_client(app.state.config)
+    try:
+        # Connect eagerly so the first requests don't pay connect latency
+        await client_manager.connect()
+    except RuntimeError as e:
+        logger.warning(f"Temporal not reachable at startup, will retry lazily: {e}")
+    app.state.workflow_starter.backlog_monitor.start()
+    app.state.api_loop_lag.start()
+    await app.state.embedded_worker.start(client_manager)
+
     logger.info("FastAPI application started")
     yield
     # Shutdown
     logger.info("FastAPI application shutting down")
+    await app.state.bulk_jobs.close()
+    await app.state.embedded_worker.stop()
+    await app.state.api_loop_lag.stop()
+    await app.state.workflow_starter.backlog_monitor.stop()
+    await close_temporal_client()
+    await app.state.result_cache.close()
+    if app.state.rate_limiter is not None:
+        await app.state.rate_limiter.close()
 
 
 def create_app(cfg: DictConfig) -> FastAPI:
@@ -47,6 +95,66 @@ def create_app(cfg: DictConfig) -> FastAPI:
         openapi_url=cfg.api.docs.openapi_path if cfg.api.docs.enabled else None,
         lifespan=lifespan,
     )
+    app.state.config = cfg
+    configure_json_backend(
+        OmegaConf.select(cfg, "api.json.backend", default=BACKEND_AUTO)
+    )
+    app.state.status_cache = WorkflowStatusCache.from_config(cfg)
+    app.state.result_cache = WorkflowResultCache.from_config(cfg)
+    app.state.event_hub = WorkflowEventHub()
+    app.state.workflow_starter = WorkflowStarter.from_config(cfg)
+    app.state.bulk_jobs = BulkJobRegistry.from_config(cfg)
+    app.state.rate_limiter = create_rate_limiter(cfg)
+    app.state.admission = AdmissionController.from_config(cfg)
+    app.state.embedded_worker = EmbeddedWorker.from_config(cfg)
+    app.state.api_loop_lag = LoopLagMonitor(
+        "api",
+        OmegaConf.select(
+            cfg,
+            "temporal.worker.embedded.lag_interval_seconds",
+            default=DEFAULT_LAG_INTERVAL_SECONDS,
+        ),
+    )
+
+    # Add response compression innermost so every response can be compressed
+    if OmegaConf.select(cfg, "api.compression.enabled", default=False):
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=OmegaConf.select(
+                cfg,
+                "api.compression.minimum_size",
+                default=DEFAULT_COMPRESSION_MINIMUM_SIZE,
+            ),
+            level=OmegaConf.select(
+                cfg, "api.compression.level", default=DEFAULT_ZLIB_LEVEL
+            ),
+            zstd_level=OmegaConf.select(
+                cfg, "api.compression.zstd_level", default=DEFAULT_ZSTD_LEVEL
+            ),
+            chunk_size=OmegaConf.select(
+                cfg,
+                "api.compression.chunk_size",
+                default=DEFAULT_COMPRESSION_CHUNK_SIZE,
+            ),
+            encodings=OmegaConf.select(
+                cfg, "api.compression.encodings", default=list(DEFAULT_ENCODINGS)
+            ),
+            excluded_media_types=OmegaConf.select(
+                cfg,
+                "api.compression.excluded_media_types",
+                default=list(DEFAULT_COMPRESSION_EXCLUDED_MEDIA_TYPES),
+            ),
+        )
+
+    # Add rate limiting inside CORS so 429 responses carry CORS headers
+    if app.state.rate_limiter is not None:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=app.state.rate_limiter,
+            exempt_paths=OmegaConf.select(
+                cfg, "api.rate_limit.exempt_paths", default=[]
+            ),
+        )
 
     # Add CORS middleware
     app.add_middleware(
@@ -62,12 +170,30 @@ def create_app(cfg: DictConfig) -> FastAPI:
 
     # Include routers
     app.include_router(workflows.router, prefix="/api/v1")
+    app.include_router(users.router, prefix="/api/v1")
     app.include_router(health.router, prefix="/api/v1")
 
-
     return app
 
 
+def create_app_from_env() -> FastAPI:
+    """Application factory for server processes.
+
+    Each server worker process builds its own application, and with it its
+    own Temporal client pool, from the configuration the launcher exported.
+
+    Returns:
+        Configured FastAPI application instance.
+
+    Raises:
+        RuntimeError: If no configuration was exported.
+    """
+    config_yaml = os.environ.get(APP_CONFIG_ENV_VAR)
+    if config_yaml is None:
+        raise RuntimeError(f"{APP_CONFIG_ENV_VAR} is not set")
+    return create_app(OmegaConf.create(config_yaml))
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """Setup global exception handlers for the application.
 
@@ -77,27 +203,32 @@ def setup_exception_handlers(app: FastAPI) -> None:
     from fastapi import HTTPException
 
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Any, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(
+        request: Any, exc: HTTPException
+    ) -> BackendJSONResponse:
         """Handle HTTP exceptions with consistent error format."""
         logger.error(f"HTTP error {exc.status_code}: {exc.detail}")
-        return JSONResponse(
+        return BackendJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse(
                 error="HTTP_ERROR",
                 message=exc.detail,
                 details={"status_code": exc.status_code},
-            ).dict(),
+            ).model_dump(),
+            headers=exc.headers,
         )
 
     @app.exception_handler(Exception)
-    async def general_exception_handler(request: Any, exc: Exception) -> JSONResponse:
+    async def general_exception_handler(
+        request: Any, exc: Exception
+    ) -> BackendJSONResponse:
         """Handle unexpected exceptions."""
         logger.error(f"Unexpected error: {exc!r}", exc_info=True)
-        return JSONResponse(
+        return BackendJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="INTERNAL_ERROR",
                 message="An unexpected error occurred",
                 details={"exception_type": type(exc).__name__},
-            ).dict(),
+            ).model_dump(),
         )
@@ -0,0 +1,274 @@
+"""ASGI middleware for the API application."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+import math
+from typing import Any, Optional, Sequence
+
+# Third-party
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Local Application
+from src.api.etag import WEAK_ETAG_PREFIX
+from src.api.json_io import BackendJSONResponse
+from src.models.workflow import ErrorResponse
+from src.utils.compression import (
+    DEFAULT_ENCODINGS,
+    DEFAULT_ZLIB_LEVEL,
+    DEFAULT_ZSTD_LEVEL,
+    Compressor,
+    create_compressor,
+    is_encoding_available,
+    negotiate_encoding,
+)
+
+# ================================== Constants ================================ #
+DEFAULT_COMPRESSION_MINIMUM_SIZE = 1024
+DEFAULT_COMPRESSION_CHUNK_SIZE = 64 * 1024
+# Event streams must reach the client unbuffered
+DEFAULT_COMPRESSION_EXCLUDED_MEDIA_TYPES = ("text/event-stream",)
+
+
+# ================================== Classes ================================== #
+class RateLimitMiddleware:
+    """Reject requests over a per-client token-bucket limit with 429.
+
+    Clients are keyed by the identity of an authenticated user when an
+    authentication middleware has set one, otherwise by their IP address.
+    Client-supplied headers are never trusted as a key, since a client
+    could rotate them to dodge its limit or spend another user's bucket.
+    With the in-process limiter buckets are per worker process, so with
+    ``api.server.workers: N`` a client may get N times the configured rate;
+    the Redis limiter shares buckets across processes and replicas.
+    Written as plain ASGI middleware so allowed requests pass through
+    without wrapping the response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Any,
+        exempt_paths: Sequence[str] = (),
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            limiter: Limiter whose ``acquire(key)`` returns whether the request
+                is allowed and the seconds to wait if not.
+            exempt_paths: Path prefixes that are never limited.
+        """
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        allowed, retry_after = await self.limiter.acquire(self._client_key(scope))
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        response = BackendJSONResponse(
+            status_code=429,
+            content=ErrorResponse(
+                error="RATE_LIMITED",
+                message="Too many requests",
+                details={"retry_after_seconds": retry_after},
+            ).model_dump(),
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
+
+    def _client_key(self, scope: Scope) -> str:
+        """Identify the client a request is counted against.
+
+        Args:
+            scope: ASGI connection scope.
+
+        Returns:
+            ``user:<identity>`` for a user authenticated by an outer
+            authentication middleware, otherwise ``ip:<address>`` of the peer.
+        """
+        user = scope.get("user")
+        if user is not None and getattr(user, "is_authenticated", False):
+            return f"user:{user.identity}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+class CompressionMiddleware:
+    """Compress response bodies with the coding negotiated by ``Accept-Encoding``.
+
+    Bodies smaller than ``minimum_size`` are sent as is. Bodies are fed to
+    the compressor in ``chunk_size`` slices and each slice's output is sent
+    as soon as it is produced, so a large body is never held a second time
+    in compressed form. Multi-slice bodies are compressed in a worker thread
+    to keep the event loop responsive, and streamed responses are flushed
+    after every message so incremental output, e.g. NDJSON acknowledgements,
+    still arrives incrementally.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_COMPRESSION_MINIMUM_SIZE,
+        level: int = DEFAULT_ZLIB_LEVEL,
+        zstd_level: int = DEFAULT_ZSTD_LEVEL,
+        chunk_size: int = DEFAULT_COMPRESSION_CHUNK_SIZE,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+        excluded_media_types: Sequence[str] = DEFAULT_COMPRESSION_EXCLUDED_MEDIA_TYPES,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            minimum_size: Smallest body, in bytes, worth compressing.
+            level: Compression level for ``gzip`` and ``deflate``.
+            zstd_level: Compression level for ``zstd``.
+            chunk_size: Bytes compressed per step.
+            encodings: Codings to offer, most preferred first. Codings whose
+                package is not installed are dropped.
+            excluded_media_types: Media types that are never compressed.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.zstd_level = zstd_level
+        self.chunk_size = chunk_size
+        self.encodings = tuple(e for e in encodings if is_encoding_available(e))
+        self.excluded_media_types = frozenset(t.lower() for t in excluded_media_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressingSend(self, encoding, send))
+
+
+class _CompressingSend:
+    """Per-response ``send`` wrapper applying one content coding."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            middleware: Middleware holding the compression settings.
+            encoding: Negotiated content coding.
+            send: The server's ``send``.
+        """
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[Compressor] = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            self.passthrough = not self._is_compressible(message)
+            if self.passthrough:
+                await self._send_start()
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send_start()
+                await self.send(message)
+                return
+            self.compressor = create_compressor(
+                self.encoding, self.middleware.level, self.middleware.zstd_level
+            )
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith(WEAK_ETAG_PREFIX):
+                # The encoded bytes differ, so a strong tag no longer applies
+                headers["ETag"] = WEAK_ETAG_PREFIX + etag
+            if not more_body and len(body) <= self.middleware.chunk_size:
+                # Small enough to compress whole and keep a Content-Length
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send_start()
+                await self.send({**message, "body": body})
+                return
+            del headers["Content-Length"]
+            await self._send_start()
+
+        await self._send_compressed(body, more_body)
+
+    def _is_compressible(self, message: Message) -> bool:
+        """Decide from the response head whether the body may be compressed.
+
+        Args:
+            message: The ``http.response.start`` message.
+
+        Returns:
+            Whether the response is a full, not yet encoded, non-excluded body.
+        """
+        status = message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0]
+        return media_type.strip().lower() not in self.middleware.excluded_media_types
+
+    async def _send_start(self) -> None:
+        """Send the held response start message, once."""
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self.send(message)
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        """Compress one body message slice by slice and send the output.
+
+        Args:
+            body: Body bytes of the message.
+            more_body: Whether further body messages follow.
+        """
+        chunk_size = self.middleware.chunk_size
+        view = memoryview(body)
+        for offset in range(0, len(view), chunk_size):
+            chunk = view[offset : offset + chunk_size]
+            if len(view) > chunk_size:
+                output = await asyncio.to_thread(self.compressor.compress, chunk)
+            else:
+                output = self.compressor.compress(chunk)
+            if output:
+                await self.send(
+                    {"type": "http.response.body", "body": output, "more_body": True}
+                )
+
+        if more_body:
+            tail = self.compressor.compress(b"", flush=True)
+        else:
+            tail = self.compressor.finish()
+        await self.send(
+            {"type": "http.response.body", "body": tail, "more_body": more_body}
+        )
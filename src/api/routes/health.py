@@ -6,11 +6,15 @@ from datetime import datetime, timezone
 from typing import Dict, Any
 
 # Third-party
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from loguru import logger
 
+# Local Application
+from src.api.json_io import BackendJSONRoute
+from src.services.temporal_service import get_client_manager, get_read_flights
+
 # ================================== Router Setup ============================= #
-router = APIRouter(prefix="/health", tags=["health"])
+router = APIRouter(prefix="/health", tags=["health"], route_class=BackendJSONRoute)
 
 
 # ================================== Routes =================================== #
@@ -67,6 +71,99 @@ async def detailed_health_check() -> Dict[str, Any]:
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
 
+@router.get("/temporal")
+async def temporal_client_stats(request: Request) -> Dict[str, Any]:
+    """Temporal client pool and embedded worker diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Pool settings, per-connection in-flight request counters and the
+        embedded worker's state.
+    """
+    return {
+        **get_client_manager().stats(),
+        "embedded_worker": request.app.state.embedded_worker.stats(),
+    }
+
+
+@router.get("/caches")
+async def cache_stats(request: Request) -> Dict[str, Any]:
+    """Workflow read cache diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Counters for the status and result caches and for the shared
+        single-flight Temporal reads.
+    """
+    return {
+        "status": request.app.state.status_cache.stats(),
+        "result": request.app.state.result_cache.stats(),
+        "reads": get_read_flights().stats(),
+    }
+
+
+@router.get("/rate-limit")
+async def rate_limit_stats(request: Request) -> Dict[str, Any]:
+    """Rate limiter diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Limiter settings and counters, or ``enabled: false``.
+    """
+    limiter = request.app.state.rate_limiter
+    if limiter is None:
+        return {"enabled": False}
+    return {"enabled": True, **limiter.stats()}
+
+
+@router.get("/admission")
+async def admission_stats(request: Request) -> Dict[str, Any]:
+    """Admission controller diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Current concurrency limit, in-flight count and counters.
+    """
+    return request.app.state.admission.stats()
+
+
+@router.get("/task-queue")
+async def task_queue_stats(request: Request) -> Dict[str, Any]:
+    """Task queue backlog diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        Latest backlog reading, thresholds and rejection counters.
+    """
+    return request.app.state.workflow_starter.backlog_monitor.stats()
+
+
+@router.get("/loops")
+async def loop_stats(request: Request) -> Dict[str, Any]:
+    """Event loop lag and embedded worker diagnostics.
+
+    Args:
+        request: Incoming request, used to reach the application state.
+
+    Returns:
+        API loop lag and the embedded worker's mode, state and loop lag.
+    """
+    return {
+        "api": request.app.state.api_loop_lag.stats(),
+        "worker": request.app.state.embedded_worker.stats(),
+    }
+
+
 # ================================== Helper Functions ========================= #
 async def _check_temporal_connection() -> Dict[str, str]:
     """Check Temporal server connection.
@@ -0,0 +1,67 @@
+"""User-scoped API routes."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from typing import Optional
+
+# Third-party
+from fastapi import APIRouter, Depends, HTTPException, Query
+from omegaconf import DictConfig
+from temporalio.client import Client
+from loguru import logger
+
+# Local Application
+from src.api.dependencies import admit_request, get_app_config
+from src.api.json_io import BackendJSONRoute
+from src.models.workflow import WorkflowListResponse
+from src.services.temporal_service import get_temporal_client
+from src.services.visibility import build_list_filter, list_workflow_page
+
+# ================================== Router Setup ============================= #
+router = APIRouter(prefix="/users", tags=["users"], route_class=BackendJSONRoute)
+
+
+# ================================== Routes =================================== #
+@router.get(
+    "/{user_id}/workflows",
+    response_model=WorkflowListResponse,
+    dependencies=[Depends(admit_request)],
+)
+async def list_user_workflows(
+    user_id: str,
+    workflow_type: Optional[str] = Query(None, description="Workflow type"),
+    status: Optional[str] = Query(None, description="Execution status, e.g. RUNNING"),
+    page_size: Optional[int] = Query(
+        None, ge=1, description="Page size, capped by server config"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    client: Client = Depends(get_temporal_client),
+    cfg: DictConfig = Depends(get_app_config),
+) -> WorkflowListResponse:
+    """List a user's workflows via the ``UserId`` search attribute.
+
+    Args:
+        user_id: ID of the user who started the workflows.
+        workflow_type: Workflow type to match.
+        status: Execution status to match.
+        page_size: Number of workflows per page.
+        cursor: Cursor returned with the previous page.
+        client: Temporal client instance.
+        cfg: Hydra configuration object.
+
+    Returns:
+        One page of the user's workflows and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the filters or cursor are invalid, or listing fails.
+    """
+    try:
+        query = build_list_filter(
+            workflow_type=workflow_type, status=status, user_id=user_id
+        )
+        return await list_workflow_page(client, cfg, query, page_size, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to list workflows: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to list workflows: {e}")
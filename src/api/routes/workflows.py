@@ -2,40 +2,176 @@
 
 # ================================== Imports ================================== #
 # Standard Library
+import asyncio
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 # Third-party
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from temporalio.client import Client
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from omegaconf import DictConfig, OmegaConf
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+from temporalio.client import (
+    Client,
+    WithStartWorkflowOperation,
+    WorkflowHandle,
+    WorkflowUpdateFailedError,
+)
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
 from loguru import logger
 
 # Local Application
+from src.api.dependencies import (
+    admit_request,
+    get_app_config,
+    get_bulk_jobs,
+    get_event_hub,
+    get_result_cache,
+    get_status_cache,
+    get_workflow_starter,
+)
+from src.api.etag import content_etag, etag_matches, not_modified, status_etag
+from src.api.json_io import BackendJSONResponse, BackendJSONRoute
 from src.models.workflow import (
+    BatchOperationItem,
+    BatchOperationJob,
+    BatchSignalRequest,
+    BatchStartResponse,
+    BulkStopRequest,
+    BatchStartResult,
+    BulkStatusItem,
+    BulkStatusRequest,
+    SignalWithStartRequest,
+    StreamStartAck,
+    WorkflowListResponse,
     WorkflowRequest,
     WorkflowResponse,
     WorkflowStatus,
     ErrorResponse,
 )
-from src.services.temporal_service import get_temporal_client
+from src.services.backlog import QueueSaturatedError
+from src.services.batch_operations import (
+    OPERATION_CANCEL,
+    OPERATION_SIGNAL,
+    OPERATION_TERMINATE,
+    BulkJob,
+    BulkJobRegistry,
+    build_cancel_operation,
+    build_signal_operation,
+    build_terminate_operation,
+    describe_server_batch_operation,
+    iter_target_ids,
+    run_bounded,
+    start_server_batch_operation,
+)
+from src.utils import json_backend
+from src.services.temporal_service import (
+    await_workflow_result,
+    describe_workflow,
+    get_temporal_client,
+)
+from src.services.visibility import (
+    build_list_filter,
+    build_workflow_id_filter,
+    list_workflow_page,
+)
+from src.services.workflow_cache import (
+    CachedResult,
+    WorkflowResultCache,
+    WorkflowStatusCache,
+)
+from src.services.workflow_events import EVENT_END, WorkflowEventHub
+from src.services.workflow_starter import (
+    STATUS_STARTED,
+    WORKFLOW_SIGNAL_NAME,
+    WorkflowStarter,
+)
+
+# ================================== Constants ================================ #
+DEFAULT_BATCH_MAX_CONCURRENCY = 50
+DEFAULT_BATCH_MAX_ITEMS = 1000
+DEFAULT_STREAM_MAX_CONCURRENCY = 50
+DEFAULT_STREAM_MAX_LINE_BYTES = 1024 * 1024
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_RESULT_MAX_WAIT_SECONDS = 60.0
+DEFAULT_RESULT_RETRY_AFTER_SECONDS = 5
+DEFAULT_EXECUTE_MAX_WAIT_SECONDS = 30.0
+START_ACK_SETTLE_SECONDS = 0.1
+CLIENT_CLOSED_REQUEST = 499
+DEFAULT_EVENTS_KEEPALIVE_SECONDS = 15.0
+SSE_MEDIA_TYPE = "text/event-stream"
+DEFAULT_BULK_STATUS_MAX_IDS = 10_000
+DEFAULT_BULK_STATUS_QUERY_CHUNK_SIZE = 100
+DEFAULT_BULK_STATUS_MAX_CONCURRENCY = 20
+DEFAULT_BULK_OPERATION_MAX_IDS = 100_000
+DEFAULT_BULK_OPERATION_MAX_CONCURRENCY = 50
+DEFAULT_BULK_OPERATION_MAX_OPS_PER_SECOND = 0.0
+
+
+# ================================== Classes ================================== #
+class DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body iterator reads the request body itself.
+
+    ``StreamingResponse`` may listen for disconnects by draining ``receive``,
+    which would swallow request body chunks the iterator is still reading.
+    Disconnects surface instead as ``ClientDisconnect`` from
+    ``Request.stream()``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
 
 # ================================== Router Setup ============================= #
-router = APIRouter(prefix="/workflows", tags=["workflows"])
+router = APIRouter(
+    prefix="/workflows", tags=["workflows"], route_class=BackendJSONRoute
+)
 
 
 # ================================== Routes =================================== #
-@router.post("/start", response_model=WorkflowResponse)
+@router.post(
+    "/start",
+    response_model=WorkflowResponse,
+    status_code=201,
+    dependencies=[Depends(admit_request)],
+)
 async def start_workflow(
     request: WorkflowRequest,
+    response: Response,
     background_tasks: BackgroundTasks,
     client: Client = Depends(get_temporal_client),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
 ) -> WorkflowResponse:
     """Start a new workflow instance.
 
+    Requests carrying an ``idempotency_key`` map to a deterministic workflow
+    ID, so client retries start at most one workflow. A new run is answered
+    with ``201``; a key that maps back to an existing run gets ``200`` and
+    status ``ALREADY_STARTED``. While the task queue is backlogged, starts
+    below its priority threshold are rejected with ``503``.
+
     Args:
         request: Workflow start request data.
+        response: Response whose status code is lowered to 200 for reuse.
         background_tasks: FastAPI background tasks.
         client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
 
     Returns:
         Workflow response with workflow ID and status.
@@ -48,26 +184,24 @@ async def start_workflow(
             f"Starting workflow: {request.workflow_type} for user {request.user_id}"
         )
 
-        # Start workflow asynchronously
-        workflow_handle = await client.start_workflow(
-            workflow_type=request.workflow_type,
-            args=[request.input_data],
-            id=f"{request.workflow_type}_{request.user_id}_{datetime.now().timestamp()}",
-            task_queue="workflow-task-queue",
-        )
+        started = await starter.start(client, request)
+        if started.status != STATUS_STARTED:
+            response.status_code = 200
 
         # Add cleanup task to background
         background_tasks.add_task(
-            _log_workflow_start, workflow_handle.id, request.workflow_type
+            _log_workflow_start, started.workflow_id, request.workflow_type
         )
 
-        return WorkflowResponse(
-            workflow_id=workflow_handle.id,
-            status="STARTED",
-            message="Workflow started successfully",
-            created_at=datetime.now().isoformat(),
-        )
+        return started
 
+    except QueueSaturatedError as e:
+        logger.warning(f"Rejected {request.priority} priority start: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
     except Exception as e:
         logger.error(f"Failed to start workflow: {e}")
         raise HTTPException(
@@ -75,39 +209,766 @@ async def start_workflow(
         )
 
 
-@router.get("/{workflow_id}/status", response_model=WorkflowResponse)
+@router.post("/start:batch", response_model=BatchStartResponse)
+async def start_workflow_batch(
+    requests: List[WorkflowRequest],
+    client: Client = Depends(get_temporal_client),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
+    cfg: DictConfig = Depends(get_app_config),
+) -> BatchStartResponse:
+    """Start many workflow instances with bounded concurrency.
+
+    Every item is started independently, so a failure of one item does not
+    abort the rest of the batch.
+
+    Args:
+        requests: Workflow start requests to submit.
+        client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Batch response with one result per item, in request order.
+
+    Raises:
+        HTTPException: If the batch exceeds the configured maximum size.
+    """
+    max_items = OmegaConf.select(
+        cfg, "api.batch.max_items", default=DEFAULT_BATCH_MAX_ITEMS
+    )
+    if len(requests) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(requests)} items exceeds the limit of {max_items}",
+        )
+
+    max_concurrency = OmegaConf.select(
+        cfg, "api.batch.max_concurrency", default=DEFAULT_BATCH_MAX_CONCURRENCY
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _start_item(index: int, request: WorkflowRequest) -> BatchStartResult:
+        async with semaphore:
+            try:
+                response = await starter.start(client, request)
+                return BatchStartResult(index=index, success=True, response=response)
+            except Exception as e:
+                logger.error(f"Failed to start batch item {index}: {e}")
+                return BatchStartResult(
+                    index=index,
+                    success=False,
+                    error=ErrorResponse(
+                        error="START_FAILED",
+                        message=f"Failed to start workflow: {str(e)}",
+                        details={"workflow_type": request.workflow_type},
+                    ),
+                )
+
+    logger.info(
+        f"Starting batch of {len(requests)} workflows "
+        f"(max concurrency {max_concurrency})"
+    )
+    results = await asyncio.gather(
+        *(_start_item(index, request) for index, request in enumerate(requests))
+    )
+    succeeded = sum(1 for result in results if result.success)
+
+    return BatchStartResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+@router.post("/start:stream", response_class=DuplexStreamingResponse)
+async def start_workflow_stream(
+    http_request: Request,
+    client: Client = Depends(get_temporal_client),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
+    cfg: DictConfig = Depends(get_app_config),
+) -> DuplexStreamingResponse:
+    """Start workflows from a streamed NDJSON body.
+
+    Each line of the body is a ``WorkflowRequest``. Lines are parsed and
+    submitted as they arrive, with at most ``api.stream.max_concurrency``
+    starts in flight, and each line is acknowledged in order on a streamed
+    NDJSON response.
+
+    Args:
+        http_request: Incoming request whose body is read incrementally.
+        client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Streaming NDJSON response with one ``StreamStartAck`` per line.
+
+    Raises:
+        HTTPException: If the request body is not NDJSON.
+    """
+    content_type = http_request.headers.get("content-type", "")
+    if not content_type.startswith(NDJSON_MEDIA_TYPE):
+        raise HTTPException(
+            status_code=415, detail=f"Expected {NDJSON_MEDIA_TYPE} request body"
+        )
+
+    max_concurrency = OmegaConf.select(
+        cfg, "api.stream.max_concurrency", default=DEFAULT_STREAM_MAX_CONCURRENCY
+    )
+    max_line_bytes = OmegaConf.select(
+        cfg, "api.stream.max_line_bytes", default=DEFAULT_STREAM_MAX_LINE_BYTES
+    )
+
+    async def _acknowledgements() -> AsyncIterator[str]:
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            async for line_number, line in _iter_ndjson_lines(
+                http_request.stream(), max_line_bytes
+            ):
+                pending.append(
+                    asyncio.create_task(
+                        _start_stream_line(client, starter, line_number, line)
+                    )
+                )
+                # Acknowledge the oldest line once the in-flight window is full
+                if len(pending) >= max_concurrency:
+                    ack = await pending.popleft()
+                    yield ack.model_dump_json() + "\n"
+
+            while pending:
+                ack = await pending.popleft()
+                yield ack.model_dump_json() + "\n"
+        finally:
+            for task in pending:
+                task.cancel()
+
+    return DuplexStreamingResponse(_acknowledgements(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "", response_model=WorkflowListResponse, dependencies=[Depends(admit_request)]
+)
+async def list_workflows(
+    workflow_type: Optional[str] = Query(None, description="Workflow type"),
+    status: Optional[str] = Query(None, description="Execution status, e.g. RUNNING"),
+    user_id: Optional[str] = Query(None, description="Starting user"),
+    started_after: Optional[datetime] = Query(
+        None, description="Inclusive lower bound on start time"
+    ),
+    started_before: Optional[datetime] = Query(
+        None, description="Exclusive upper bound on start time"
+    ),
+    page_size: Optional[int] = Query(
+        None, ge=1, description="Page size, capped by server config"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    client: Client = Depends(get_temporal_client),
+    cfg: DictConfig = Depends(get_app_config),
+) -> WorkflowListResponse:
+    """List workflows through Temporal visibility, one page at a time.
+
+    Pages are addressed by opaque cursors wrapping Temporal's page token,
+    so every page costs the same no matter how deep into the listing it is.
+
+    Args:
+        workflow_type: Workflow type to match.
+        status: Execution status to match.
+        user_id: ID of the user who started the workflows.
+        started_after: Inclusive lower bound on start time.
+        started_before: Exclusive upper bound on start time.
+        page_size: Number of workflows per page.
+        cursor: Cursor returned with the previous page.
+        client: Temporal client instance.
+        cfg: Hydra configuration object.
+
+    Returns:
+        One page of workflows and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the filters or cursor are invalid, or listing fails.
+    """
+    try:
+        query = build_list_filter(
+            workflow_type=workflow_type,
+            status=status,
+            user_id=user_id,
+            started_after=started_after,
+            started_before=started_before,
+        )
+        return await list_workflow_page(client, cfg, query, page_size, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to list workflows: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to list workflows: {e}")
+
+
+@router.post("/status:bulk", response_class=StreamingResponse)
+async def get_workflow_status_bulk(
+    request: BulkStatusRequest,
+    client: Client = Depends(get_temporal_client),
+    cfg: DictConfig = Depends(get_app_config),
+) -> StreamingResponse:
+    """Look up the status of many workflows at once.
+
+    IDs are resolved in chunks with one visibility query per chunk; IDs the
+    visibility store does not return yet are described individually. All
+    upstream calls share one concurrency limit, and results stream back as
+    NDJSON as soon as each chunk or describe completes.
+
+    Args:
+        request: Workflow IDs to look up.
+        client: Temporal client instance.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Streaming NDJSON response with one ``BulkStatusItem`` per unique ID.
+
+    Raises:
+        HTTPException: If more IDs are requested than the configured limit.
+    """
+    workflow_ids = list(dict.fromkeys(request.workflow_ids))
+    max_ids = OmegaConf.select(
+        cfg, "api.bulk_status.max_ids", default=DEFAULT_BULK_STATUS_MAX_IDS
+    )
+    if len(workflow_ids) > max_ids:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Lookup of {len(workflow_ids)} IDs exceeds the limit of {max_ids}",
+        )
+
+    chunk_size = OmegaConf.select(
+        cfg,
+        "api.bulk_status.query_chunk_size",
+        default=DEFAULT_BULK_STATUS_QUERY_CHUNK_SIZE,
+    )
+    semaphore = asyncio.Semaphore(
+        OmegaConf.select(
+            cfg,
+            "api.bulk_status.max_concurrency",
+            default=DEFAULT_BULK_STATUS_MAX_CONCURRENCY,
+        )
+    )
+
+    async def _query_chunk(chunk: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+        async with semaphore:
+            return chunk, await _list_latest_executions(client, chunk)
+
+    async def _describe(workflow_id: str) -> BulkStatusItem:
+        async with semaphore:
+            try:
+                description = await describe_workflow(client, workflow_id)
+            except Exception as e:
+                logger.debug(f"Bulk status describe failed for {workflow_id}: {e}")
+                return BulkStatusItem(
+                    workflow_id=workflow_id, found=False, source="describe"
+                )
+            return _bulk_status_item(description, "describe")
+
+    async def _lines() -> AsyncIterator[str]:
+        tasks = [
+            asyncio.ensure_future(_query_chunk(workflow_ids[i : i + chunk_size]))
+            for i in range(0, len(workflow_ids), chunk_size)
+        ]
+        try:
+            stragglers: List[str] = []
+            for next_chunk in asyncio.as_completed(tasks):
+                chunk, executions = await next_chunk
+                for workflow_id in chunk:
+                    execution = executions.get(workflow_id)
+                    if execution is None:
+                        stragglers.append(workflow_id)
+                    else:
+                        item = _bulk_status_item(execution, "visibility")
+                        yield item.model_dump_json() + "\n"
+
+            tasks = [
+                asyncio.ensure_future(_describe(workflow_id))
+                for workflow_id in stragglers
+            ]
+            for next_item in asyncio.as_completed(tasks):
+                item = await next_item
+                yield item.model_dump_json() + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/signal:batch", response_class=StreamingResponse)
+async def signal_workflows_batch(
+    request: BatchSignalRequest,
+    http_request: Request,
+    client: Client = Depends(get_temporal_client),
+    bulk_jobs: BulkJobRegistry = Depends(get_bulk_jobs),
+    cfg: DictConfig = Depends(get_app_config),
+) -> Response:
+    """Send one ``workflow_signal`` to many workflows.
+
+    Targets are an ID list or a visibility query. By default the API sends
+    the signals itself with bounded concurrency and streams one
+    ``BatchOperationItem`` per workflow as NDJSON. With ``server_side`` the
+    fan-out is delegated to a Temporal batch job instead and the job,
+    pollable at ``/batch-jobs/{job_id}``, is returned with ``202 Accepted``.
+
+    Args:
+        request: Targets, signal payload and delivery mode.
+        http_request: Incoming HTTP request, used to build the job URL.
+        client: Temporal client instance.
+        bulk_jobs: Bulk operation job registry.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Streaming NDJSON of per-workflow outcomes, or the batch job.
+
+    Raises:
+        HTTPException: If too many IDs are given or the batch job fails to
+            start.
+    """
+    _check_bulk_operation_size(request.workflow_ids, cfg)
+
+    if request.server_side:
+        try:
+            job_id = await start_server_batch_operation(
+                client,
+                request.reason,
+                workflow_ids=request.workflow_ids,
+                query=request.query,
+                max_operations_per_second=_bulk_operation_rate(cfg),
+                signal_operation=await build_signal_operation(
+                    client, WORKFLOW_SIGNAL_NAME, request.signal_data
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Failed to start batch signal operation: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to start batch signal operation: {str(e)}",
+            )
+        return _job_accepted(
+            http_request, bulk_jobs.record_server_job(job_id, OPERATION_SIGNAL)
+        )
+
+    async def _signal(workflow_id: str) -> BatchOperationItem:
+        try:
+            await client.get_workflow_handle(workflow_id).signal(
+                WORKFLOW_SIGNAL_NAME, request.signal_data
+            )
+        except Exception as e:
+            logger.debug(f"Batch signal to {workflow_id} failed: {e}")
+            return BatchOperationItem(
+                workflow_id=workflow_id, success=False, error=str(e)
+            )
+        return BatchOperationItem(workflow_id=workflow_id, success=True)
+
+    async def _lines() -> AsyncIterator[str]:
+        items = run_bounded(
+            iter_target_ids(client, request.workflow_ids, request.query),
+            _signal,
+            OmegaConf.select(
+                cfg,
+                "api.bulk_operations.max_concurrency",
+                default=DEFAULT_BULK_OPERATION_MAX_CONCURRENCY,
+            ),
+        )
+        try:
+            async for item in items:
+                yield item.model_dump_json() + "\n"
+        except Exception as e:
+            # Listing the query's workflows failed part way through
+            logger.error(f"Batch signal stopped: {e}")
+            yield ErrorResponse(
+                error="BATCH_ABORTED", message=str(e)
+            ).model_dump_json() + "\n"
+        finally:
+            await items.aclose()
+
+    return StreamingResponse(_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/cancel:batch", status_code=202, response_model=BatchOperationJob)
+async def cancel_workflows_batch(
+    request: BulkStopRequest,
+    http_request: Request,
+    client: Client = Depends(get_temporal_client),
+    bulk_jobs: BulkJobRegistry = Depends(get_bulk_jobs),
+    cfg: DictConfig = Depends(get_app_config),
+) -> Response:
+    """Request cancellation of many workflows.
+
+    Targets are an ID list or a visibility query. See ``_start_bulk_stop``
+    for how the work is carried out.
+
+    Args:
+        request: Targets, reason and execution mode.
+        http_request: Incoming HTTP request, used to build the job URL.
+        client: Temporal client instance.
+        bulk_jobs: Bulk operation job registry.
+        cfg: Hydra configuration object.
+
+    Returns:
+        ``202 Accepted`` with the job, pollable at ``/batch-jobs/{job_id}``.
+
+    Raises:
+        HTTPException: If too many IDs are given or a required batch job
+            fails to start.
+    """
+    return await _start_bulk_stop(
+        OPERATION_CANCEL,
+        request,
+        http_request,
+        client,
+        bulk_jobs,
+        cfg,
+        server_operation={"cancellation_operation": build_cancel_operation(client)},
+        stop=lambda workflow_handle: workflow_handle.cancel(),
+    )
+
+
+@router.post("/terminate:batch", status_code=202, response_model=BatchOperationJob)
+async def terminate_workflows_batch(
+    request: BulkStopRequest,
+    http_request: Request,
+    client: Client = Depends(get_temporal_client),
+    bulk_jobs: BulkJobRegistry = Depends(get_bulk_jobs),
+    cfg: DictConfig = Depends(get_app_config),
+) -> Response:
+    """Terminate many workflows immediately, recording ``reason``.
+
+    Targets are an ID list or a visibility query. See ``_start_bulk_stop``
+    for how the work is carried out.
+
+    Args:
+        request: Targets, reason and execution mode.
+        http_request: Incoming HTTP request, used to build the job URL.
+        client: Temporal client instance.
+        bulk_jobs: Bulk operation job registry.
+        cfg: Hydra configuration object.
+
+    Returns:
+        ``202 Accepted`` with the job, pollable at ``/batch-jobs/{job_id}``.
+
+    Raises:
+        HTTPException: If too many IDs are given or a required batch job
+            fails to start.
+    """
+    return await _start_bulk_stop(
+        OPERATION_TERMINATE,
+        request,
+        http_request,
+        client,
+        bulk_jobs,
+        cfg,
+        server_operation={"termination_operation": build_terminate_operation(client)},
+        stop=lambda workflow_handle: workflow_handle.terminate(reason=request.reason),
+    )
+
+
+@router.get(
+    "/{workflow_id}/status",
+    response_model=WorkflowResponse,
+    dependencies=[Depends(admit_request)],
+)
 async def get_workflow_status(
-    workflow_id: str, client: Client = Depends(get_temporal_client)
+    workflow_id: str,
+    http_request: Request,
+    response: Response,
+    client: Client = Depends(get_temporal_client),
+    status_cache: WorkflowStatusCache = Depends(get_status_cache),
 ) -> WorkflowResponse:
     """Get the current status of a workflow.
 
+    Statuses are served from a short-lived cache, and concurrent lookups of
+    the same workflow share one describe call. Responses carry an ``ETag``
+    of the run ID and status; a matching ``If-None-Match`` gets a bodyless
+    ``304 Not Modified``.
+
     Args:
         workflow_id: Unique identifier for the workflow.
+        http_request: Incoming request, checked for ``If-None-Match``.
+        response: Response whose headers receive the ``ETag``.
         client: Temporal client instance.
+        status_cache: Workflow status cache.
 
     Returns:
-        Workflow response with current status.
+        Workflow response with current status, or a 304 response if the
+        client's copy is current.
 
     Raises:
-        HTTPException: If workflow is not found.
+        HTTPException: If workflow is not found (404) or Temporal fails (500).
     """
-    try:
-        workflow_handle = client.get_workflow_handle(workflow_id)
-        status = await workflow_handle.describe()
+
+    async def _describe() -> WorkflowResponse:
+        status = await describe_workflow(client, workflow_id)
 
         return WorkflowResponse(
             workflow_id=workflow_id,
             status=status.status.name,
             message=f"Workflow is {status.status.name.lower()}",
             created_at=status.start_time.isoformat(),
+            run_id=status.run_id,
+        )
+
+    try:
+        workflow = await status_cache.get_or_load(workflow_id, _describe)
+
+    except RPCError as e:
+        if e.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPException(
+                status_code=404, detail=f"Workflow {workflow_id} not found"
+            )
+        # Surface backend failures as 5xx so admission control backs off
+        logger.error(f"Failed to get workflow status: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get workflow status: {str(e)}"
         )
 
     except Exception as e:
         logger.error(f"Failed to get workflow status: {e}")
-        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get workflow status: {str(e)}"
+        )
+
+    etag = status_etag(workflow)
+    if etag_matches(http_request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return workflow
+
+
+@router.get("/{workflow_id}/events", response_class=StreamingResponse)
+async def stream_workflow_events(
+    workflow_id: str,
+    client: Client = Depends(get_temporal_client),
+    event_hub: WorkflowEventHub = Depends(get_event_hub),
+    cfg: DictConfig = Depends(get_app_config),
+) -> StreamingResponse:
+    """Stream a workflow's status transitions and final result as SSE.
+
+    Every subscriber of the same workflow shares one upstream watcher, so
+    the cost to Temporal does not grow with the number of viewers.
+
+    Args:
+        workflow_id: Unique identifier for the workflow.
+        client: Temporal client instance.
+        event_hub: Workflow event hub.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Server-Sent Events stream that ends once the workflow closes.
+    """
+    keepalive = OmegaConf.select(
+        cfg, "api.events.keepalive_seconds", default=DEFAULT_EVENTS_KEEPALIVE_SECONDS
+    )
+
+    async def _events() -> AsyncIterator[str]:
+        async with event_hub.subscribe(workflow_id, client) as queue:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except TimeoutError:
+                    # Comment lines keep idle proxies from closing the stream
+                    yield ": keep-alive\n\n"
+                    continue
+
+                data = json_backend.dumps(event.data).decode("utf-8")
+                yield f"event: {event.event}\ndata: {data}\n\n"
+                if event.event == EVENT_END:
+                    return
+
+    return StreamingResponse(
+        _events(),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/signal-with-start",
+    response_model=WorkflowResponse,
+    dependencies=[Depends(admit_request)],
+)
+async def signal_with_start_workflow(
+    request: SignalWithStartRequest,
+    client: Client = Depends(get_temporal_client),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
+    status_cache: WorkflowStatusCache = Depends(get_status_cache),
+    result_cache: WorkflowResultCache = Depends(get_result_cache),
+) -> WorkflowResponse:
+    """Signal a workflow, starting it first if it is not running.
+
+    Replaces a ``/start`` followed by ``/{workflow_id}/signal`` with one
+    atomic Temporal call, so a workflow can neither be started twice nor
+    miss the signal in between. The read caches are keyed by workflow ID,
+    so when the call starts a new run under a previously closed ID, the
+    previous run's cached status and result are dropped.
+
+    Args:
+        request: Signal-with-start request data.
+        client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
+        status_cache: Workflow status cache.
+        result_cache: Workflow result cache.
+
+    Returns:
+        Workflow response with the workflow and run IDs.
+
+    Raises:
+        HTTPException: If the task queue is saturated or the call fails.
+    """
+    try:
+        response, started = await starter.signal_with_start(client, request)
+        if started:
+            status_cache.invalidate(response.workflow_id)
+            await result_cache.invalidate(response.workflow_id)
+        return response
+
+    except QueueSaturatedError as e:
+        logger.warning(f"Rejected {request.priority} priority signal-with-start: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
+    except Exception as e:
+        logger.error(f"Failed to signal-with-start workflow: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to signal-with-start workflow: {str(e)}"
+        )
+
+
+@router.post("/execute", dependencies=[Depends(admit_request)])
+async def execute_workflow(
+    request: WorkflowRequest,
+    http_request: Request,
+    wait: Optional[float] = Query(
+        None,
+        ge=0,
+        description="Seconds to wait for the result, capped by server config",
+    ),
+    client: Client = Depends(get_temporal_client),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
+    result_cache: WorkflowResultCache = Depends(get_result_cache),
+    cfg: DictConfig = Depends(get_app_config),
+) -> Response:
+    """Start a workflow and return its result in the same call.
+
+    Replaces ``/start`` followed by polling ``/{workflow_id}/status`` and
+    ``/{workflow_id}/result`` with one Temporal update-with-start, for
+    workflows that are expected to finish quickly. The workflow's update
+    validator can reject the request before any work is recorded. If the
+    result is not ready by the deadline but the start was acknowledged, the
+    workflow keeps running and a ``202 Accepted`` pointing at its result is
+    returned instead; if even the start was not acknowledged, ``504``.
+    A retried keyed request is answered with the result of the run its key
+    already started, from the result cache or from Temporal.
+
+    Args:
+        request: Workflow start request data.
+        http_request: Incoming request, watched for client disconnects.
+        wait: Seconds to wait for the result; defaults to the server cap.
+        client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
+        result_cache: Workflow result cache.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Workflow result data, or a 202 response if it is not ready yet.
+
+    Raises:
+        HTTPException: If the request is rejected or the call fails.
+    """
+    max_wait = OmegaConf.select(
+        cfg, "api.execute.max_wait_seconds", default=DEFAULT_EXECUTE_MAX_WAIT_SECONDS
+    )
+    timeout = max_wait if wait is None else min(wait, max_wait)
+    workflow_id = starter.build_workflow_id(request)
+
+    if request.idempotency_key is not None:
+        cached = await result_cache.get(workflow_id)
+        if cached is not None:
+            return _cached_result_response(cached)
 
+    start_operation = starter.execute_operation(request, workflow_id)
+    call = asyncio.ensure_future(starter.execute(client, request, start_operation))
+    try:
+        result = await _await_unless_disconnected(http_request, call, timeout)
+        return _cached_result_response(
+            await _cache_result(workflow_id, result, result_cache)
+        )
 
-@router.post("/{workflow_id}/signal")
+    except TimeoutError:
+        if not await _start_acknowledged(call, start_operation):
+            raise HTTPException(
+                status_code=504,
+                detail=(
+                    f"Start of workflow {workflow_id} was not acknowledged within "
+                    f"{timeout} seconds; it may not have started"
+                ),
+            )
+        retry_after = OmegaConf.select(
+            cfg,
+            "api.result.retry_after_seconds",
+            default=DEFAULT_RESULT_RETRY_AFTER_SECONDS,
+        )
+        return BackendJSONResponse(
+            status_code=202,
+            content={
+                "workflow_id": workflow_id,
+                "status": "RUNNING",
+                "message": f"Workflow did not complete within {timeout} seconds",
+            },
+            headers={
+                "Location": str(
+                    http_request.url_for("get_workflow_result", workflow_id=workflow_id)
+                ),
+                "Retry-After": str(retry_after),
+            },
+        )
+
+    except ClientDisconnect:
+        logger.info(f"Client disconnected while executing {workflow_id}")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    except QueueSaturatedError as e:
+        logger.warning(f"Rejected {request.priority} priority execution: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
+    except WorkflowUpdateFailedError as e:
+        # Raised for both a rejected update and a failed update handler
+        detail = str(e.cause) if e.cause is not None else str(e)
+        logger.info(f"Execution of {workflow_id} was rejected: {detail}")
+        raise HTTPException(status_code=422, detail=detail)
+    except WorkflowAlreadyStartedError:
+        # The key's run has closed and the reuse policy won't start another,
+        # so answer with the closed run's result if it has one
+        try:
+            result = await await_workflow_result(client, workflow_id)
+        except Exception as e:
+            logger.info(f"No result for closed workflow {workflow_id}: {e}")
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    f"Workflow {workflow_id} already ran for this idempotency key "
+                    f"and has no result: {str(e)}"
+                ),
+            )
+        return _cached_result_response(
+            await _cache_result(workflow_id, result, result_cache)
+        )
+    except Exception as e:
+        logger.error(f"Failed to execute workflow: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to execute workflow: {str(e)}"
+        )
+
+
+@router.post("/{workflow_id}/signal", dependencies=[Depends(admit_request)])
 async def signal_workflow(
     workflow_id: str,
     signal_data: Dict[str, Any],
@@ -128,7 +989,7 @@ async def signal_workflow(
     """
     try:
         workflow_handle = client.get_workflow_handle(workflow_id)
-        await workflow_handle.signal("workflow_signal", signal_data)
+        await workflow_handle.signal(WORKFLOW_SIGNAL_NAME, signal_data)
 
         return {"message": "Signal sent successfully"}
 
@@ -139,25 +1000,81 @@ async def signal_workflow(
 
 @router.get("/{workflow_id}/result")
 async def get_workflow_result(
-    workflow_id: str, client: Client = Depends(get_temporal_client)
-) -> Dict[str, Any]:
+    workflow_id: str,
+    http_request: Request,
+    wait: Optional[float] = Query(
+        None,
+        ge=0,
+        description="Seconds to wait for completion, capped by server config",
+    ),
+    client: Client = Depends(get_temporal_client),
+    result_cache: WorkflowResultCache = Depends(get_result_cache),
+    cfg: DictConfig = Depends(get_app_config),
+) -> Response:
     """Get the result of a completed workflow.
 
+    Completed results never change, so their serialized bodies are cached
+    and served without contacting Temporal or decoding payloads again.
+    Concurrent requests for a result that is not cached yet share one
+    long poll. Responses carry an ``ETag`` of the body's hash, computed
+    once when the body is cached; a matching ``If-None-Match`` gets a
+    bodyless ``304 Not Modified``.
+    If the workflow does not complete within the wait deadline, a
+    ``202 Accepted`` with a ``Retry-After`` hint is returned instead, and the
+    wait is abandoned early if the client disconnects.
+
     Args:
         workflow_id: Unique identifier for the workflow.
+        http_request: Incoming request, checked for ``If-None-Match`` and
+            watched for client disconnects.
+        wait: Seconds to wait for completion; defaults to the server cap.
         client: Temporal client instance.
+        result_cache: Workflow result cache.
+        cfg: Hydra configuration object.
 
     Returns:
-        Workflow result data.
+        Workflow result data, a 304 response if the client's copy is
+        current, or a 202 response if it is not ready yet.
 
     Raises:
         HTTPException: If workflow result retrieval fails.
     """
+    max_wait = OmegaConf.select(
+        cfg, "api.result.max_wait_seconds", default=DEFAULT_RESULT_MAX_WAIT_SECONDS
+    )
+    timeout = max_wait if wait is None else min(wait, max_wait)
+
     try:
-        workflow_handle = client.get_workflow_handle(workflow_id)
-        result = await workflow_handle.result()
+        cached = await result_cache.get(workflow_id)
+        if cached is None:
+            result = await _await_unless_disconnected(
+                http_request, await_workflow_result(client, workflow_id), timeout
+            )
+            cached = await _cache_result(workflow_id, result, result_cache)
 
-        return {"workflow_id": workflow_id, "result": result, "status": "COMPLETED"}
+        if etag_matches(http_request.headers.get("if-none-match"), cached.etag):
+            return not_modified(cached.etag)
+        return _cached_result_response(cached)
+
+    except TimeoutError:
+        retry_after = OmegaConf.select(
+            cfg,
+            "api.result.retry_after_seconds",
+            default=DEFAULT_RESULT_RETRY_AFTER_SECONDS,
+        )
+        return BackendJSONResponse(
+            status_code=202,
+            content={
+                "workflow_id": workflow_id,
+                "status": "RUNNING",
+                "message": f"Workflow did not complete within {timeout} seconds",
+            },
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    except ClientDisconnect:
+        logger.info(f"Client disconnected while waiting for {workflow_id} result")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
 
     except Exception as e:
         logger.error(f"Failed to get workflow result: {e}")
@@ -166,7 +1083,445 @@ async def get_workflow_result(
         )
 
 
+@router.get("/batch-jobs/{job_id}", response_model=BatchOperationJob)
+async def get_batch_job(
+    job_id: str,
+    client: Client = Depends(get_temporal_client),
+    bulk_jobs: BulkJobRegistry = Depends(get_bulk_jobs),
+) -> BatchOperationJob:
+    """Get the state and progress of a bulk operation job.
+
+    API-side jobs are reported by the server process running them; jobs
+    run by Temporal are described from Temporal, so any replica can answer.
+
+    Args:
+        job_id: Job ID returned when the operation was accepted.
+        client: Temporal client instance.
+        bulk_jobs: Bulk operation job registry.
+
+    Returns:
+        Job state and progress.
+
+    Raises:
+        HTTPException: If the job is unknown.
+    """
+    job = bulk_jobs.get(job_id)
+    if job is not None and not job.server_side:
+        return job.to_model()
+
+    try:
+        return await describe_server_batch_operation(client, job_id)
+    except RPCError as e:
+        if job is not None:
+            logger.warning(f"Failed to describe batch job {job_id}: {e}")
+            return job.to_model()
+        if e.status in (RPCStatusCode.NOT_FOUND, RPCStatusCode.INVALID_ARGUMENT):
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        logger.error(f"Failed to describe batch job {job_id}: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to describe batch job: {str(e)}"
+        )
+
+
 # ================================== Helper Functions ========================= #
+async def _start_bulk_stop(
+    operation: str,
+    request: BulkStopRequest,
+    http_request: Request,
+    client: Client,
+    bulk_jobs: BulkJobRegistry,
+    cfg: DictConfig,
+    server_operation: Dict[str, Any],
+    stop: Callable[[WorkflowHandle], Awaitable[Any]],
+) -> Response:
+    """Start a bulk cancel or terminate as a pollable job.
+
+    Unless ``server_side`` is false, a Temporal batch job is started first.
+    If Temporal cannot run it, e.g. batch operations are disabled or the
+    namespace's concurrent batch job limit is reached, the API falls back
+    to calling each workflow itself with bounded concurrency in the
+    background, unless ``server_side`` is true. Stopping workflows removes
+    them from queries such as ``ExecutionStatus = 'Running'``, so a query's
+    matches are all listed before the first one is stopped.
+
+    Args:
+        operation: Operation name, ``cancel`` or ``terminate``.
+        request: Targets, reason and execution mode.
+        http_request: Incoming HTTP request, used to build the job URL.
+        client: Temporal client instance.
+        bulk_jobs: Bulk operation job registry.
+        cfg: Hydra configuration object.
+        server_operation: Operation field of the Temporal batch request.
+        stop: Per-workflow call used when fanning out from the API.
+
+    Returns:
+        ``202 Accepted`` with the job.
+
+    Raises:
+        HTTPException: If too many IDs are given or a required batch job
+            fails to start.
+    """
+    _check_bulk_operation_size(request.workflow_ids, cfg)
+
+    if request.server_side is not False:
+        try:
+            job_id = await start_server_batch_operation(
+                client,
+                request.reason,
+                workflow_ids=request.workflow_ids,
+                query=request.query,
+                max_operations_per_second=_bulk_operation_rate(cfg),
+                **server_operation,
+            )
+            return _job_accepted(
+                http_request, bulk_jobs.record_server_job(job_id, operation)
+            )
+        except RPCError as e:
+            if request.server_side:
+                logger.error(f"Failed to start batch {operation} operation: {e}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to start batch {operation} operation: {str(e)}",
+                )
+            logger.warning(
+                f"Batch {operation} operation unavailable, running it from the "
+                f"API: {e}"
+            )
+
+    async def _stop(workflow_id: str) -> BatchOperationItem:
+        try:
+            await stop(client.get_workflow_handle(workflow_id))
+        except Exception as e:
+            logger.debug(f"Bulk {operation} of {workflow_id} failed: {e}")
+            return BatchOperationItem(
+                workflow_id=workflow_id, success=False, error=str(e)
+            )
+        return BatchOperationItem(workflow_id=workflow_id, success=True)
+
+    job = bulk_jobs.start_local_job(
+        operation,
+        iter_target_ids(client, request.workflow_ids, request.query, snapshot=True),
+        _stop,
+        max_concurrency=OmegaConf.select(
+            cfg,
+            "api.bulk_operations.max_concurrency",
+            default=DEFAULT_BULK_OPERATION_MAX_CONCURRENCY,
+        ),
+        total=(
+            len(set(request.workflow_ids)) if request.workflow_ids is not None else None
+        ),
+    )
+    return _job_accepted(http_request, job)
+
+
+def _job_accepted(http_request: Request, job: BulkJob) -> BackendJSONResponse:
+    """Build the ``202 Accepted`` response for a started bulk job.
+
+    Args:
+        http_request: Incoming HTTP request, used to build the job URL.
+        job: The started job.
+
+    Returns:
+        Response carrying the job and its polling location.
+    """
+    return BackendJSONResponse(
+        status_code=202,
+        content=job.to_model().model_dump(),
+        headers={
+            "Location": str(http_request.url_for("get_batch_job", job_id=job.job_id))
+        },
+    )
+
+
+def _check_bulk_operation_size(
+    workflow_ids: Optional[List[str]], cfg: DictConfig
+) -> None:
+    """Reject bulk operations over more IDs than configured.
+
+    Args:
+        workflow_ids: Targeted workflow IDs, if given as a list.
+        cfg: Hydra configuration object.
+
+    Raises:
+        HTTPException: If the list is longer than ``api.bulk_operations.max_ids``.
+    """
+    max_ids = OmegaConf.select(
+        cfg, "api.bulk_operations.max_ids", default=DEFAULT_BULK_OPERATION_MAX_IDS
+    )
+    if workflow_ids is not None and len(workflow_ids) > max_ids:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Operation on {len(workflow_ids)} IDs exceeds the limit of "
+            f"{max_ids}",
+        )
+
+
+def _bulk_operation_rate(cfg: DictConfig) -> float:
+    """Get the rate limit for server-side batch jobs.
+
+    Args:
+        cfg: Hydra configuration object.
+
+    Returns:
+        Operations per second, 0 for the server default.
+    """
+    return OmegaConf.select(
+        cfg,
+        "api.bulk_operations.max_operations_per_second",
+        default=DEFAULT_BULK_OPERATION_MAX_OPS_PER_SECOND,
+    )
+
+
+async def _iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """Split a byte stream into NDJSON lines without buffering the whole body.
+
+    Args:
+        chunks: Raw body chunks as they arrive.
+        max_line_bytes: Maximum accepted length of a single line.
+
+    Yields:
+        Tuples of 1-based line number and line bytes. Blank lines are
+        skipped; lines longer than ``max_line_bytes`` are yielded as ``None``.
+    """
+    buffer = bytearray()
+    line_number = 0
+    overflowed = False
+
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while True:
+            newline = buffer.find(b"\n")
+            if newline == -1:
+                break
+            line_number += 1
+            line = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            if overflowed:
+                overflowed = False
+                yield line_number, None
+            elif len(line) > max_line_bytes:
+                yield line_number, None
+            elif line.strip():
+                yield line_number, line
+
+        # Drop the head of an oversized line instead of holding it in memory
+        if len(buffer) > max_line_bytes:
+            overflowed = True
+            buffer.clear()
+
+    if overflowed:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, bytes(buffer)
+
+
+async def _start_stream_line(
+    client: Client,
+    starter: WorkflowStarter,
+    line_number: int,
+    line: Optional[bytes],
+) -> StreamStartAck:
+    """Parse one NDJSON line and start its workflow.
+
+    Args:
+        client: Temporal client instance.
+        starter: Workflow starter shared by the start endpoints.
+        line_number: 1-based line number in the request body.
+        line: Raw line bytes, or ``None`` if the line was too long.
+
+    Returns:
+        Acknowledgement for the line.
+    """
+    if line is None:
+        return StreamStartAck(
+            line=line_number, success=False, error="Line exceeds maximum length"
+        )
+
+    try:
+        request = WorkflowRequest.model_validate_json(line)
+    except ValidationError as e:
+        return StreamStartAck(
+            line=line_number, success=False, error=f"Invalid request: {e}"
+        )
+
+    try:
+        response = await starter.start(client, request)
+        return StreamStartAck(
+            line=line_number, success=True, workflow_id=response.workflow_id
+        )
+    except Exception as e:
+        logger.error(f"Failed to start workflow from line {line_number}: {e}")
+        return StreamStartAck(
+            line=line_number, success=False, error=f"Failed to start workflow: {e}"
+        )
+
+
+async def _list_latest_executions(
+    client: Client, workflow_ids: List[str]
+) -> Dict[str, Any]:
+    """Find the latest run of each workflow ID with one visibility query.
+
+    Args:
+        client: Temporal client instance.
+        workflow_ids: Workflow IDs to look up.
+
+    Returns:
+        Latest execution per workflow ID found. Empty if the query fails, so
+        every ID falls back to an individual describe.
+    """
+    latest: Dict[str, Any] = {}
+    try:
+        async for execution in client.list_workflows(
+            build_workflow_id_filter(workflow_ids)
+        ):
+            current = latest.get(execution.id)
+            if current is None or execution.start_time > current.start_time:
+                latest[execution.id] = execution
+    except Exception as e:
+        logger.warning(f"Visibility query for {len(workflow_ids)} IDs failed: {e}")
+        return {}
+    return latest
+
+
+def _bulk_status_item(execution: Any, source: str) -> BulkStatusItem:
+    """Convert a workflow execution or description into a bulk status item.
+
+    Args:
+        execution: ``WorkflowExecution`` from visibility or ``describe``.
+        source: Where the execution came from.
+
+    Returns:
+        Bulk status item for the execution.
+    """
+    return BulkStatusItem(
+        workflow_id=execution.id,
+        found=True,
+        status=execution.status.name if execution.status else None,
+        run_id=execution.run_id,
+        start_time=execution.start_time.isoformat(),
+        close_time=execution.close_time.isoformat() if execution.close_time else None,
+        source=source,
+    )
+
+
+async def _wait_for_disconnect(http_request: Request) -> None:
+    """Return once the client has disconnected.
+
+    Args:
+        http_request: Incoming request whose body has been fully read.
+    """
+    while True:
+        message = await http_request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _await_unless_disconnected(
+    http_request: Request, awaitable: Awaitable[Any], timeout: float
+) -> Any:
+    """Await a Temporal call, giving up on timeout or client disconnect.
+
+    The await is cancelled in either case so no coroutine is left parked on
+    a long poll nobody is waiting for; a shared long poll only stops once
+    its last waiter gives up.
+
+    Args:
+        http_request: Incoming request watched for disconnects.
+        awaitable: Temporal call to await.
+        timeout: Seconds to wait before giving up.
+
+    Returns:
+        Result of the awaitable.
+
+    Raises:
+        TimeoutError: If the awaitable does not finish within the timeout.
+        ClientDisconnect: If the client disconnects first.
+    """
+    call = asyncio.ensure_future(awaitable)
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(http_request))
+    try:
+        done, _ = await asyncio.wait(
+            {call, disconnect}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        disconnect.cancel()
+        if not call.done():
+            call.cancel()
+
+    if call in done:
+        return call.result()
+    if disconnect in done:
+        raise ClientDisconnect()
+    raise TimeoutError()
+
+
+async def _cache_result(
+    workflow_id: str, result: Any, result_cache: WorkflowResultCache
+) -> CachedResult:
+    """Serialize a completed workflow's result and cache it with its ETag.
+
+    The entity tag is computed here, once per cached body, so polls of the
+    result compare against the stored tag instead of hashing the body.
+
+    Args:
+        workflow_id: Unique identifier for the workflow.
+        result: Decoded workflow result.
+        result_cache: Workflow result cache.
+
+    Returns:
+        The cached result.
+    """
+    body = json_backend.dumps(
+        {"workflow_id": workflow_id, "result": result, "status": "COMPLETED"}
+    )
+    return await result_cache.put(workflow_id, body, content_etag(body))
+
+
+def _cached_result_response(cached: CachedResult) -> Response:
+    """Build the response for a cached workflow result.
+
+    Args:
+        cached: Result body and entity tag.
+
+    Returns:
+        Response carrying the body and its ``ETag``.
+    """
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={"ETag": cached.etag},
+    )
+
+
+async def _start_acknowledged(
+    call: "asyncio.Future[Any]", start_operation: WithStartWorkflowOperation
+) -> bool:
+    """Check whether Temporal acknowledged the start of an abandoned execute.
+
+    The cancelled call is awaited first: the client resolves the start
+    operation's handle, with the start response or with the error that
+    ended the call, before the call finishes. A handle still unresolved
+    shortly after counts as not started.
+
+    Args:
+        call: The cancelled update-with-start call.
+        start_operation: Start operation the call was made with.
+
+    Returns:
+        Whether the workflow is known to have started.
+    """
+    await asyncio.gather(call, return_exceptions=True)
+    try:
+        await asyncio.wait_for(
+            start_operation.workflow_handle(), timeout=START_ACK_SETTLE_SECONDS
+        )
+    except Exception:
+        return False
+    return True
+
+
 async def _log_workflow_start(workflow_id: str, workflow_type: str) -> None:
     """Log workflow start in background.
 
@@ -0,0 +1,60 @@
+"""Serving the API with one or more uvicorn worker processes."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import os
+
+# Third-party
+import uvicorn
+from omegaconf import DictConfig, OmegaConf
+from loguru import logger
+
+# Local Application
+from src.api.main import APP_CONFIG_ENV_VAR
+
+# ================================== Constants ================================ #
+APP_FACTORY = "src.api.main:create_app_from_env"
+DEFAULT_WORKERS = 1
+DEFAULT_TIMEOUT_SECONDS = 30
+
+
+# ================================== Functions ================================ #
+def run_api_server(cfg: DictConfig) -> None:
+    """Serve the API until interrupted.
+
+    The app is passed to uvicorn as a factory import string so that
+    ``api.server.workers`` processes can each build their own app. The
+    parent binds the listening socket once and shares it with the workers.
+    With more than one worker, each is gracefully recycled after
+    ``app.settings.max_requests`` requests and replaced by the supervisor.
+
+    Args:
+        cfg: Hydra configuration object.
+    """
+    workers = OmegaConf.select(cfg, "api.server.workers", default=DEFAULT_WORKERS)
+    reload = OmegaConf.select(cfg, "api.server.reload", default=False)
+    max_requests = OmegaConf.select(cfg, "app.settings.max_requests", default=None)
+    if workers <= 1 or reload:
+        # Without a supervisor, a worker that hits the limit stops the server
+        max_requests = None
+
+    os.environ[APP_CONFIG_ENV_VAR] = OmegaConf.to_yaml(cfg, resolve=True)
+    logger.info(
+        f"Serving API on {cfg.api.server.host}:{cfg.api.server.port} with "
+        f"{workers} worker process(es)"
+        + (f", recycled every {max_requests} requests" if max_requests else "")
+    )
+
+    uvicorn.run(
+        APP_FACTORY,
+        factory=True,
+        host=cfg.api.server.host,
+        port=cfg.api.server.port,
+        workers=workers,
+        reload=reload,
+        limit_max_requests=max_requests,
+        timeout_graceful_shutdown=OmegaConf.select(
+            cfg, "app.settings.timeout", default=DEFAULT_TIMEOUT_SECONDS
+        ),
+        log_config=None,  # Use our custom logging
+    )
@@ -2,7 +2,6 @@
 
 # ================================== Imports ================================== #
 # Standard Library
-import asyncio
 from pathlib import Path
 
 # Third-party
@@ -12,9 +11,8 @@ from omegaconf import DictConfig, OmegaConf
 from rich.console import Console
 
 # Local Application
-from src.api.main import create_app
+from src.api.server import run_api_server
 from src.utils.logging import setup_logger
-from src.workers.temporal_worker import start_temporal_worker
 
 
 # ================================== Functions ================================ #
@@ -34,23 +32,8 @@ def main(cfg: DictConfig) -> None:
 
     # -------------------------- Core Logic ------------------------------ #
     try:
-        # Create FastAPI app
-        app = create_app(cfg)
-
-        # Start Temporal worker in background
-        asyncio.create_task(start_temporal_worker(cfg))
-
-        # Start FastAPI server
-        import uvicorn
-
-        uvicorn.run(
-            app,
-            host=cfg.api.server.host,
-            port=cfg.api.server.port,
-            workers=cfg.api.server.workers,
-            reload=cfg.api.server.reload,
-            log_config=None,  # Use our custom logging
-        )
+        # Start FastAPI server; the Temporal worker runs as its own process
+        run_api_server(cfg)
 
     except Exception as e:
         logger.opt(exception=True).critical("Application startup failed.")
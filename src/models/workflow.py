@@ -3,10 +3,10 @@
 # ================================== Imports ================================== #
 # Standard Library
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 # Third-party
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # ================================== Data Models ============================= #
@@ -16,6 +16,18 @@ class WorkflowRequest(BaseModel):
     workflow_type: str = Field(..., description="Type of workflow to execute")
     input_data: Dict[str, Any] = Field(..., description="Input data for the workflow")
     user_id: str = Field(..., description="ID of the user initiating the workflow")
+    idempotency_key: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=256,
+        description="Client-supplied key; retries with the same key start at most "
+        "one workflow",
+    )
+    priority: Literal["high", "normal", "low"] = Field(
+        "normal",
+        description="Start priority; lower priorities are rejected first when the "
+        "task queue is backlogged",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -23,11 +35,26 @@ class WorkflowRequest(BaseModel):
                 "workflow_type": "data_processing",
                 "input_data": {"file_path": "/path/to/file", "options": {}},
                 "user_id": "user_123",
+                "idempotency_key": "ingest-2024-01-01-batch-7",
             }
         }
     }
 
 
+class SignalWithStartRequest(WorkflowRequest):
+    """Request model for signalling a workflow, starting it if not running."""
+
+    workflow_id: Optional[str] = Field(
+        None,
+        min_length=1,
+        description="Workflow to signal; defaults to the ID derived from "
+        "idempotency_key, or a new unique ID",
+    )
+    signal_data: Dict[str, Any] = Field(
+        default_factory=dict, description="Payload of the workflow_signal signal"
+    )
+
+
 class WorkflowResponse(BaseModel):
     """Response model for workflow operations."""
 
@@ -35,6 +62,7 @@ class WorkflowResponse(BaseModel):
     status: str = Field(..., description="Current status of the workflow")
     message: str = Field(..., description="Human-readable message")
     created_at: str = Field(..., description="ISO timestamp when workflow was created")
+    run_id: Optional[str] = Field(None, description="Run ID of the described execution")
 
 
 class WorkflowStatus(BaseModel):
@@ -81,3 +109,156 @@ class ErrorResponse(BaseModel):
     details: Optional[Dict[str, Any]] = Field(
         None, description="Additional error details"
     )
+
+
+class BatchStartResult(BaseModel):
+    """Outcome of a single item in a batch workflow start."""
+
+    index: int = Field(..., description="Position of the item in the batch request")
+    success: bool = Field(..., description="Whether the workflow was started")
+    response: Optional[WorkflowResponse] = Field(
+        None, description="Workflow response if the start succeeded"
+    )
+    error: Optional[ErrorResponse] = Field(
+        None, description="Error details if the start failed"
+    )
+
+
+class BatchStartResponse(BaseModel):
+    """Response model for a batch workflow start."""
+
+    total: int = Field(..., description="Number of items in the batch")
+    succeeded: int = Field(..., description="Number of workflows started")
+    failed: int = Field(..., description="Number of workflows that failed to start")
+    results: List[BatchStartResult] = Field(
+        ..., description="Per-item results in request order"
+    )
+
+
+class StreamStartAck(BaseModel):
+    """Acknowledgement for a single line of a streamed NDJSON workflow start."""
+
+    line: int = Field(..., description="1-based line number in the request body")
+    success: bool = Field(..., description="Whether the workflow was started")
+    workflow_id: Optional[str] = Field(
+        None, description="Workflow ID if the start succeeded"
+    )
+    error: Optional[str] = Field(None, description="Error message if the line failed")
+
+
+class BulkStatusRequest(BaseModel):
+    """Request model for a bulk workflow status lookup."""
+
+    workflow_ids: List[str] = Field(
+        ..., min_length=1, description="Workflow IDs to look up"
+    )
+
+
+class BulkStatusItem(BaseModel):
+    """Status of a single workflow in a bulk status lookup."""
+
+    workflow_id: str = Field(..., description="Unique identifier for the workflow")
+    found: bool = Field(..., description="Whether the workflow exists")
+    status: Optional[str] = Field(None, description="Current status of the workflow")
+    run_id: Optional[str] = Field(None, description="Run ID of the latest run")
+    start_time: Optional[str] = Field(None, description="ISO start timestamp")
+    close_time: Optional[str] = Field(None, description="ISO close timestamp")
+    source: str = Field(
+        ..., description="Where the status came from: visibility or describe"
+    )
+
+
+class WorkflowSummary(BaseModel):
+    """Summary of a workflow execution in a listing."""
+
+    workflow_id: str = Field(..., description="Unique identifier for the workflow")
+    run_id: str = Field(..., description="Run ID of the execution")
+    workflow_type: str = Field(..., description="Type of the workflow")
+    status: Optional[str] = Field(None, description="Current status of the workflow")
+    start_time: str = Field(..., description="ISO start timestamp")
+    close_time: Optional[str] = Field(None, description="ISO close timestamp")
+
+
+class WorkflowListResponse(BaseModel):
+    """Response model for a page of listed workflows."""
+
+    workflows: List[WorkflowSummary] = Field(..., description="Workflows on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, absent on the last page"
+    )
+
+
+class BatchTargetRequest(BaseModel):
+    """Workflows targeted by a bulk operation: an ID list or a query."""
+
+    workflow_ids: Optional[List[str]] = Field(
+        None, min_length=1, description="Workflow IDs to operate on"
+    )
+    query: Optional[str] = Field(
+        None,
+        min_length=1,
+        description="Visibility query selecting the workflows to operate on",
+    )
+    reason: str = Field(
+        "Bulk operation via API",
+        min_length=1,
+        description="Reason recorded with the operation",
+    )
+    server_side: bool = Field(
+        False,
+        description="Delegate to a Temporal batch operation instead of calling "
+        "each workflow from the API",
+    )
+
+    @model_validator(mode="after")
+    def _check_single_target(self) -> "BatchTargetRequest":
+        """Require exactly one of ``workflow_ids`` and ``query``."""
+        if (self.workflow_ids is None) == (self.query is None):
+            raise ValueError("Provide exactly one of workflow_ids or query")
+        return self
+
+
+class BatchSignalRequest(BatchTargetRequest):
+    """Request model for sending one signal to many workflows."""
+
+    signal_data: Dict[str, Any] = Field(
+        default_factory=dict, description="Payload of the workflow_signal signal"
+    )
+
+
+class BatchOperationItem(BaseModel):
+    """Outcome of a bulk operation for a single workflow."""
+
+    workflow_id: str = Field(..., description="Unique identifier for the workflow")
+    success: bool = Field(..., description="Whether the operation succeeded")
+    error: Optional[str] = Field(None, description="Error message if it failed")
+
+
+class BulkStopRequest(BatchTargetRequest):
+    """Request model for cancelling or terminating many workflows."""
+
+    server_side: Optional[bool] = Field(
+        None,
+        description="True requires a Temporal batch job, false fans out from the "
+        "API; unset tries a batch job and falls back to the API",
+    )
+
+
+class BatchOperationJob(BaseModel):
+    """State and progress of a bulk operation job."""
+
+    job_id: str = Field(..., description="Job ID to poll for progress")
+    operation: str = Field(..., description="Operation applied to the workflows")
+    server_side: bool = Field(..., description="Whether Temporal runs the job")
+    state: str = Field("RUNNING", description="RUNNING, COMPLETED, FAILED or CANCELED")
+    total: Optional[int] = Field(
+        None, description="Number of targeted workflows, once known"
+    )
+    completed: int = Field(0, description="Workflows the operation succeeded on")
+    failed: int = Field(0, description="Workflows the operation failed on")
+    errors: List[BatchOperationItem] = Field(
+        default_factory=list, description="First per-workflow failures"
+    )
+    message: Optional[str] = Field(None, description="Job-level detail or error")
+    started_at: Optional[str] = Field(None, description="ISO start timestamp")
+    finished_at: Optional[str] = Field(None, description="ISO finish timestamp")
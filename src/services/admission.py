@@ -0,0 +1,184 @@
+"""Adaptive admission control for routes that call Temporal."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import time
+from typing import Any, Dict, Optional
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+
+# ================================== Constants ================================ #
+DEFAULT_INITIAL_LIMIT = 20
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 200
+DEFAULT_BACKOFF_RATIO = 0.9
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_BASELINE_SMOOTHING = 0.05
+DEFAULT_RETRY_AFTER_SECONDS = 1
+
+
+# ================================== Classes ================================== #
+class AdmissionController:
+    """AIMD concurrency limit driven by observed request latency.
+
+    Requests beyond the current limit are shed immediately instead of
+    queueing on a slow backend. Each healthy completion raises the limit by
+    ``1 / limit``, i.e. roughly one per round trip. A completion slower than
+    ``latency_tolerance`` times the baseline latency, or one that failed,
+    multiplies the limit by ``backoff_ratio``, at most once per round trip
+    so a wave of slow responses counts as one congestion signal.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        baseline_smoothing: float = DEFAULT_BASELINE_SMOOTHING,
+        retry_after_seconds: int = DEFAULT_RETRY_AFTER_SECONDS,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            enabled: Whether requests are subject to admission control.
+            initial_limit: Concurrency limit before any latency is observed.
+            min_limit: Lowest the limit may fall.
+            max_limit: Highest the limit may grow.
+            backoff_ratio: Factor the limit is multiplied by on congestion.
+            latency_tolerance: Multiple of the baseline latency above which a
+                completion counts as congestion.
+            baseline_smoothing: Weight of each successful sample in the
+                moving average baseline latency.
+            retry_after_seconds: ``Retry-After`` hint sent with shed requests.
+
+        Raises:
+            ValueError: If the limits or ratios are inconsistent.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min <= initial <= max")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f"Backoff ratio must be in (0, 1), got {backoff_ratio}")
+
+        self.enabled = enabled
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.baseline_smoothing = baseline_smoothing
+        self.retry_after_seconds = retry_after_seconds
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self.admitted = 0
+        self.shed = 0
+        self._last_backoff = 0.0
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "AdmissionController":
+        """Create a controller from ``api.admission``.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured admission controller.
+        """
+        return cls(
+            enabled=OmegaConf.select(cfg, "api.admission.enabled", default=False),
+            initial_limit=OmegaConf.select(
+                cfg, "api.admission.initial_limit", default=DEFAULT_INITIAL_LIMIT
+            ),
+            min_limit=OmegaConf.select(
+                cfg, "api.admission.min_limit", default=DEFAULT_MIN_LIMIT
+            ),
+            max_limit=OmegaConf.select(
+                cfg, "api.admission.max_limit", default=DEFAULT_MAX_LIMIT
+            ),
+            backoff_ratio=OmegaConf.select(
+                cfg, "api.admission.backoff_ratio", default=DEFAULT_BACKOFF_RATIO
+            ),
+            latency_tolerance=OmegaConf.select(
+                cfg,
+                "api.admission.latency_tolerance",
+                default=DEFAULT_LATENCY_TOLERANCE,
+            ),
+            baseline_smoothing=OmegaConf.select(
+                cfg,
+                "api.admission.baseline_smoothing",
+                default=DEFAULT_BASELINE_SMOOTHING,
+            ),
+            retry_after_seconds=OmegaConf.select(
+                cfg,
+                "api.admission.retry_after_seconds",
+                default=DEFAULT_RETRY_AFTER_SECONDS,
+            ),
+        )
+
+    def try_acquire(self) -> bool:
+        """Admit a request if the concurrency limit allows it.
+
+        Returns:
+            Whether the request was admitted; admitted requests must be
+            followed by ``release``.
+        """
+        if self.in_flight >= int(self.limit):
+            self.shed += 1
+            return False
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """Record a completed request and adjust the limit.
+
+        Args:
+            latency: Seconds the request took.
+            failed: Whether the backend failed or was unavailable.
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+
+        congested = failed or (
+            self.baseline_latency is not None
+            and latency > self.baseline_latency * self.latency_tolerance
+        )
+        if not failed:
+            # Slow samples move the baseline too, so a backend that stays
+            # slower settles at a new normal instead of pinning the limit low
+            if self.baseline_latency is None:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency += self.baseline_smoothing * (
+                    latency - self.baseline_latency
+                )
+
+        if not congested:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        elif now - self._last_backoff >= latency:
+            # Requests in flight when we backed off report the same
+            # congestion; only react once per round trip
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            self._last_backoff = now
+
+    def stats(self) -> Dict[str, Any]:
+        """Get controller state and counters.
+
+        Returns:
+            Current limit, in-flight count, baseline latency and counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "baseline_latency_ms": (
+                round(self.baseline_latency * 1000, 3)
+                if self.baseline_latency is not None
+                else None
+            ),
+            "admitted": self.admitted,
+            "shed": self.shed,
+        }
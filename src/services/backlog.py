@@ -0,0 +1,242 @@
+"""Background sampling of task queue backlog for start backpressure."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from temporalio.api.enums.v1 import TaskQueueType
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueRequest
+from temporalio.client import Client
+from loguru import logger
+
+# Local Application
+from src.services.temporal_service import get_client_manager
+
+# ================================== Constants ================================ #
+DEFAULT_TASK_QUEUE = "workflow-task-queue"
+DEFAULT_NAMESPACE = "default"
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 5.0
+DEFAULT_STALE_AFTER_SECONDS = 30.0
+DEFAULT_LOW_PRIORITY_MAX_BACKLOG = 1_000
+DEFAULT_NORMAL_PRIORITY_MAX_BACKLOG = 10_000
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+
+
+# ================================== Exceptions =============================== #
+class QueueSaturatedError(Exception):
+    """Raised when a start is rejected because the task queue is saturated."""
+
+    def __init__(self, task_queue: str, backlog: int, retry_after_seconds: int):
+        super().__init__(
+            f"Task queue {task_queue} is saturated ({backlog} tasks backlogged)"
+        )
+        self.task_queue = task_queue
+        self.backlog = backlog
+        self.retry_after_seconds = retry_after_seconds
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class TaskQueueReading:
+    """One sample of a task queue's backlog and pollers."""
+
+    backlog_count: int
+    backlog_age_seconds: float
+    poller_count: int
+    sampled_at: float
+
+
+# ================================== Classes ================================== #
+class TaskQueueBacklogMonitor:
+    """Periodically samples a task queue and gates starts on its backlog.
+
+    Starts consult the latest cached reading, so admission costs no RPC.
+    Each priority has its own backlog threshold; ``high`` priority starts are
+    never rejected. Without a reading fresher than ``stale_after_seconds``,
+    e.g. when the sampler cannot reach Temporal, starts are admitted.
+    """
+
+    def __init__(
+        self,
+        task_queue: str = DEFAULT_TASK_QUEUE,
+        namespace: str = DEFAULT_NAMESPACE,
+        enabled: bool = True,
+        interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+        low_priority_max_backlog: int = DEFAULT_LOW_PRIORITY_MAX_BACKLOG,
+        normal_priority_max_backlog: int = DEFAULT_NORMAL_PRIORITY_MAX_BACKLOG,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            task_queue: Task queue to sample.
+            namespace: Namespace of the task queue.
+            enabled: Whether sampling and backpressure are active.
+            interval_seconds: Time between samples.
+            stale_after_seconds: Age after which a reading is ignored.
+            low_priority_max_backlog: Backlog at which low priority starts
+                are rejected.
+            normal_priority_max_backlog: Backlog at which normal priority
+                starts are rejected.
+        """
+        self.task_queue = task_queue
+        self.namespace = namespace
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.max_backlog = {
+            PRIORITY_LOW: low_priority_max_backlog,
+            PRIORITY_NORMAL: normal_priority_max_backlog,
+        }
+        self.reading: Optional[TaskQueueReading] = None
+        self.rejected = 0
+        self.sample_errors = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "TaskQueueBacklogMonitor":
+        """Create a monitor from ``api.backpressure``.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Monitor for the worker task queue.
+        """
+        return cls(
+            task_queue=OmegaConf.select(
+                cfg, "temporal.worker.task_queue", default=DEFAULT_TASK_QUEUE
+            ),
+            namespace=OmegaConf.select(
+                cfg, "temporal.server.namespace", default=DEFAULT_NAMESPACE
+            ),
+            enabled=OmegaConf.select(cfg, "api.backpressure.enabled", default=False),
+            interval_seconds=OmegaConf.select(
+                cfg,
+                "api.backpressure.interval_seconds",
+                default=DEFAULT_SAMPLE_INTERVAL_SECONDS,
+            ),
+            stale_after_seconds=OmegaConf.select(
+                cfg,
+                "api.backpressure.stale_after_seconds",
+                default=DEFAULT_STALE_AFTER_SECONDS,
+            ),
+            low_priority_max_backlog=OmegaConf.select(
+                cfg,
+                "api.backpressure.max_backlog.low",
+                default=DEFAULT_LOW_PRIORITY_MAX_BACKLOG,
+            ),
+            normal_priority_max_backlog=OmegaConf.select(
+                cfg,
+                "api.backpressure.max_backlog.normal",
+                default=DEFAULT_NORMAL_PRIORITY_MAX_BACKLOG,
+            ),
+        )
+
+    def start(self) -> None:
+        """Start the background sampler if enabled and not already running."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sampler."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sample(self, client: Client) -> TaskQueueReading:
+        """Read the task queue's backlog and pollers and cache the reading.
+
+        Args:
+            client: Temporal client instance.
+
+        Returns:
+            The new reading.
+        """
+        response = await client.workflow_service.describe_task_queue(
+            DescribeTaskQueueRequest(
+                namespace=self.namespace,
+                task_queue=TaskQueue(name=self.task_queue),
+                task_queue_type=TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW,
+                report_stats=True,
+            )
+        )
+        stats = response.stats
+        backlog_age = stats.approximate_backlog_age.ToTimedelta()
+        self.reading = TaskQueueReading(
+            backlog_count=stats.approximate_backlog_count,
+            backlog_age_seconds=backlog_age.total_seconds(),
+            poller_count=len(response.pollers),
+            sampled_at=time.monotonic(),
+        )
+        return self.reading
+
+    def check(self, priority: str = PRIORITY_NORMAL) -> None:
+        """Reject a start of the given priority if the queue is saturated.
+
+        Args:
+            priority: Priority of the start, ``high``, ``normal`` or ``low``.
+
+        Raises:
+            QueueSaturatedError: If the backlog is at or above the priority's
+                threshold.
+        """
+        max_backlog = self.max_backlog.get(priority)
+        reading = self.reading
+        if not self.enabled or max_backlog is None or reading is None:
+            return
+        if time.monotonic() - reading.sampled_at > self.stale_after_seconds:
+            return
+        if reading.backlog_count >= max_backlog:
+            self.rejected += 1
+            raise QueueSaturatedError(
+                self.task_queue,
+                reading.backlog_count,
+                retry_after_seconds=max(1, round(self.interval_seconds)),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the latest reading and counters.
+
+        Returns:
+            Thresholds, latest reading and its age, and counters.
+        """
+        reading = self.reading
+        return {
+            "enabled": self.enabled,
+            "task_queue": self.task_queue,
+            "max_backlog": self.max_backlog,
+            "backlog_count": reading.backlog_count if reading else None,
+            "backlog_age_seconds": reading.backlog_age_seconds if reading else None,
+            "poller_count": reading.poller_count if reading else None,
+            "reading_age_seconds": (
+                round(time.monotonic() - reading.sampled_at, 3) if reading else None
+            ),
+            "rejected": self.rejected,
+            "sample_errors": self.sample_errors,
+        }
+
+    async def _run(self) -> None:
+        """Sample the task queue every ``interval_seconds`` until cancelled."""
+        while True:
+            try:
+                client = await get_client_manager().get_client()
+                await self.sample(client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.sample_errors += 1
+                logger.warning(f"Failed to sample task queue {self.task_queue}: {e}")
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,460 @@
+"""Fan-out of one operation over many workflows."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+from uuid import uuid4
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from temporalio.api.batch.v1 import (
+    BatchOperationCancellation,
+    BatchOperationSignal,
+    BatchOperationTermination,
+)
+from temporalio.api.common.v1 import Payloads, WorkflowExecution
+from temporalio.api.enums.v1 import BatchOperationState, BatchOperationType
+from temporalio.api.workflowservice.v1 import (
+    DescribeBatchOperationRequest,
+    StartBatchOperationRequest,
+)
+from temporalio.client import Client
+from loguru import logger
+
+# Local Application
+from src.models.workflow import BatchOperationItem, BatchOperationJob
+
+# ================================== Constants ================================ #
+OPERATION_SIGNAL = "signal"
+OPERATION_CANCEL = "cancel"
+OPERATION_TERMINATE = "terminate"
+DEFAULT_MAX_CONCURRENCY = 50
+DEFAULT_MAX_JOBS = 1000
+DEFAULT_MAX_JOB_ERRORS = 100
+JOB_RUNNING = "RUNNING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+JOB_CANCELED = "CANCELED"
+BATCH_OPERATION_STATE_PREFIX = "BATCH_OPERATION_STATE_"
+BATCH_OPERATION_TYPE_PREFIX = "BATCH_OPERATION_TYPE_"
+
+T = TypeVar("T")
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class BulkJob:
+    """Progress of one bulk operation."""
+
+    job_id: str
+    operation: str
+    server_side: bool
+    state: str = JOB_RUNNING
+    total: Optional[int] = None
+    completed: int = 0
+    failed: int = 0
+    errors: List[BatchOperationItem] = field(default_factory=list)
+    message: Optional[str] = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    task: Optional[asyncio.Task] = None
+
+    def to_model(self) -> BatchOperationJob:
+        """Convert the job to its API model.
+
+        Returns:
+            Job state and progress.
+        """
+        return BatchOperationJob(
+            job_id=self.job_id,
+            operation=self.operation,
+            server_side=self.server_side,
+            state=self.state,
+            total=self.total,
+            completed=self.completed,
+            failed=self.failed,
+            errors=self.errors,
+            message=self.message,
+            started_at=self.started_at.isoformat(),
+            finished_at=self.finished_at.isoformat() if self.finished_at else None,
+        )
+
+
+# ================================== Classes ================================== #
+class BulkJobRegistry:
+    """Runs API-side bulk operations in the background and tracks all jobs.
+
+    API-side jobs are fanned out with ``run_bounded`` and their progress is
+    kept in this process, so it is only visible to the server process that
+    runs the job. Server-side jobs are only recorded; their progress is
+    read from Temporal. The most recent ``max_jobs`` jobs are kept.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        max_errors: int = DEFAULT_MAX_JOB_ERRORS,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            max_jobs: Number of jobs remembered; the oldest finished jobs
+                are forgotten first.
+            max_errors: Number of per-workflow failures kept per job.
+        """
+        self.max_jobs = max_jobs
+        self.max_errors = max_errors
+        self._jobs: "OrderedDict[str, BulkJob]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "BulkJobRegistry":
+        """Create a registry from ``api.bulk_operations``.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured job registry.
+        """
+        return cls(
+            max_jobs=OmegaConf.select(
+                cfg, "api.bulk_operations.max_jobs", default=DEFAULT_MAX_JOBS
+            ),
+            max_errors=OmegaConf.select(
+                cfg,
+                "api.bulk_operations.max_reported_errors",
+                default=DEFAULT_MAX_JOB_ERRORS,
+            ),
+        )
+
+    def get(self, job_id: str) -> Optional[BulkJob]:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            The job, or ``None`` if it is unknown here.
+        """
+        return self._jobs.get(job_id)
+
+    def record_server_job(self, job_id: str, operation: str) -> BulkJob:
+        """Remember a job that Temporal runs.
+
+        Args:
+            job_id: Temporal batch job ID.
+            operation: Operation the job applies.
+
+        Returns:
+            The recorded job.
+        """
+        job = BulkJob(job_id=job_id, operation=operation, server_side=True)
+        self._add(job)
+        return job
+
+    def start_local_job(
+        self,
+        operation: str,
+        workflow_ids: AsyncIterator[str],
+        call: Callable[[str], Awaitable[BatchOperationItem]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        total: Optional[int] = None,
+    ) -> BulkJob:
+        """Run an operation over workflows from the API in the background.
+
+        Args:
+            operation: Operation being applied.
+            workflow_ids: IDs of the targeted workflows.
+            call: Per-workflow call reporting its outcome.
+            max_concurrency: Maximum number of calls in flight.
+            total: Number of targeted workflows, if known up front.
+
+        Returns:
+            The running job.
+        """
+        job = BulkJob(
+            job_id=f"api-bulk-{uuid4()}",
+            operation=operation,
+            server_side=False,
+            total=total,
+        )
+        job.task = asyncio.create_task(
+            self._run(job, workflow_ids, call, max_concurrency)
+        )
+        self._add(job)
+        return job
+
+    async def close(self) -> None:
+        """Cancel running API-side jobs."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(
+        self,
+        job: BulkJob,
+        workflow_ids: AsyncIterator[str],
+        call: Callable[[str], Awaitable[BatchOperationItem]],
+        max_concurrency: int,
+    ) -> None:
+        """Apply the call to every workflow and record progress.
+
+        Args:
+            job: Job to record progress on.
+            workflow_ids: IDs of the targeted workflows.
+            call: Per-workflow call reporting its outcome.
+            max_concurrency: Maximum number of calls in flight.
+        """
+        items = run_bounded(workflow_ids, call, max_concurrency)
+        try:
+            async for item in items:
+                if item.success:
+                    job.completed += 1
+                else:
+                    job.failed += 1
+                    if len(job.errors) < self.max_errors:
+                        job.errors.append(item)
+            job.total = job.completed + job.failed
+            job.state = JOB_COMPLETED
+        except asyncio.CancelledError:
+            job.state = JOB_CANCELED
+            raise
+        except Exception as e:
+            logger.error(f"Bulk {job.operation} job {job.job_id} failed: {e}")
+            job.state = JOB_FAILED
+            job.message = str(e)
+        finally:
+            await items.aclose()
+            job.finished_at = datetime.now(timezone.utc)
+            job.task = None
+
+    def _add(self, job: BulkJob) -> None:
+        """Remember a job, forgetting the oldest finished ones over the cap.
+
+        Args:
+            job: Job to remember.
+        """
+        self._jobs[job.job_id] = job
+        finished = [
+            job_id for job_id, known in self._jobs.items() if known.task is None
+        ]
+        for job_id in finished[: max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job_id]
+
+
+# ================================== Functions ================================ #
+async def iter_target_ids(
+    client: Client,
+    workflow_ids: Optional[Iterable[str]] = None,
+    query: Optional[str] = None,
+    snapshot: bool = False,
+) -> AsyncIterator[str]:
+    """Yield the IDs of the workflows a bulk operation targets.
+
+    Args:
+        client: Temporal client instance.
+        workflow_ids: Explicit workflow IDs; duplicates are yielded once.
+        query: Visibility query, used when no IDs are given. Matching
+            workflows are listed page by page as they are consumed.
+        snapshot: List every workflow matching ``query`` before yielding
+            any. Required when the operation removes workflows from the
+            query's results, e.g. cancelling workflows matched on
+            ``ExecutionStatus``; paging a shrinking result set makes later
+            page tokens skip executions.
+
+    Yields:
+        Workflow IDs.
+    """
+    if workflow_ids is not None:
+        for workflow_id in dict.fromkeys(workflow_ids):
+            yield workflow_id
+        return
+
+    if snapshot:
+        matched = [execution.id async for execution in client.list_workflows(query)]
+        for workflow_id in dict.fromkeys(matched):
+            yield workflow_id
+        return
+
+    async for execution in client.list_workflows(query):
+        yield execution.id
+
+
+async def run_bounded(
+    workflow_ids: AsyncIterator[str],
+    call: Callable[[str], Awaitable[T]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[T]:
+    """Apply a call to every workflow ID with bounded concurrency.
+
+    IDs are pulled from the iterator only as calls finish, so a query
+    matching tens of thousands of workflows is never materialized at once.
+
+    Args:
+        workflow_ids: IDs to apply the call to.
+        call: Per-ID call; it should report failures in its result rather
+            than raise.
+        max_concurrency: Maximum number of calls in flight.
+
+    Yields:
+        Call results in completion order.
+    """
+    pending: Set[asyncio.Future] = set()
+    try:
+        async for workflow_id in workflow_ids:
+            pending.add(asyncio.ensure_future(call(workflow_id)))
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # The consumer went away, e.g. the client disconnected mid-stream
+        for task in pending:
+            task.cancel()
+
+
+async def build_signal_operation(
+    client: Client, signal: str, *args: Any
+) -> BatchOperationSignal:
+    """Build the signal operation of a Temporal batch job.
+
+    Args:
+        client: Temporal client whose data converter encodes the arguments.
+        signal: Signal name.
+        *args: Signal arguments.
+
+    Returns:
+        Batch signal operation.
+    """
+    return BatchOperationSignal(
+        signal=signal,
+        input=Payloads(payloads=await client.data_converter.encode(list(args))),
+        identity=client.identity,
+    )
+
+
+async def start_server_batch_operation(
+    client: Client,
+    reason: str,
+    workflow_ids: Optional[Iterable[str]] = None,
+    query: Optional[str] = None,
+    max_operations_per_second: float = 0,
+    **operation: Any,
+) -> str:
+    """Start a Temporal batch job that applies an operation server-side.
+
+    Args:
+        client: Temporal client instance.
+        reason: Reason recorded with the job.
+        workflow_ids: Explicit workflow IDs to target.
+        query: Visibility query to target, used when no IDs are given.
+        max_operations_per_second: Job rate limit; 0 uses the server default.
+        **operation: The operation field of ``StartBatchOperationRequest``,
+            e.g. ``signal_operation=...``.
+
+    Returns:
+        ID of the started batch job.
+    """
+    job_id = f"api-batch-{uuid4()}"
+    request = StartBatchOperationRequest(
+        namespace=client.namespace,
+        job_id=job_id,
+        reason=reason,
+        max_operations_per_second=max_operations_per_second,
+        **operation,
+    )
+    if workflow_ids is not None:
+        request.executions.extend(
+            WorkflowExecution(workflow_id=workflow_id)
+            for workflow_id in dict.fromkeys(workflow_ids)
+        )
+    else:
+        request.visibility_query = query
+
+    await client.workflow_service.start_batch_operation(request)
+    return job_id
+
+
+def build_cancel_operation(client: Client) -> BatchOperationCancellation:
+    """Build the cancellation operation of a Temporal batch job.
+
+    Args:
+        client: Temporal client whose identity is recorded.
+
+    Returns:
+        Batch cancellation operation.
+    """
+    return BatchOperationCancellation(identity=client.identity)
+
+
+def build_terminate_operation(client: Client) -> BatchOperationTermination:
+    """Build the termination operation of a Temporal batch job.
+
+    The termination reason is the job's reason.
+
+    Args:
+        client: Temporal client whose identity is recorded.
+
+    Returns:
+        Batch termination operation.
+    """
+    return BatchOperationTermination(identity=client.identity)
+
+
+async def describe_server_batch_operation(
+    client: Client, job_id: str
+) -> BatchOperationJob:
+    """Read the state and progress of a Temporal batch job.
+
+    Args:
+        client: Temporal client instance.
+        job_id: Temporal batch job ID.
+
+    Returns:
+        Job state and progress.
+    """
+    response = await client.workflow_service.describe_batch_operation(
+        DescribeBatchOperationRequest(namespace=client.namespace, job_id=job_id)
+    )
+    state = BatchOperationState.Name(response.state)
+    operation = BatchOperationType.Name(response.operation_type)
+    return BatchOperationJob(
+        job_id=job_id,
+        operation=operation.removeprefix(BATCH_OPERATION_TYPE_PREFIX).lower(),
+        server_side=True,
+        state=state.removeprefix(BATCH_OPERATION_STATE_PREFIX),
+        total=response.total_operation_count,
+        completed=response.complete_operation_count,
+        failed=response.failure_operation_count,
+        message=response.reason or None,
+        started_at=response.start_time.ToDatetime(timezone.utc).isoformat(),
+        finished_at=(
+            response.close_time.ToDatetime(timezone.utc).isoformat()
+            if response.HasField("close_time")
+            else None
+        ),
+    )
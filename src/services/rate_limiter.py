@@ -0,0 +1,290 @@
+"""Token-bucket rate limiting, in process or shared through Redis."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from loguru import logger
+
+# ================================== Constants ================================ #
+DEFAULT_REQUESTS_PER_MINUTE = 100
+DEFAULT_BURST_SIZE = 20
+DEFAULT_MAX_KEYS = 100_000
+RATE_LIMIT_REDIS_KEY_PREFIX = "rate-limit:"
+
+# Refills and takes one token atomically. Uses the Redis clock so replicas
+# with skewed clocks share one consistent bucket. Returns {allowed, wait_ms}.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait_ms = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  wait_ms = math.ceil((1 - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, wait_ms}
+"""
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class _Bucket:
+    """Token count of one key as of its last refill."""
+
+    tokens: float
+    updated_at: float
+
+
+# ================================== Classes ================================== #
+class TokenBucketLimiter:
+    """In-process token buckets keyed by client.
+
+    Each active key costs one bucket. Buckets are kept in least recently used
+    order, and a bucket idle long enough to have refilled completely is
+    indistinguishable from a new one, so it is evicted.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        burst_size: int = DEFAULT_BURST_SIZE,
+        max_keys: int = DEFAULT_MAX_KEYS,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Sustained rate each key is refilled at.
+            burst_size: Bucket capacity, i.e. requests allowed back to back.
+            max_keys: Maximum number of buckets held at once.
+
+        Raises:
+            ValueError: If the rate or burst size is not positive.
+        """
+        if requests_per_minute <= 0 or burst_size <= 0:
+            raise ValueError("Rate limit and burst size must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.burst_size = burst_size
+        self.max_keys = max_keys
+        self.rate_per_second = requests_per_minute / 60.0
+        self.idle_seconds = burst_size / self.rate_per_second
+        self.allowed = 0
+        self.rejected = 0
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        """Take one token from a key's bucket.
+
+        Args:
+            key: Client key, e.g. user ID or IP address.
+
+        Returns:
+            Whether the request is allowed, and if not, the seconds until a
+            token becomes available.
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(tokens=self.burst_size, updated_at=now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(
+                self.burst_size,
+                bucket.tokens + (now - bucket.updated_at) * self.rate_per_second,
+            )
+            bucket.updated_at = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            self.allowed += 1
+            return True, 0.0
+
+        self.rejected += 1
+        return False, (1 - bucket.tokens) / self.rate_per_second
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter counters.
+
+        Returns:
+            Settings, number of tracked keys and decision counters.
+        """
+        return {
+            "backend": "memory",
+            "requests_per_minute": self.requests_per_minute,
+            "burst_size": self.burst_size,
+            "keys": len(self._buckets),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
+
+    async def close(self) -> None:
+        """Release limiter resources; nothing to do in process."""
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop buckets that have been idle long enough to be full again.
+
+        Args:
+            now: Current monotonic time.
+        """
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.updated_at < self.idle_seconds:
+                break
+            del self._buckets[key]
+
+
+class RedisTokenBucketLimiter:
+    """Token buckets shared across API replicas through Redis.
+
+    Each decision is one atomic script call. Buckets expire in Redis once
+    they would have refilled completely. If Redis is unavailable, requests
+    are allowed rather than failing the API.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        burst_size: int = DEFAULT_BURST_SIZE,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            redis_client: ``redis.asyncio`` client.
+            requests_per_minute: Sustained rate each key is refilled at.
+            burst_size: Bucket capacity, i.e. requests allowed back to back.
+
+        Raises:
+            ValueError: If the rate or burst size is not positive.
+        """
+        if requests_per_minute <= 0 or burst_size <= 0:
+            raise ValueError("Rate limit and burst size must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.burst_size = burst_size
+        self.rate_per_ms = requests_per_minute / 60_000.0
+        self.allowed = 0
+        self.rejected = 0
+        self.errors = 0
+        self._redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        """Take one token from a key's shared bucket.
+
+        Args:
+            key: Client key, e.g. user ID or IP address.
+
+        Returns:
+            Whether the request is allowed, and if not, the seconds until a
+            token becomes available.
+        """
+        try:
+            allowed, wait_ms = await self._script(
+                keys=[RATE_LIMIT_REDIS_KEY_PREFIX + key],
+                args=[self.rate_per_ms, self.burst_size],
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Rate limiter Redis call failed, allowing request: {e}")
+            return True, 0.0
+
+        if allowed:
+            self.allowed += 1
+            return True, 0.0
+        self.rejected += 1
+        return False, int(wait_ms) / 1000.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter counters.
+
+        Returns:
+            Settings and decision counters of this replica.
+        """
+        return {
+            "backend": "redis",
+            "requests_per_minute": self.requests_per_minute,
+            "burst_size": self.burst_size,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+# ================================== Functions ================================ #
+def create_rate_limiter(cfg: DictConfig) -> Optional[Any]:
+    """Create the limiter configured under ``api.rate_limit``.
+
+    The Redis backend uses ``database.redis`` when
+    ``api.rate_limit.redis.enabled`` is set.
+
+    Args:
+        cfg: Hydra configuration object.
+
+    Returns:
+        Token-bucket limiter, or ``None`` if rate limiting is disabled.
+    """
+    if not OmegaConf.select(cfg, "api.rate_limit.enabled", default=False):
+        return None
+
+    requests_per_minute = OmegaConf.select(
+        cfg, "api.rate_limit.requests_per_minute", default=DEFAULT_REQUESTS_PER_MINUTE
+    )
+    burst_size = OmegaConf.select(
+        cfg, "api.rate_limit.burst_size", default=DEFAULT_BURST_SIZE
+    )
+
+    if OmegaConf.select(cfg, "api.rate_limit.redis.enabled", default=False):
+        import redis.asyncio as redis
+
+        redis_cfg = cfg.database.redis
+        redis_client = redis.from_url(
+            redis_cfg.url,
+            max_connections=redis_cfg.max_connections,
+            socket_timeout=redis_cfg.socket_timeout,
+            socket_connect_timeout=redis_cfg.socket_connect_timeout,
+            retry_on_timeout=redis_cfg.retry_on_timeout,
+        )
+        return RedisTokenBucketLimiter(
+            redis_client, requests_per_minute=requests_per_minute, burst_size=burst_size
+        )
+
+    return TokenBucketLimiter(
+        requests_per_minute=requests_per_minute,
+        burst_size=burst_size,
+        max_keys=OmegaConf.select(
+            cfg, "api.rate_limit.max_keys", default=DEFAULT_MAX_KEYS
+        ),
+    )
@@ -2,38 +2,363 @@
 
 # ================================== Imports ================================== #
 # Standard Library
-from typing import Optional
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    TypeVar,
+)
 
 # Third-party
-from temporalio.client import Client
+from temporalio.client import Client, WorkflowExecutionDescription
+from omegaconf import DictConfig, OmegaConf
 from loguru import logger
 
+# ================================== Constants ================================ #
+DEFAULT_TARGET_HOST = "localhost:7233"
+DEFAULT_NAMESPACE = "default"
+DEFAULT_POOL_SIZE = 1
+SELECTION_ROUND_ROBIN = "round_robin"
+SELECTION_LEAST_OUTSTANDING = "least_outstanding"
+SELECTION_STRATEGIES = (SELECTION_ROUND_ROBIN, SELECTION_LEAST_OUTSTANDING)
+
+T = TypeVar("T")
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class _Flight:
+    """One shared in-flight call and the number of callers awaiting it."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
+# ================================== Classes ================================== #
+class TemporalClientManager:
+    """Single-flight owner of a pool of Temporal client connections.
+
+    Each pooled client is a separate ``Client.connect`` and therefore its own
+    gRPC channel, which spreads load across HTTP/2 connections. Concurrent
+    callers that find the pool empty wait on one connection attempt instead
+    of each opening their own.
+    """
+
+    def __init__(
+        self,
+        target_host: str = DEFAULT_TARGET_HOST,
+        namespace: str = DEFAULT_NAMESPACE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        selection: str = SELECTION_ROUND_ROBIN,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            target_host: Temporal frontend address as ``host:port``.
+            namespace: Temporal namespace to connect to.
+            pool_size: Number of client connections to open.
+            selection: Strategy for picking a connection, one of
+                ``SELECTION_STRATEGIES``.
+
+        Raises:
+            ValueError: If the pool size or selection strategy is invalid.
+        """
+        if pool_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {pool_size}")
+        if selection not in SELECTION_STRATEGIES:
+            raise ValueError(f"Unknown client selection strategy: {selection}")
+
+        self.target_host = target_host
+        self.namespace = namespace
+        self.pool_size = pool_size
+        self.selection = selection
+        self._clients: List[Client] = []
+        self._in_flight: List[int] = []
+        self._served: List[int] = []
+        self._round_robin = itertools.count()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "TemporalClientManager":
+        """Create a manager from the ``temporal`` configuration.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Manager targeting the configured server, namespace and pool.
+        """
+        server = cfg.temporal.server
+        return cls(
+            target_host=f"{server.host}:{server.port}",
+            namespace=server.namespace,
+            pool_size=OmegaConf.select(
+                cfg, "temporal.client.pool_size", default=DEFAULT_POOL_SIZE
+            ),
+            selection=OmegaConf.select(
+                cfg, "temporal.client.selection", default=SELECTION_ROUND_ROBIN
+            ),
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the client pool has been established."""
+        return bool(self._clients)
+
+    async def connect(self) -> None:
+        """Open every pooled connection if the pool is empty.
+
+        Raises:
+            RuntimeError: If client connection fails.
+        """
+        if self._clients:
+            return
+
+        async with self._lock:
+            # Another caller may have connected while we waited for the lock
+            if self._clients:
+                return
+            try:
+                clients = await asyncio.gather(
+                    *(
+                        Client.connect(self.target_host, namespace=self.namespace)
+                        for _ in range(self.pool_size)
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Failed to connect to Temporal server: {e}")
+                raise RuntimeError(f"Failed to connect to Temporal server: {e}")
+
+            self._clients = list(clients)
+            self._in_flight = [0] * self.pool_size
+            self._served = [0] * self.pool_size
+            logger.info(
+                f"Connected to Temporal server at {self.target_host} "
+                f"(namespace {self.namespace}, {self.pool_size} connection(s))"
+            )
+
+    async def get_client(self) -> Client:
+        """Get a pooled client, connecting on first use.
+
+        Returns:
+            Temporal client instance.
+
+        Raises:
+            RuntimeError: If client connection fails.
+        """
+        await self.connect()
+        return self._clients[self._select_index()]
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Client]:
+        """Borrow a pooled client and count it as in flight while held.
+
+        Yields:
+            Temporal client instance.
+
+        Raises:
+            RuntimeError: If client connection fails.
+        """
+        await self.connect()
+        index = self._select_index()
+        client = self._clients[index]
+        self._in_flight[index] += 1
+        self._served[index] += 1
+        try:
+            yield client
+        finally:
+            # The pool may have been released while the lease was held
+            if self._clients and self._clients[index] is client:
+                self._in_flight[index] -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get diagnostic information about the connection pool.
+
+        Returns:
+            Pool settings and per-connection in-flight and served counters.
+        """
+        return {
+            "target_host": self.target_host,
+            "namespace": self.namespace,
+            "pool_size": self.pool_size,
+            "selection": self.selection,
+            "connected": self.is_connected,
+            "connections": [
+                {"index": index, "in_flight": in_flight, "served": served}
+                for index, (in_flight, served) in enumerate(
+                    zip(self._in_flight, self._served)
+                )
+            ],
+        }
+
+    async def close(self) -> None:
+        """Release the pooled client connections.
+
+        ``temporalio`` clients have no explicit close; the underlying
+        connection is closed once the last reference is dropped.
+        """
+        async with self._lock:
+            if self._clients:
+                self._clients = []
+                self._in_flight = []
+                self._served = []
+                logger.info("Temporal client connection closed")
+
+    def _select_index(self) -> int:
+        """Pick the pooled connection for the next call.
+
+        Returns:
+            Index of the selected connection.
+        """
+        if self.selection == SELECTION_LEAST_OUTSTANDING:
+            return min(range(len(self._clients)), key=self._in_flight.__getitem__)
+        return next(self._round_robin) % len(self._clients)
+
+
+class SingleFlight:
+    """Collapses concurrent identical calls into one shared call.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it runs await the same task. Cancelling a caller, e.g. because its
+    client disconnected or its wait timed out, only detaches that caller.
+    The shared call is cancelled once every caller has detached, so an
+    abandoned long poll does not keep running. Finished calls are
+    forgotten immediately; nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self.calls = 0
+        self.shared = 0
+        self.abandoned = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the call; equal keys share one call.
+            call: Coroutine factory performing the call.
+
+        Returns:
+            Result of the shared call.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._on_done(key, flight, task))
+            self.calls += 1
+        else:
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            # Shield so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; stop the upstream call
+                self.abandoned += 1
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get single-flight counters.
+
+        Returns:
+            Calls in flight, calls started, callers that joined a running
+            call and calls cancelled after every caller left.
+        """
+        return {
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "shared": self.shared,
+            "abandoned": self.abandoned,
+        }
+
+    def _on_done(self, key: Hashable, flight: _Flight, task: asyncio.Task) -> None:
+        """Forget a finished call.
+
+        Args:
+            key: Identity of the call.
+            flight: The finished flight.
+            task: The finished call task.
+        """
+        self._forget(key, flight)
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Stop routing new callers to a flight.
+
+        Args:
+            key: Identity of the call.
+            flight: Flight to forget, unless a newer one took its key.
+        """
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
 # ================================== Global Variables ========================= #
-_temporal_client: Optional[Client] = None
+_client_manager = TemporalClientManager()
+_read_flights = SingleFlight()
 
 
 # ================================== Functions ================================ #
-async def get_temporal_client() -> Client:
-    """Get Temporal client instance.
+def configure_temporal_client(cfg: DictConfig) -> TemporalClientManager:
+    """Point the shared client manager at the configured Temporal server.
+
+    Args:
+        cfg: Hydra configuration object.
 
     Returns:
+        The newly configured client manager.
+    """
+    global _client_manager
+
+    _client_manager = TemporalClientManager.from_config(cfg)
+    return _client_manager
+
+
+def get_client_manager() -> TemporalClientManager:
+    """Get the shared client manager.
+
+    Returns:
+        The currently configured client manager.
+    """
+    return _client_manager
+
+
+async def get_temporal_client() -> AsyncIterator[Client]:
+    """Get Temporal client instance for the duration of a request.
+
+    Used as a FastAPI dependency; the client counts as in flight on its
+    pooled connection until the request completes.
+
+    Yields:
         Temporal client instance.
 
     Raises:
         RuntimeError: If client connection fails.
     """
-    global _temporal_client
-
-    if _temporal_client is None:
-        try:
-            # TODO: Get connection details from configuration
-            _temporal_client = await Client.connect("localhost:7233")
-            logger.info("Connected to Temporal server")
-        except Exception as e:
-            logger.error(f"Failed to connect to Temporal server: {e}")
-            raise RuntimeError(f"Failed to connect to Temporal server: {e}")
-
-    return _temporal_client
+    async with _client_manager.lease() as client:
+        yield client
 
 
 async def close_temporal_client() -> None:
@@ -41,13 +366,48 @@ async def close_temporal_client() -> None:
 
     This function should be called during application shutdown.
     """
-    global _temporal_client
+    await _client_manager.close()
 
-    if _temporal_client is not None:
-        try:
-            await _temporal_client.close()
-            logger.info("Temporal client connection closed")
-        except Exception as e:
-            logger.error(f"Error closing Temporal client: {e}")
-        finally:
-            _temporal_client = None
+
+def get_read_flights() -> SingleFlight:
+    """Get the single-flight group shared by Temporal read calls.
+
+    Returns:
+        Single-flight group used by ``describe_workflow`` and
+        ``await_workflow_result``.
+    """
+    return _read_flights
+
+
+async def describe_workflow(
+    client: Client, workflow_id: str
+) -> WorkflowExecutionDescription:
+    """Describe a workflow, sharing the call with concurrent identical ones.
+
+    Args:
+        client: Temporal client instance.
+        workflow_id: Unique identifier for the workflow.
+
+    Returns:
+        Description of the workflow's latest run.
+    """
+    return await _read_flights.do(
+        ("describe", client.namespace, workflow_id),
+        lambda: client.get_workflow_handle(workflow_id).describe(),
+    )
+
+
+async def await_workflow_result(client: Client, workflow_id: str) -> Any:
+    """Wait for a workflow's result, sharing the long poll with other waiters.
+
+    Args:
+        client: Temporal client instance.
+        workflow_id: Unique identifier for the workflow.
+
+    Returns:
+        The workflow's result.
+    """
+    return await _read_flights.do(
+        ("result", client.namespace, workflow_id),
+        lambda: client.get_workflow_handle(workflow_id).result(),
+    )
@@ -0,0 +1,268 @@
+"""Helpers for Temporal visibility: search attributes and list filters."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from temporalio.client import Client, WorkflowExecutionStatus
+from temporalio.common import (
+    SearchAttributeKey,
+    SearchAttributePair,
+    TypedSearchAttributes,
+)
+
+# Local Application
+from src.models.workflow import WorkflowListResponse, WorkflowSummary
+
+# ================================== Constants ================================ #
+CURSOR_QUERY_DIGEST_LENGTH = 16
+DEFAULT_LIST_PAGE_SIZE = 100
+DEFAULT_LIST_MAX_PAGE_SIZE = 1000
+
+# Custom search attributes; register them with scripts/register_search_attributes.py.
+# The workflow type needs no custom attribute, it is indexed as ``WorkflowType``.
+USER_ID_ATTRIBUTE = SearchAttributeKey.for_keyword("UserId")
+CORRELATION_ID_ATTRIBUTE = SearchAttributeKey.for_keyword("CorrelationId")
+CUSTOM_SEARCH_ATTRIBUTES = (USER_ID_ATTRIBUTE, CORRELATION_ID_ATTRIBUTE)
+
+
+# ================================== Functions ================================ #
+def quote_query_value(value: str) -> str:
+    """Quote a string literal for a Temporal visibility query.
+
+    Args:
+        value: Raw value to embed in the query.
+
+    Returns:
+        Single-quoted literal with backslashes and quotes escaped.
+    """
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def build_search_attributes(
+    user_id: Optional[str] = None, correlation_id: Optional[str] = None
+) -> TypedSearchAttributes:
+    """Build the custom search attributes indexed for a workflow.
+
+    Args:
+        user_id: ID of the user starting the workflow.
+        correlation_id: Caller-supplied correlation ID.
+
+    Returns:
+        Typed search attributes holding the given values.
+    """
+    pairs: List[SearchAttributePair] = []
+    if user_id is not None:
+        pairs.append(SearchAttributePair(USER_ID_ATTRIBUTE, user_id))
+    if correlation_id is not None:
+        pairs.append(SearchAttributePair(CORRELATION_ID_ATTRIBUTE, correlation_id))
+    return TypedSearchAttributes(pairs)
+
+
+def build_workflow_id_filter(workflow_ids: Iterable[str]) -> str:
+    """Build a visibility filter matching any of the given workflow IDs.
+
+    Args:
+        workflow_ids: Workflow IDs to match.
+
+    Returns:
+        ``WorkflowId IN (...)`` list filter.
+    """
+    values = ", ".join(quote_query_value(workflow_id) for workflow_id in workflow_ids)
+    return f"WorkflowId IN ({values})"
+
+
+def build_list_filter(
+    workflow_type: Optional[str] = None,
+    status: Optional[str] = None,
+    user_id: Optional[str] = None,
+    started_after: Optional[datetime] = None,
+    started_before: Optional[datetime] = None,
+) -> str:
+    """Build a visibility filter for listing workflows.
+
+    Users are matched on the ``UserId`` search attribute set at start time.
+
+    Args:
+        workflow_type: Workflow type to match.
+        status: Execution status name, e.g. ``RUNNING``.
+        user_id: ID of the user who started the workflows.
+        started_after: Inclusive lower bound on start time.
+        started_before: Exclusive upper bound on start time.
+
+    Returns:
+        List filter, empty if no filters are given.
+
+    Raises:
+        ValueError: If the status is unknown.
+    """
+    clauses: List[str] = []
+    if workflow_type is not None:
+        clauses.append(f"WorkflowType = {quote_query_value(workflow_type)}")
+    if status is not None:
+        clauses.append(f"ExecutionStatus = {quote_query_value(_status_value(status))}")
+    if user_id is not None:
+        clauses.append(f"{USER_ID_ATTRIBUTE.name} = {quote_query_value(user_id)}")
+    if started_after is not None:
+        clauses.append(f"StartTime >= {quote_query_value(_rfc3339(started_after))}")
+    if started_before is not None:
+        clauses.append(f"StartTime < {quote_query_value(_rfc3339(started_before))}")
+    return " AND ".join(clauses)
+
+
+def encode_cursor(query: str, next_page_token: bytes) -> str:
+    """Wrap a visibility page token in an opaque cursor.
+
+    The cursor is bound to the query it was issued for.
+
+    Args:
+        query: List filter the page was fetched with.
+        next_page_token: Temporal's token for the next page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = {
+        "q": _query_digest(query),
+        "t": base64.b64encode(next_page_token).decode("ascii"),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, query: str) -> bytes:
+    """Unwrap an opaque cursor into a visibility page token.
+
+    Args:
+        cursor: Cursor returned by ``encode_cursor``.
+        query: List filter of the current request.
+
+    Returns:
+        Temporal page token.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another query.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        digest, token = payload["q"], base64.b64decode(payload["t"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if digest != _query_digest(query):
+        raise ValueError("Cursor does not match the requested filters")
+    return token
+
+
+async def list_workflow_page(
+    client: Client,
+    cfg: DictConfig,
+    query: str,
+    page_size: Optional[int],
+    cursor: Optional[str],
+) -> WorkflowListResponse:
+    """Fetch one page of a visibility listing.
+
+    Shared by every route that lists workflows through visibility.
+
+    Args:
+        client: Temporal client instance.
+        cfg: Hydra configuration object.
+        query: Visibility list filter.
+        page_size: Requested page size, capped by ``api.list.max_page_size``.
+        cursor: Cursor returned with the previous page.
+
+    Returns:
+        One page of workflows and the cursor for the next page.
+
+    Raises:
+        ValueError: If the cursor is invalid or was issued for another query.
+    """
+    max_page_size = OmegaConf.select(
+        cfg, "api.list.max_page_size", default=DEFAULT_LIST_MAX_PAGE_SIZE
+    )
+    if page_size is None:
+        page_size = OmegaConf.select(
+            cfg, "api.list.default_page_size", default=DEFAULT_LIST_PAGE_SIZE
+        )
+    page_size = min(page_size, max_page_size)
+    next_page_token = decode_cursor(cursor, query) if cursor else None
+
+    executions = client.list_workflows(
+        query or None, page_size=page_size, next_page_token=next_page_token
+    )
+    await executions.fetch_next_page()
+
+    return WorkflowListResponse(
+        workflows=[
+            WorkflowSummary(
+                workflow_id=execution.id,
+                run_id=execution.run_id,
+                workflow_type=execution.workflow_type,
+                status=execution.status.name if execution.status else None,
+                start_time=execution.start_time.isoformat(),
+                close_time=(
+                    execution.close_time.isoformat() if execution.close_time else None
+                ),
+            )
+            for execution in executions.current_page or []
+        ],
+        next_cursor=(
+            encode_cursor(query, executions.next_page_token)
+            if executions.next_page_token
+            else None
+        ),
+    )
+
+
+def _status_value(status: str) -> str:
+    """Convert an execution status name into its visibility query value.
+
+    Args:
+        status: Status name, e.g. ``CONTINUED_AS_NEW``.
+
+    Returns:
+        Visibility value, e.g. ``ContinuedAsNew``.
+
+    Raises:
+        ValueError: If the status is unknown.
+    """
+    name = status.upper()
+    if name not in WorkflowExecutionStatus.__members__:
+        raise ValueError(f"Unknown workflow status: {status}")
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def _rfc3339(value: datetime) -> str:
+    """Format a timestamp for a visibility query, assuming UTC if naive.
+
+    Args:
+        value: Timestamp to format.
+
+    Returns:
+        RFC 3339 timestamp.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def _query_digest(query: str) -> str:
+    """Short digest binding a cursor to its query.
+
+    Args:
+        query: List filter.
+
+    Returns:
+        Hex digest prefix.
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()[
+        :CURSOR_QUERY_DIGEST_LENGTH
+    ]
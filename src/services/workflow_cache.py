@@ -0,0 +1,471 @@
+"""In-process caches for workflow read endpoints."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from loguru import logger
+from temporalio.common import WorkflowIDConflictPolicy, WorkflowIDReusePolicy
+
+# Local Application
+from src.models.workflow import WorkflowResponse
+from src.services.temporal_service import SingleFlight
+
+# ================================== Constants ================================ #
+DEFAULT_STATUS_TTL_SECONDS = 2.0
+DEFAULT_STATUS_MAX_ENTRIES = 10_000
+
+DEFAULT_RESULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_RESULT_REDIS_TTL_SECONDS = 24 * 60 * 60
+RESULT_REDIS_KEY_PREFIX = "workflow-result:"
+# Redis values hold the entity tag, this separator, then the body
+RESULT_REDIS_ETAG_SEPARATOR = b"\n"
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 300.0
+DEFAULT_IDEMPOTENCY_MAX_ENTRIES = 10_000
+DEFAULT_IDEMPOTENCY_REUSE_POLICY = "REJECT_DUPLICATE"
+DEFAULT_IDEMPOTENCY_CONFLICT_POLICY = "USE_EXISTING"
+
+# Statuses a workflow run can never leave; CONTINUED_AS_NEW is excluded
+# because describing by ID follows the new run.
+TERMINAL_STATUSES = frozenset(
+    {"COMPLETED", "FAILED", "TERMINATED", "CANCELED", "TIMED_OUT"}
+)
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class _StatusEntry:
+    """Cached status with its expiry time."""
+
+    response: WorkflowResponse
+    expires_at: Optional[float]
+
+
+@dataclass
+class CachedResult:
+    """Serialized result body with its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+# ================================== Classes ================================== #
+class WorkflowStatusCache:
+    """TTL and LRU bounded cache of workflow status responses.
+
+    Concurrent lookups of the same workflow ID share one in-flight load.
+    Terminal statuses never expire and are only dropped by LRU eviction or
+    explicit invalidation.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_STATUS_TTL_SECONDS,
+        max_entries: int = DEFAULT_STATUS_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of non-terminal statuses.
+            max_entries: Maximum number of cached workflow IDs.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _StatusEntry]" = OrderedDict()
+        self._loads = SingleFlight()
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "WorkflowStatusCache":
+        """Create a cache from the ``api.cache.status`` configuration.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured status cache.
+        """
+        return cls(
+            ttl_seconds=OmegaConf.select(
+                cfg,
+                "api.cache.status.ttl_seconds",
+                default=DEFAULT_STATUS_TTL_SECONDS,
+            ),
+            max_entries=OmegaConf.select(
+                cfg,
+                "api.cache.status.max_entries",
+                default=DEFAULT_STATUS_MAX_ENTRIES,
+            ),
+        )
+
+    async def get_or_load(
+        self,
+        workflow_id: str,
+        loader: Callable[[], Awaitable[WorkflowResponse]],
+    ) -> WorkflowResponse:
+        """Get a cached status, loading it if missing or expired.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+            loader: Coroutine factory that fetches the status from Temporal.
+
+        Returns:
+            Workflow status response.
+        """
+        entry = self._entries.get(workflow_id)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > time.monotonic():
+                self._entries.move_to_end(workflow_id)
+                self.hits += 1
+                return entry.response
+            del self._entries[workflow_id]
+
+        self.misses += 1
+        return await self._loads.do(
+            workflow_id, lambda: self._load(workflow_id, loader)
+        )
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Drop any cached status for a workflow ID.
+
+        Needed when a workflow ID is reused by a new run, since entries are
+        keyed by workflow ID only.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+        """
+        self._entries.pop(workflow_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Entry count, hits and misses.
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    async def _load(
+        self,
+        workflow_id: str,
+        loader: Callable[[], Awaitable[WorkflowResponse]],
+    ) -> WorkflowResponse:
+        """Run the loader and store its result.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+            loader: Coroutine factory that fetches the status from Temporal.
+
+        Returns:
+            Workflow status response.
+        """
+        response = await loader()
+        expires_at = (
+            None
+            if response.status in TERMINAL_STATUSES
+            else time.monotonic() + self.ttl_seconds
+        )
+        self._entries[workflow_id] = _StatusEntry(response, expires_at)
+        self._entries.move_to_end(workflow_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return response
+
+
+class WorkflowResultCache:
+    """Byte-bounded LRU cache of serialized workflow result bodies.
+
+    Completed results never change, so entries do not expire locally. Each
+    body is stored with its entity tag, computed once by the caller, so
+    conditional reads never hash the body again. An optional Redis client
+    shares results across API replicas; Redis errors are logged and treated
+    as misses.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_RESULT_MAX_BYTES,
+        redis_client: Optional[Any] = None,
+        redis_ttl_seconds: int = DEFAULT_RESULT_REDIS_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of locally cached bodies.
+            redis_client: Optional ``redis.asyncio`` client for a shared tier.
+            redis_ttl_seconds: Expiry of entries written to Redis.
+        """
+        self.max_bytes = max_bytes
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_hits = 0
+        self._redis = redis_client
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "WorkflowResultCache":
+        """Create a cache from the ``api.cache.result`` configuration.
+
+        The Redis tier uses ``database.redis`` when
+        ``api.cache.result.redis.enabled`` is set.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured result cache.
+        """
+        redis_client = None
+        if OmegaConf.select(cfg, "api.cache.result.redis.enabled", default=False):
+            import redis.asyncio as redis
+
+            redis_cfg = cfg.database.redis
+            redis_client = redis.from_url(
+                redis_cfg.url,
+                max_connections=redis_cfg.max_connections,
+                socket_timeout=redis_cfg.socket_timeout,
+                socket_connect_timeout=redis_cfg.socket_connect_timeout,
+                retry_on_timeout=redis_cfg.retry_on_timeout,
+            )
+
+        return cls(
+            max_bytes=OmegaConf.select(
+                cfg, "api.cache.result.max_bytes", default=DEFAULT_RESULT_MAX_BYTES
+            ),
+            redis_client=redis_client,
+            redis_ttl_seconds=OmegaConf.select(
+                cfg,
+                "api.cache.result.redis.ttl_seconds",
+                default=DEFAULT_RESULT_REDIS_TTL_SECONDS,
+            ),
+        )
+
+    async def get(self, workflow_id: str) -> Optional[CachedResult]:
+        """Get a cached result body and its entity tag.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+
+        Returns:
+            Cached result, or ``None`` on a miss.
+        """
+        cached = self._entries.get(workflow_id)
+        if cached is not None:
+            self._entries.move_to_end(workflow_id)
+            self.hits += 1
+            return cached
+
+        if self._redis is not None:
+            value = None
+            try:
+                value = await self._redis.get(RESULT_REDIS_KEY_PREFIX + workflow_id)
+            except Exception as e:
+                logger.warning(f"Result cache Redis read failed: {e}")
+            if value is not None:
+                etag, _, body = value.partition(RESULT_REDIS_ETAG_SEPARATOR)
+                cached = CachedResult(body=body, etag=etag.decode("utf-8"))
+                self.redis_hits += 1
+                self._store_local(workflow_id, cached)
+                return cached
+
+        self.misses += 1
+        return None
+
+    async def put(self, workflow_id: str, body: bytes, etag: str) -> CachedResult:
+        """Cache a serialized result body.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+            body: Serialized result body.
+            etag: Entity tag of the body.
+
+        Returns:
+            The cached result.
+        """
+        cached = CachedResult(body=body, etag=etag)
+        self._store_local(workflow_id, cached)
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(
+                    RESULT_REDIS_KEY_PREFIX + workflow_id,
+                    etag.encode("utf-8") + RESULT_REDIS_ETAG_SEPARATOR + body,
+                    ex=self.redis_ttl_seconds,
+                )
+            except Exception as e:
+                logger.warning(f"Result cache Redis write failed: {e}")
+        return cached
+
+    async def invalidate(self, workflow_id: str) -> None:
+        """Drop a cached result body from both tiers.
+
+        Needed when a workflow ID is reused by a new run, since entries are
+        keyed by workflow ID only.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+        """
+        previous = self._entries.pop(workflow_id, None)
+        if previous is not None:
+            self.size_bytes -= len(previous.body)
+
+        if self._redis is not None:
+            try:
+                await self._redis.delete(RESULT_REDIS_KEY_PREFIX + workflow_id)
+            except Exception as e:
+                logger.warning(f"Result cache Redis delete failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Entry count, size and hit/miss/eviction counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    async def close(self) -> None:
+        """Close the Redis connection pool, if any."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def _store_local(self, workflow_id: str, cached: CachedResult) -> None:
+        """Insert a result into the local tier, evicting to stay in budget.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+            cached: Result body and entity tag.
+        """
+        if len(cached.body) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(workflow_id, None)
+        if previous is not None:
+            self.size_bytes -= len(previous.body)
+
+        self._entries[workflow_id] = cached
+        self.size_bytes += len(cached.body)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted.body)
+            self.evictions += 1
+
+
+class IdempotencyCache:
+    """Short-lived cache of responses to idempotent workflow starts.
+
+    Keyed by the deterministic workflow ID derived from an idempotency key,
+    so retried requests are answered without another Temporal RPC. Also
+    carries the ID reuse and conflict policies used for keyed starts.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+        max_entries: int = DEFAULT_IDEMPOTENCY_MAX_ENTRIES,
+        reuse_policy: WorkflowIDReusePolicy = WorkflowIDReusePolicy.REJECT_DUPLICATE,
+        conflict_policy: WorkflowIDConflictPolicy = (
+            WorkflowIDConflictPolicy.USE_EXISTING
+        ),
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached response.
+            max_entries: Maximum number of cached keys.
+            reuse_policy: ID reuse policy for keyed starts.
+            conflict_policy: ID conflict policy for keyed starts.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.reuse_policy = reuse_policy
+        self.conflict_policy = conflict_policy
+        self.hits = 0
+        self._entries: "OrderedDict[str, Tuple[WorkflowResponse, float]]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "IdempotencyCache":
+        """Create a cache from the ``api.idempotency`` configuration.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured idempotency cache.
+        """
+        return cls(
+            ttl_seconds=OmegaConf.select(
+                cfg,
+                "api.idempotency.ttl_seconds",
+                default=DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+            ),
+            max_entries=OmegaConf.select(
+                cfg,
+                "api.idempotency.max_entries",
+                default=DEFAULT_IDEMPOTENCY_MAX_ENTRIES,
+            ),
+            reuse_policy=WorkflowIDReusePolicy[
+                OmegaConf.select(
+                    cfg,
+                    "api.idempotency.reuse_policy",
+                    default=DEFAULT_IDEMPOTENCY_REUSE_POLICY,
+                )
+            ],
+            conflict_policy=WorkflowIDConflictPolicy[
+                OmegaConf.select(
+                    cfg,
+                    "api.idempotency.conflict_policy",
+                    default=DEFAULT_IDEMPOTENCY_CONFLICT_POLICY,
+                )
+            ],
+        )
+
+    def get(self, workflow_id: str) -> Optional[WorkflowResponse]:
+        """Get the cached response for a keyed start.
+
+        Args:
+            workflow_id: Deterministic workflow ID of the keyed start.
+
+        Returns:
+            Cached start response, or ``None`` if missing or expired.
+        """
+        entry = self._entries.get(workflow_id)
+        if entry is None:
+            return None
+
+        response, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[workflow_id]
+            return None
+
+        self.hits += 1
+        return response
+
+    def put(self, workflow_id: str, response: WorkflowResponse) -> None:
+        """Cache the response to a keyed start.
+
+        Args:
+            workflow_id: Deterministic workflow ID of the keyed start.
+            response: Response returned for the start.
+        """
+        self._entries[workflow_id] = (response, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(workflow_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,175 @@
+"""Shared watchers that fan workflow status transitions out to subscribers."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+# Third-party
+from fastapi.encoders import jsonable_encoder
+from temporalio.client import Client
+from loguru import logger
+
+# Local Application
+from src.services.temporal_service import await_workflow_result, describe_workflow
+
+# ================================== Constants ================================ #
+EVENT_STATUS = "status"
+EVENT_RESULT = "result"
+EVENT_ERROR = "error"
+EVENT_END = "end"
+
+
+# ================================== Data Classes ============================= #
+@dataclass
+class WorkflowEvent:
+    """A single event published for a watched workflow."""
+
+    event: str
+    data: Dict[str, Any]
+
+
+@dataclass
+class _WorkflowWatcher:
+    """Upstream watch of one workflow and its subscriber queues."""
+
+    workflow_id: str
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    history: List[WorkflowEvent] = field(default_factory=list)
+    last_status: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+
+
+# ================================== Classes ================================== #
+class WorkflowEventHub:
+    """Fan-out of workflow status transitions to many subscribers.
+
+    All subscribers of one workflow ID share a single upstream watcher: one
+    ``describe`` for the current status, one ``result`` long poll for
+    completion and a final ``describe`` for the closing status. Late
+    subscribers are replayed the events published so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self._watchers: Dict[str, _WorkflowWatcher] = {}
+
+    @property
+    def watcher_count(self) -> int:
+        """Number of workflows currently being watched."""
+        return len(self._watchers)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, workflow_id: str, client: Client
+    ) -> AsyncIterator["asyncio.Queue[WorkflowEvent]"]:
+        """Subscribe to a workflow's events.
+
+        Args:
+            workflow_id: Unique identifier for the workflow.
+            client: Temporal client used if a new watcher has to be started.
+
+        Yields:
+            Queue receiving the workflow's events, ending with ``EVENT_END``.
+        """
+        watcher = self._watchers.get(workflow_id)
+        if watcher is None:
+            watcher = _WorkflowWatcher(workflow_id)
+            self._watchers[workflow_id] = watcher
+            watcher.task = asyncio.create_task(self._watch(watcher, client))
+
+        queue: "asyncio.Queue[WorkflowEvent]" = asyncio.Queue()
+        for event in watcher.history:
+            queue.put_nowait(event)
+        watcher.subscribers.add(queue)
+
+        try:
+            yield queue
+        finally:
+            watcher.subscribers.discard(queue)
+            if not watcher.subscribers:
+                # Nobody is listening any more; stop the upstream watch
+                watcher.task.cancel()
+                if self._watchers.get(workflow_id) is watcher:
+                    del self._watchers[workflow_id]
+
+    async def _watch(self, watcher: _WorkflowWatcher, client: Client) -> None:
+        """Follow a workflow until it closes and publish what happens.
+
+        Args:
+            watcher: Watcher to publish to.
+            client: Temporal client instance.
+        """
+        try:
+            await self._publish_status(watcher, client)
+
+            try:
+                result = await await_workflow_result(client, watcher.workflow_id)
+                self._publish(
+                    watcher,
+                    EVENT_RESULT,
+                    {"workflow_id": watcher.workflow_id, "result": result},
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._publish(
+                    watcher,
+                    EVENT_ERROR,
+                    {"workflow_id": watcher.workflow_id, "message": str(e)},
+                )
+
+            await self._publish_status(watcher, client)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to watch workflow {watcher.workflow_id}: {e}")
+            self._publish(
+                watcher,
+                EVENT_ERROR,
+                {"workflow_id": watcher.workflow_id, "message": str(e)},
+            )
+
+        self._publish(watcher, EVENT_END, {"workflow_id": watcher.workflow_id})
+
+    async def _publish_status(self, watcher: _WorkflowWatcher, client: Client) -> None:
+        """Describe the workflow and publish its status if it changed.
+
+        Args:
+            watcher: Watcher to publish to.
+            client: Temporal client instance.
+        """
+        description = await describe_workflow(client, watcher.workflow_id)
+        status = description.status.name
+        if status == watcher.last_status:
+            return
+
+        watcher.last_status = status
+        self._publish(
+            watcher,
+            EVENT_STATUS,
+            {
+                "workflow_id": watcher.workflow_id,
+                "status": status,
+                "message": f"Workflow is {status.lower()}",
+                "created_at": description.start_time.isoformat(),
+            },
+        )
+
+    def _publish(
+        self, watcher: _WorkflowWatcher, event: str, data: Dict[str, Any]
+    ) -> None:
+        """Record an event and deliver it to every subscriber.
+
+        Args:
+            watcher: Watcher to publish to.
+            event: Event name.
+            data: JSON-compatible event payload.
+        """
+        workflow_event = WorkflowEvent(event=event, data=jsonable_encoder(data))
+        watcher.history.append(workflow_event)
+        for queue in watcher.subscribers:
+            queue.put_nowait(workflow_event)
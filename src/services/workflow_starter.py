@@ -0,0 +1,331 @@
+"""Workflow start logic shared by the start endpoints."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from temporalio.client import Client, WithStartWorkflowOperation, WorkflowHandle
+from temporalio.common import TypedSearchAttributes, WorkflowIDConflictPolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+# Local Application
+from src.models.workflow import (
+    SignalWithStartRequest,
+    WorkflowRequest,
+    WorkflowResponse,
+)
+from src.services.backlog import TaskQueueBacklogMonitor
+from src.services.visibility import build_search_attributes
+from src.services.workflow_cache import IdempotencyCache
+
+# ================================== Constants ================================ #
+DEFAULT_TASK_QUEUE = "workflow-task-queue"
+# Signal handled by the application's workflows, e.g. SimpleWorkflow
+WORKFLOW_SIGNAL_NAME = "workflow_signal"
+# Update returning the workflow result, handled by e.g. SimpleWorkflow
+WORKFLOW_RESULT_UPDATE_NAME = "await_result"
+# Start response statuses: a new run, or an idempotency key replayed
+STATUS_STARTED = "STARTED"
+STATUS_ALREADY_STARTED = "ALREADY_STARTED"
+
+
+# ================================== Classes ================================== #
+class WorkflowStarter:
+    """Starts workflows with consistent IDs, options and idempotency."""
+
+    def __init__(
+        self,
+        task_queue: str = DEFAULT_TASK_QUEUE,
+        idempotency_cache: Optional[IdempotencyCache] = None,
+        index_search_attributes: bool = False,
+        backlog_monitor: Optional[TaskQueueBacklogMonitor] = None,
+    ) -> None:
+        """Initialize the starter.
+
+        Args:
+            task_queue: Task queue new workflows are started on.
+            idempotency_cache: Cache of recent idempotent start responses.
+            index_search_attributes: Whether to attach ``UserId`` and
+                ``CorrelationId`` search attributes to new workflows. They
+                must be registered on the namespace first.
+            backlog_monitor: Task queue monitor gating new starts on backlog.
+        """
+        self.task_queue = task_queue
+        self.idempotency_cache = idempotency_cache or IdempotencyCache()
+        self.index_search_attributes = index_search_attributes
+        self.backlog_monitor = backlog_monitor or TaskQueueBacklogMonitor(
+            task_queue=task_queue, enabled=False
+        )
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "WorkflowStarter":
+        """Create a starter from the application configuration.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Configured workflow starter.
+        """
+        return cls(
+            task_queue=OmegaConf.select(
+                cfg, "temporal.worker.task_queue", default=DEFAULT_TASK_QUEUE
+            ),
+            idempotency_cache=IdempotencyCache.from_config(cfg),
+            index_search_attributes=OmegaConf.select(
+                cfg, "temporal.search_attributes.enabled", default=False
+            ),
+            backlog_monitor=TaskQueueBacklogMonitor.from_config(cfg),
+        )
+
+    async def start(self, client: Client, request: WorkflowRequest) -> WorkflowResponse:
+        """Start a single workflow execution on Temporal.
+
+        Requests carrying an idempotency key map to a deterministic workflow
+        ID and are answered from the idempotency cache when retried. A key
+        that maps back to an existing run is reported as ``ALREADY_STARTED``
+        rather than ``STARTED``.
+
+        Args:
+            client: Temporal client instance.
+            request: Workflow start request data.
+
+        Returns:
+            Workflow response for the started or reused workflow.
+
+        Raises:
+            QueueSaturatedError: If the task queue backlog is over the
+                threshold for the request's priority.
+        """
+        workflow_id = self.build_workflow_id(request)
+        keyed = request.idempotency_key is not None
+        options = self.start_options(request)
+        if keyed:
+            cached = self.idempotency_cache.get(workflow_id)
+            if cached is not None:
+                return self._replayed(cached)
+        # Retries answered from the cache add no work, so check only here
+        self.backlog_monitor.check(request.priority)
+        if keyed:
+            options["id_reuse_policy"] = self.idempotency_cache.reuse_policy
+            options["id_conflict_policy"] = self.idempotency_cache.conflict_policy
+
+        try:
+            workflow_handle = await client.start_workflow(
+                request.workflow_type,
+                args=[request.input_data],
+                id=workflow_id,
+                **options,
+            )
+            response = WorkflowResponse(
+                workflow_id=workflow_handle.id,
+                status=STATUS_STARTED,
+                message="Workflow started successfully",
+                created_at=datetime.now().isoformat(),
+            )
+            if keyed:
+                self.idempotency_cache.put(workflow_id, response)
+            if not _started_new_run(workflow_handle):
+                # USE_EXISTING attached the key to a run that was already open
+                response = self._replayed(response)
+        except WorkflowAlreadyStartedError:
+            if not keyed:
+                raise
+            # The key was already used by a run the reuse policy won't repeat
+            response = WorkflowResponse(
+                workflow_id=workflow_id,
+                status=STATUS_ALREADY_STARTED,
+                message="Workflow already started for this idempotency key",
+                created_at=datetime.now().isoformat(),
+            )
+            self.idempotency_cache.put(workflow_id, response)
+
+        return response
+
+    @staticmethod
+    def _replayed(response: WorkflowResponse) -> WorkflowResponse:
+        """Mark a start response as answering a replayed idempotency key.
+
+        Args:
+            response: Response of the start the key first mapped to.
+
+        Returns:
+            Copy of the response reporting the existing workflow.
+        """
+        return response.model_copy(
+            update={
+                "status": STATUS_ALREADY_STARTED,
+                "message": "Workflow already started for this idempotency key",
+            }
+        )
+
+    async def signal_with_start(
+        self, client: Client, request: SignalWithStartRequest
+    ) -> Tuple[WorkflowResponse, bool]:
+        """Signal a workflow, starting it first if it is not running.
+
+        Uses Temporal's atomic signal-with-start, so there is no window
+        between the start and the signal and only one RPC is made.
+
+        Args:
+            client: Temporal client instance.
+            request: Signal-with-start request data.
+
+        Returns:
+            Workflow response for the signalled workflow, and whether a new
+            run was started for it.
+
+        Raises:
+            QueueSaturatedError: If the task queue backlog is over the
+                threshold for the request's priority.
+        """
+        workflow_id = request.workflow_id or self.build_workflow_id(request)
+        self.backlog_monitor.check(request.priority)
+
+        workflow_handle = await client.start_workflow(
+            request.workflow_type,
+            args=[request.input_data],
+            id=workflow_id,
+            start_signal=WORKFLOW_SIGNAL_NAME,
+            start_signal_args=[request.signal_data],
+            **self.start_options(request),
+        )
+        response = WorkflowResponse(
+            workflow_id=workflow_handle.id,
+            status="SIGNALED",
+            message="Signal sent; workflow started if it was not running",
+            created_at=datetime.now().isoformat(),
+            run_id=workflow_handle.result_run_id,
+        )
+        # Only set when the call started the run, not for a running one
+        return response, workflow_handle.first_execution_run_id is not None
+
+    def execute_operation(
+        self, request: WorkflowRequest, workflow_id: str
+    ) -> WithStartWorkflowOperation:
+        """Build the start half of an update-with-start for ``execute``.
+
+        A workflow already running under the ID is reused rather than
+        rejected, so retries of a keyed request attach to the same run.
+
+        Args:
+            request: Workflow start request data.
+            workflow_id: ID to start the workflow with, see
+                ``build_workflow_id``.
+
+        Returns:
+            Start operation; ``workflow_handle()`` resolves once Temporal has
+            acknowledged the start.
+        """
+        options = self.start_options(request)
+        if request.idempotency_key is not None:
+            options["id_reuse_policy"] = self.idempotency_cache.reuse_policy
+        return WithStartWorkflowOperation(
+            request.workflow_type,
+            request.input_data,
+            id=workflow_id,
+            id_conflict_policy=WorkflowIDConflictPolicy.USE_EXISTING,
+            **options,
+        )
+
+    async def execute(
+        self,
+        client: Client,
+        request: WorkflowRequest,
+        start_operation: WithStartWorkflowOperation,
+    ) -> Any:
+        """Start a workflow and wait for its result in one call.
+
+        Uses Temporal's update-with-start: the result update is sent along
+        with the start and is answered once the workflow has its result, so
+        no separate status or result polling is needed.
+
+        Args:
+            client: Temporal client instance.
+            request: Workflow start request data.
+            start_operation: Start operation from ``execute_operation``.
+
+        Returns:
+            The workflow result.
+
+        Raises:
+            QueueSaturatedError: If the task queue backlog is over the
+                threshold for the request's priority.
+        """
+        self.backlog_monitor.check(request.priority)
+        return await client.execute_update_with_start_workflow(
+            WORKFLOW_RESULT_UPDATE_NAME, start_workflow_operation=start_operation
+        )
+
+    def start_options(self, request: WorkflowRequest) -> Dict[str, Any]:
+        """Build the start options shared by every way of starting a workflow.
+
+        Args:
+            request: Workflow start request data.
+
+        Returns:
+            Keyword arguments for ``Client.start_workflow`` and friends.
+        """
+        options: Dict[str, Any] = {"task_queue": self.task_queue}
+        if self.index_search_attributes:
+            options["search_attributes"] = self.search_attributes(request)
+        return options
+
+    @staticmethod
+    def search_attributes(request: WorkflowRequest) -> TypedSearchAttributes:
+        """Build the search attributes indexed for a workflow.
+
+        The correlation ID is read from the ``WorkflowInput`` payload.
+
+        Args:
+            request: Workflow start request data.
+
+        Returns:
+            Typed search attributes for the workflow.
+        """
+        correlation_id = request.input_data.get("correlation_id")
+        return build_search_attributes(
+            user_id=request.user_id,
+            correlation_id=str(correlation_id) if correlation_id else None,
+        )
+
+    @staticmethod
+    def build_workflow_id(request: WorkflowRequest) -> str:
+        """Build the workflow ID for a start request.
+
+        Args:
+            request: Workflow start request data.
+
+        Returns:
+            Deterministic ID derived from the idempotency key if one is given,
+            otherwise a unique ID.
+        """
+        prefix = f"{request.workflow_type}_{request.user_id}"
+        if request.idempotency_key is not None:
+            digest = hashlib.sha256(request.idempotency_key.encode("utf-8")).hexdigest()
+            return f"{prefix}_{digest[:32]}"
+
+        # Timestamps alone collide when many workflows start concurrently
+        return f"{prefix}_{datetime.now().timestamp()}_{uuid4().hex[:8]}"
+
+
+# ================================== Functions ================================ #
+def _started_new_run(workflow_handle: WorkflowHandle) -> bool:
+    """Whether a start call created a run rather than attaching to one.
+
+    ``temporalio`` keeps the start response, whose ``started`` flag is false
+    when ``USE_EXISTING`` returned an open run, only on a private attribute.
+
+    Args:
+        workflow_handle: Handle returned by ``Client.start_workflow``.
+
+    Returns:
+        False only if the server reported that no run was started.
+    """
+    start_response = getattr(workflow_handle, "_start_workflow_response", None)
+    return getattr(start_response, "started", True) is not False
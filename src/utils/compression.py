@@ -0,0 +1,185 @@
+"""HTTP content codings and ``Accept-Encoding`` negotiation."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import importlib.util
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence
+
+# ================================== Constants ================================ #
+ENCODING_ZSTD = "zstd"
+ENCODING_GZIP = "gzip"
+ENCODING_DEFLATE = "deflate"
+# Server preference when the client accepts several codings equally
+DEFAULT_ENCODINGS = (ENCODING_ZSTD, ENCODING_GZIP, ENCODING_DEFLATE)
+DEFAULT_ZLIB_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+# zlib window bits selecting the gzip and zlib ("deflate" in HTTP) containers
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+DEFLATE_WBITS = zlib.MAX_WBITS
+
+
+# ================================== Classes ================================== #
+class Compressor(ABC):
+    """Incremental compressor for one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress a chunk of the body.
+
+        Args:
+            data: Next chunk of the body.
+            flush: Whether to emit everything buffered so far, so the client
+                can decode the chunk without waiting for more data.
+
+        Returns:
+            Compressed output available so far.
+        """
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """End the compressed stream.
+
+        Returns:
+            The remaining compressed output.
+        """
+
+
+class ZlibCompressor(Compressor):
+    """``gzip`` or ``deflate`` through zlib."""
+
+    def __init__(self, level: int, wbits: int) -> None:
+        """Initialize the compressor.
+
+        Args:
+            level: zlib compression level, 1-9.
+            wbits: zlib window bits selecting the container format.
+        """
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        if flush:
+            output += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class ZstdCompressor(Compressor):
+    """``zstd`` through the optional ``zstandard`` package."""
+
+    def __init__(self, level: int) -> None:
+        """Initialize the compressor.
+
+        Args:
+            level: zstd compression level, 1-22.
+        """
+        import zstandard
+
+        self._zstandard = zstandard
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        if flush:
+            output += self._compressor.flush(self._zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(self._zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+# ================================== Functions ================================ #
+def is_encoding_available(encoding: str) -> bool:
+    """Check whether a content coding can be produced here.
+
+    Args:
+        encoding: Content coding name.
+
+    Returns:
+        Whether the coding is known and its package, if any, is installed.
+    """
+    if encoding == ENCODING_ZSTD:
+        return importlib.util.find_spec("zstandard") is not None
+    return encoding in (ENCODING_GZIP, ENCODING_DEFLATE)
+
+
+def create_compressor(
+    encoding: str,
+    level: int = DEFAULT_ZLIB_LEVEL,
+    zstd_level: int = DEFAULT_ZSTD_LEVEL,
+) -> Compressor:
+    """Create a compressor for a content coding.
+
+    Args:
+        encoding: Content coding name.
+        level: Compression level for ``gzip`` and ``deflate``.
+        zstd_level: Compression level for ``zstd``.
+
+    Returns:
+        A fresh compressor.
+
+    Raises:
+        ValueError: If the coding is unknown.
+    """
+    if encoding == ENCODING_GZIP:
+        return ZlibCompressor(level, GZIP_WBITS)
+    if encoding == ENCODING_DEFLATE:
+        return ZlibCompressor(level, DEFLATE_WBITS)
+    if encoding == ENCODING_ZSTD:
+        return ZstdCompressor(zstd_level)
+    raise ValueError(f"Unknown content encoding: {encoding}")
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Parse an ``Accept-Encoding`` header into quality values.
+
+    Args:
+        header: Header value, e.g. ``gzip;q=0.8, zstd``.
+
+    Returns:
+        Quality value per lower-cased coding; malformed values count as 0.
+    """
+    qualities: Dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def negotiate_encoding(
+    accept_encoding: str, encodings: Sequence[str] = DEFAULT_ENCODINGS
+) -> Optional[str]:
+    """Pick the content coding to respond with.
+
+    Args:
+        accept_encoding: The request's ``Accept-Encoding`` header value.
+        encodings: Codings the server offers, most preferred first.
+
+    Returns:
+        The acceptable coding with the highest quality, ties going to the
+        server's preference, or ``None`` to send the body as is.
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    wildcard = qualities.get("*", 0.0)
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
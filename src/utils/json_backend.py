@@ -0,0 +1,260 @@
+"""Pluggable JSON encoding and decoding."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import importlib.util
+import json
+from typing import Any, Dict, Type
+
+# Third-party
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+# ================================== Constants ================================ #
+BACKEND_AUTO = "auto"
+BACKEND_ORJSON = "orjson"
+BACKEND_MSGSPEC = "msgspec"
+BACKEND_STDLIB = "stdlib"
+# Preference order when the backend is ``auto``
+AUTO_BACKEND_ORDER = (BACKEND_ORJSON, BACKEND_MSGSPEC, BACKEND_STDLIB)
+
+
+# ================================== Classes ================================== #
+class JSONBackend:
+    """Standard library JSON, the fallback every other backend mirrors.
+
+    Output is compact UTF-8. Values the encoder does not support natively,
+    e.g. Pydantic models, are converted with ``jsonable_encoder``.
+    """
+
+    name = BACKEND_STDLIB
+
+    def dumps(self, content: Any) -> bytes:
+        """Serialize content to JSON.
+
+        Args:
+            content: Value to serialize.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        return json.dumps(
+            content,
+            default=jsonable_encoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """Parse JSON.
+
+        Args:
+            data: JSON document.
+
+        Returns:
+            Parsed value.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """JSON through ``orjson``."""
+
+    name = BACKEND_ORJSON
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, content: Any) -> bytes:
+        """Serialize content to JSON, via the stdlib for values orjson rejects.
+
+        Args:
+            content: Value to serialize.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        try:
+            return self._orjson.dumps(
+                content, default=jsonable_encoder, option=self._options
+            )
+        except self._orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(content)
+
+    def loads(self, data: bytes) -> Any:
+        """Parse JSON.
+
+        Args:
+            data: JSON document.
+
+        Returns:
+            Parsed value.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+class MsgspecBackend(JSONBackend):
+    """JSON through ``msgspec``."""
+
+    name = BACKEND_MSGSPEC
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=jsonable_encoder)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, content: Any) -> bytes:
+        """Serialize content to JSON, via the stdlib for values msgspec rejects.
+
+        Args:
+            content: Value to serialize.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        try:
+            return self._encoder.encode(content)
+        except (TypeError, self._msgspec.EncodeError):
+            return super().dumps(content)
+
+    def loads(self, data: bytes) -> Any:
+        """Parse JSON.
+
+        Args:
+            data: JSON document.
+
+        Returns:
+            Parsed value.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            # Callers such as FastAPI's body parsing expect the stdlib error
+            raise json.JSONDecodeError(str(e), _as_text(data), 0) from e
+
+
+# ================================== Global Variables ========================= #
+_BACKEND_CLASSES: Dict[str, Type[JSONBackend]] = {
+    BACKEND_ORJSON: OrjsonBackend,
+    BACKEND_MSGSPEC: MsgspecBackend,
+    BACKEND_STDLIB: JSONBackend,
+}
+_backend: JSONBackend = JSONBackend()
+
+
+# ================================== Functions ================================ #
+def load_json_backend(name: str = BACKEND_AUTO) -> JSONBackend:
+    """Create a JSON backend, falling back to the stdlib if it is missing.
+
+    Args:
+        name: Backend name, ``auto`` for the fastest installed one.
+
+    Returns:
+        JSON backend instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == BACKEND_AUTO:
+        for candidate in AUTO_BACKEND_ORDER:
+            if is_json_backend_installed(candidate):
+                return _BACKEND_CLASSES[candidate]()
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if not is_json_backend_installed(name):
+        logger.warning(f"JSON backend {name} is not installed, using stdlib json")
+        return JSONBackend()
+    return _BACKEND_CLASSES[name]()
+
+
+def configure_json_backend(name: str = BACKEND_AUTO) -> JSONBackend:
+    """Select the JSON backend used by the application.
+
+    Args:
+        name: Backend name, ``auto`` for the fastest installed one.
+
+    Returns:
+        The newly selected backend.
+    """
+    global _backend
+
+    _backend = load_json_backend(name)
+    logger.info(f"Using {_backend.name} JSON backend")
+    return _backend
+
+
+def get_json_backend() -> JSONBackend:
+    """Get the JSON backend used by the application.
+
+    Returns:
+        The currently selected backend.
+    """
+    return _backend
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content with the selected backend.
+
+    Args:
+        content: Value to serialize.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    return _backend.dumps(content)
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON with the selected backend.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Parsed value.
+    """
+    return _backend.loads(data)
+
+
+def is_json_backend_installed(name: str) -> bool:
+    """Check whether a backend's package can be imported.
+
+    Args:
+        name: Backend name.
+
+    Returns:
+        Whether the backend is available.
+    """
+    return name == BACKEND_STDLIB or importlib.util.find_spec(name) is not None
+
+
+def _as_text(data: Any) -> str:
+    """Decode a JSON document for error reporting.
+
+    Args:
+        data: JSON document as bytes or text.
+
+    Returns:
+        The document as text.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data).decode("utf-8", errors="replace")
+    return data
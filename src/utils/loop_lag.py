@@ -0,0 +1,77 @@
+"""Event loop lag measurement."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from typing import Any, Dict, Optional
+
+# ================================== Constants ================================ #
+DEFAULT_LAG_INTERVAL_SECONDS = 0.5
+LAG_SMOOTHING = 0.2
+
+
+# ================================== Classes ================================== #
+class LoopLagMonitor:
+    """Measures how late an event loop wakes up a sleeping task.
+
+    A loop busy with other callbacks resumes the sleeper late; the overshoot
+    is the delay every other task on that loop is seeing too.
+    """
+
+    def __init__(
+        self, name: str, interval_seconds: float = DEFAULT_LAG_INTERVAL_SECONDS
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            name: Name of the monitored loop, used in reports.
+            interval_seconds: Time between measurements.
+        """
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.last_lag = 0.0
+        self.avg_lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start measuring on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop measuring."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get lag measurements.
+
+        Returns:
+            Last, smoothed average and maximum lag in milliseconds.
+        """
+        return {
+            "loop": self.name,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "avg_lag_ms": round(self.avg_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "samples": self.samples,
+        }
+
+    async def _run(self) -> None:
+        """Sleep repeatedly and record how late each wake-up was."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, loop.time() - started - self.interval_seconds)
+            self.last_lag = lag
+            self.avg_lag += LAG_SMOOTHING * (lag - self.avg_lag)
+            self.max_lag = max(self.max_lag, lag)
+            self.samples += 1
@@ -0,0 +1,286 @@
+"""Temporal worker hosted inside the API process."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Third-party
+from omegaconf import DictConfig, OmegaConf
+from temporalio.client import Client
+from temporalio.worker import Worker
+from loguru import logger
+
+# Local Application
+from src.services.temporal_service import TemporalClientManager
+from src.utils.loop_lag import DEFAULT_LAG_INTERVAL_SECONDS, LoopLagMonitor
+from src.workers.temporal_worker import connect_worker_client, create_temporal_worker
+
+# ================================== Constants ================================ #
+MODE_NONE = "none"
+MODE_SAME_LOOP = "same_loop"
+MODE_DEDICATED_THREAD = "dedicated_thread"
+EMBEDDED_MODES = (MODE_NONE, MODE_SAME_LOOP, MODE_DEDICATED_THREAD)
+DEFAULT_SHUTDOWN_TIMEOUT_SECONDS = 30.0
+DEFAULT_CONNECT_INITIAL_BACKOFF_SECONDS = 1.0
+DEFAULT_CONNECT_MAX_BACKOFF_SECONDS = 30.0
+STATE_IDLE = "idle"
+STATE_CONNECTING = "connecting"
+STATE_RUNNING = "running"
+STATE_FAILED = "failed"
+STATE_STOPPED = "stopped"
+
+
+# ================================== Classes ================================== #
+class EmbeddedWorker:
+    """Runs the Temporal worker alongside the API in one process.
+
+    ``same_loop`` runs the worker on the API's event loop and shares the
+    API's pooled client: cheapest, but activity bursts delay requests.
+    ``dedicated_thread`` runs the worker with its own client on an event
+    loop in a separate thread, so it cannot stall request handling beyond
+    contention for the GIL. Each loop in use reports its lag.
+
+    In either mode the worker connects in the background, retrying with
+    exponential backoff while Temporal is unreachable, so an API started
+    before the server still ends up hosting a worker.
+    """
+
+    def __init__(
+        self,
+        cfg: DictConfig,
+        mode: str = MODE_NONE,
+        lag_interval_seconds: float = DEFAULT_LAG_INTERVAL_SECONDS,
+        shutdown_timeout_seconds: float = DEFAULT_SHUTDOWN_TIMEOUT_SECONDS,
+        connect_initial_backoff_seconds: float = (
+            DEFAULT_CONNECT_INITIAL_BACKOFF_SECONDS
+        ),
+        connect_max_backoff_seconds: float = DEFAULT_CONNECT_MAX_BACKOFF_SECONDS,
+    ) -> None:
+        """Initialize the embedded worker.
+
+        Args:
+            cfg: Hydra configuration object.
+            mode: Hosting mode, one of ``EMBEDDED_MODES``.
+            lag_interval_seconds: Time between loop lag measurements.
+            shutdown_timeout_seconds: Time to wait for the worker thread to
+                finish on shutdown.
+            connect_initial_backoff_seconds: Delay before the first retry of
+                a failed connection; doubled after each further failure.
+            connect_max_backoff_seconds: Upper bound on the retry delay.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in EMBEDDED_MODES:
+            raise ValueError(f"Unknown embedded worker mode: {mode}")
+
+        self.cfg = cfg
+        self.mode = mode
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.connect_initial_backoff_seconds = connect_initial_backoff_seconds
+        self.connect_max_backoff_seconds = connect_max_backoff_seconds
+        self.state = STATE_IDLE
+        self.connect_attempts = 0
+        self.last_error: Optional[str] = None
+        self.worker_loop_lag: Optional[LoopLagMonitor] = None
+        if mode == MODE_DEDICATED_THREAD:
+            self.worker_loop_lag = LoopLagMonitor("worker", lag_interval_seconds)
+        self._worker: Optional[Worker] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "EmbeddedWorker":
+        """Create an embedded worker from ``temporal.worker.embedded``.
+
+        Args:
+            cfg: Hydra configuration object.
+
+        Returns:
+            Embedded worker in the configured mode.
+        """
+        return cls(
+            cfg,
+            mode=OmegaConf.select(
+                cfg, "temporal.worker.embedded.mode", default=MODE_NONE
+            ),
+            lag_interval_seconds=OmegaConf.select(
+                cfg,
+                "temporal.worker.embedded.lag_interval_seconds",
+                default=DEFAULT_LAG_INTERVAL_SECONDS,
+            ),
+            shutdown_timeout_seconds=OmegaConf.select(
+                cfg,
+                "temporal.worker.embedded.shutdown_timeout_seconds",
+                default=DEFAULT_SHUTDOWN_TIMEOUT_SECONDS,
+            ),
+            connect_initial_backoff_seconds=OmegaConf.select(
+                cfg,
+                "temporal.worker.embedded.connect_initial_backoff_seconds",
+                default=DEFAULT_CONNECT_INITIAL_BACKOFF_SECONDS,
+            ),
+            connect_max_backoff_seconds=OmegaConf.select(
+                cfg,
+                "temporal.worker.embedded.connect_max_backoff_seconds",
+                default=DEFAULT_CONNECT_MAX_BACKOFF_SECONDS,
+            ),
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker is currently running."""
+        if self._task is not None:
+            return not self._task.done()
+        if self._thread is not None:
+            return self._thread.is_alive()
+        return False
+
+    async def start(self, client_manager: TemporalClientManager) -> None:
+        """Start the worker in the configured mode.
+
+        Connecting happens in the background, so this returns even while
+        Temporal is unreachable.
+
+        Args:
+            client_manager: The API's client manager, shared in ``same_loop``.
+        """
+        if self.mode == MODE_SAME_LOOP:
+            self._task = asyncio.create_task(self._run(client_manager.get_client))
+            logger.info("Embedded Temporal worker started on the API event loop")
+        elif self.mode == MODE_DEDICATED_THREAD:
+            self._thread = threading.Thread(
+                target=self._thread_main, name="temporal-worker", daemon=True
+            )
+            self._thread.start()
+            logger.info("Embedded Temporal worker started on a dedicated loop thread")
+
+    async def stop(self) -> None:
+        """Shut the worker down and wait for it to finish."""
+        if self._task is not None:
+            if self._task.done():
+                pass
+            elif self._worker is not None:
+                await self._worker.shutdown()
+            else:
+                # Still connecting; there is no worker to shut down yet
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._worker = None
+        elif self._thread is not None:
+            await self._stop_thread()
+            await asyncio.to_thread(self._thread.join, self.shutdown_timeout_seconds)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the worker's mode, state and loop lag.
+
+        Returns:
+            Mode, lifecycle state, connection attempts and last error,
+            whether the worker is running and its loop's lag, if it has a
+            loop of its own.
+        """
+        return {
+            "mode": self.mode,
+            "state": self.state,
+            "connect_attempts": self.connect_attempts,
+            "last_error": self.last_error,
+            "running": self.is_running,
+            "loop_lag": self.worker_loop_lag.stats() if self.worker_loop_lag else None,
+        }
+
+    async def _run(self, connect: Callable[[], Awaitable[Client]]) -> None:
+        """Connect with backoff, then run the worker until it stops.
+
+        Args:
+            connect: Opens (or borrows) the client the worker polls with.
+        """
+        try:
+            client = await self._connect_with_backoff(connect)
+            self._worker = create_temporal_worker(client, self.cfg)
+            self.state = STATE_RUNNING
+            await self._worker.run()
+            self.state = STATE_STOPPED
+        except asyncio.CancelledError:
+            self.state = STATE_STOPPED
+            raise
+        except Exception as e:
+            self.state = STATE_FAILED
+            self.last_error = str(e)
+            logger.error(f"Embedded Temporal worker failed: {e}")
+
+    async def _connect_with_backoff(
+        self, connect: Callable[[], Awaitable[Client]]
+    ) -> Client:
+        """Retry a connection until it succeeds, doubling the delay each time.
+
+        Args:
+            connect: Opens (or borrows) the client the worker polls with.
+
+        Returns:
+            Connected Temporal client.
+        """
+        delay = self.connect_initial_backoff_seconds
+        while True:
+            self.state = STATE_CONNECTING
+            self.connect_attempts += 1
+            try:
+                return await connect()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(
+                    f"Embedded Temporal worker could not connect "
+                    f"(attempt {self.connect_attempts}), retrying in {delay:.1f}s: {e}"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.connect_max_backoff_seconds)
+
+    async def _stop_thread(self) -> None:
+        """Ask the worker thread's loop to shut the worker down."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            if self._worker is not None:
+                shutdown = asyncio.run_coroutine_threadsafe(
+                    self._worker.shutdown(), loop
+                )
+                await asyncio.wrap_future(shutdown)
+                return
+        except RuntimeError as e:
+            # The loop already stopped, or the worker had not started running
+            logger.warning(f"Embedded Temporal worker shutdown: {e}")
+
+        # Still connecting, or shutdown failed; stop the thread's main task
+        task = self._thread_task
+        if task is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    def _thread_main(self) -> None:
+        """Run the worker's own event loop until the worker stops."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._run_in_thread())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop = None
+            loop.close()
+
+    async def _run_in_thread(self) -> None:
+        """Connect a dedicated client and run the worker on this loop."""
+        self._thread_task = asyncio.current_task()
+        self.worker_loop_lag.start()
+        try:
+            await self._run(lambda: connect_worker_client(self.cfg))
+        finally:
+            await self.worker_loop_lag.stop()
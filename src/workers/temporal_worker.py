@@ -1,10 +1,6 @@
 """Temporal worker for executing workflows and activities."""
 
 # ================================== Imports ================================== #
-# Standard Library
-import asyncio
-from typing import Any
-
 # Third-party
 from temporalio.client import Client
 from temporalio.worker import Worker
@@ -21,6 +17,45 @@ from src.workflows.simple_workflow import (
 
 
 # ================================== Functions ================================ #
+def create_temporal_worker(client: Client, cfg: DictConfig) -> Worker:
+    """Create the Temporal worker for the application's workflows.
+
+    Args:
+        client: Temporal client the worker polls through.
+        cfg: Hydra configuration object.
+
+    Returns:
+        Configured, not yet running worker.
+    """
+    return Worker(
+        client,
+        task_queue=cfg.temporal.worker.task_queue,
+        workflows=[SimpleWorkflow],
+        activities=[
+            validate_input_activity,
+            process_data_activity,
+            store_data_activity,
+        ],
+        max_concurrent_activities=cfg.temporal.worker.max_concurrent_activities,
+        max_concurrent_workflows=cfg.temporal.worker.max_concurrent_workflows,
+    )
+
+
+async def connect_worker_client(cfg: DictConfig) -> Client:
+    """Connect a Temporal client for a worker.
+
+    Args:
+        cfg: Hydra configuration object.
+
+    Returns:
+        Connected Temporal client.
+    """
+    return await Client.connect(
+        f"{cfg.temporal.server.host}:{cfg.temporal.server.port}",
+        namespace=cfg.temporal.server.namespace,
+    )
+
+
 async def start_temporal_worker(cfg: DictConfig) -> None:
     """Start the Temporal worker.
 
@@ -31,24 +66,10 @@ async def start_temporal_worker(cfg: DictConfig) -> None:
         logger.info("Starting Temporal worker")
 
         # Connect to Temporal server
-        client = await Client.connect(
-            f"{cfg.temporal.server.host}:{cfg.temporal.server.port}",
-            namespace=cfg.temporal.server.namespace,
-        )
+        client = await connect_worker_client(cfg)
 
         # Create worker
-        worker = Worker(
-            client,
-            task_queue=cfg.temporal.worker.task_queue,
-            workflows=[SimpleWorkflow],
-            activities=[
-                validate_input_activity,
-                process_data_activity,
-                store_data_activity,
-            ],
-            max_concurrent_activities=cfg.temporal.worker.max_concurrent_activities,
-            max_concurrent_workflows=cfg.temporal.worker.max_concurrent_workflows,
-        )
+        worker = create_temporal_worker(client, cfg)
 
         logger.info("Temporal worker configured and starting")
 
@@ -3,7 +3,7 @@
 # ================================== Imports ================================== #
 # Standard Library
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 # Third-party
 from temporalio import workflow, activity
@@ -18,8 +18,12 @@ from src.models.workflow import WorkflowInput, WorkflowResult
 class SimpleWorkflow:
     """Simple workflow demonstrating basic Temporal patterns."""
 
-    def __init__(self) -> None:
+    @workflow.init
+    def __init__(self, input_data: WorkflowInput) -> None:
         self.logger = workflow.logger()
+        self.input_data = input_data
+        self.signals: List[Dict[str, Any]] = []
+        self.result: Optional[WorkflowResult] = None
 
     @workflow.run
     async def run(self, input_data: WorkflowInput) -> WorkflowResult:
@@ -42,13 +46,56 @@ class SimpleWorkflow:
             self.logger.info(
                 f"Simple workflow completed successfully for {input_data.request_id}"
             )
-            return WorkflowResult(success=True, result_data=result)
+            self.result = WorkflowResult(success=True, result_data=result)
 
         except Exception as e:
             self.logger.error(
                 f"Simple workflow failed for {input_data.request_id}: {e}"
             )
-            return WorkflowResult(success=False, error_message=str(e))
+            self.result = WorkflowResult(success=False, error_message=str(e))
+
+        # Let await_result updates return before the run completes
+        await workflow.wait_condition(workflow.all_handlers_finished)
+        return self.result
+
+    @workflow.signal
+    def workflow_signal(self, signal_data: Dict[str, Any]) -> None:
+        """Record a signal sent through the API.
+
+        Signal-with-start delivers the signal before ``run`` begins, so the
+        handler only records it and ``run`` reports what was received.
+
+        Args:
+            signal_data: Signal payload.
+        """
+        self.signals.append(signal_data)
+
+    @workflow.update
+    async def await_result(self) -> WorkflowResult:
+        """Return the workflow result once it is available.
+
+        Sent with update-with-start, this answers a request with the result
+        in the same call that starts the workflow.
+
+        Returns:
+            The workflow result.
+        """
+        await workflow.wait_condition(lambda: self.result is not None)
+        return self.result
+
+    @await_result.validator
+    def validate_await_result(self) -> None:
+        """Reject the update if the workflow input cannot succeed.
+
+        Rejected updates are not written to history, so the caller learns
+        of invalid input without waiting for the validation activity.
+
+        Raises:
+            ValueError: If the input parameters are invalid.
+        """
+        error = input_validation_error(self.input_data.parameters)
+        if error is not None:
+            raise ValueError(f"Input validation failed: {error}")
 
     async def _execute_workflow_steps(
         self, input_data: WorkflowInput
@@ -93,9 +140,29 @@ class SimpleWorkflow:
             "storage": storage_result,
             "workflow_id": input_data.request_id,
             "user_id": input_data.user_id,
+            "signals": self.signals,
         }
 
 
+# ================================== Functions ================================ #
+def input_validation_error(parameters: Dict[str, Any]) -> Optional[str]:
+    """Check workflow input parameters.
+
+    Args:
+        parameters: Input parameters to validate.
+
+    Returns:
+        Why the parameters are invalid, or ``None`` if they are valid.
+    """
+    if not parameters:
+        return "No parameters provided"
+
+    if "required_field" not in parameters:
+        return "Missing required field"
+
+    return None
+
+
 # ================================== Activities =============================== #
 @activity.defn
 async def validate_input_activity(parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -109,12 +176,9 @@ async def validate_input_activity(parameters: Dict[str, Any]) -> Dict[str, Any]:
     """
     logger.info("Validating input parameters")
 
-    # Simple validation logic
-    if not parameters:
-        return {"valid": False, "message": "No parameters provided"}
-
-    if "required_field" not in parameters:
-        return {"valid": False, "message": "Missing required field"}
+    error = input_validation_error(parameters)
+    if error is not None:
+        return {"valid": False, "message": error}
 
     return {"valid": True, "message": "Input validation successful"}
 
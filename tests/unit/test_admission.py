@@ -0,0 +1,80 @@
+"""Unit tests for adaptive admission control."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from unittest.mock import AsyncMock, patch
+
+# Third-party
+from fastapi.testclient import TestClient
+
+# Local Application
+from src.services.admission import AdmissionController
+from src.services.temporal_service import get_temporal_client
+
+
+# ================================== Test Classes ============================= #
+class TestAdmissionController:
+    """Test cases for the AIMD admission controller."""
+
+    def test_sheds_beyond_limit(self):
+        """Test requests beyond the concurrency limit are rejected."""
+        controller = AdmissionController(initial_limit=2)
+
+        assert controller.try_acquire()
+        assert controller.try_acquire()
+        assert not controller.try_acquire()
+
+        controller.release(0.01)
+        assert controller.try_acquire()
+        assert controller.stats()["shed"] == 1
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        """Test healthy completions grow the limit and slow ones shrink it once."""
+        controller = AdmissionController(initial_limit=10, backoff_ratio=0.5)
+
+        for _ in range(3):
+            controller.try_acquire()
+            controller.release(0.01)
+        assert 10 < controller.limit < 11
+
+        with patch("src.services.admission.time.monotonic", return_value=1000.0):
+            for _ in range(3):
+                controller.try_acquire()
+            # Three slow completions in one round trip back off only once
+            for _ in range(3):
+                controller.release(1.0)
+        assert 5 < controller.limit < 6
+
+    def test_failures_back_off_to_min_limit(self):
+        """Test failed calls shrink the limit but never below the minimum."""
+        controller = AdmissionController(initial_limit=4, min_limit=2)
+
+        for now in range(10):
+            with patch("src.services.admission.time.monotonic", return_value=now):
+                controller.try_acquire()
+                controller.release(0.01, failed=True)
+
+        assert controller.limit == 2
+        assert controller.baseline_latency is None
+
+
+class TestAdmissionAPI:
+    """Test cases for load shedding on Temporal-calling routes."""
+
+    def test_shed_request_gets_503_with_retry_after(self, fastapi_client: TestClient):
+        """Test a request over the limit is shed before reaching Temporal."""
+        mock_client = AsyncMock()
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+        controller = fastapi_client.app.state.admission
+        controller.enabled = True
+        controller.in_flight = int(controller.limit)
+
+        response = fastapi_client.get("/api/v1/workflows/wf-1/status")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        mock_client.get_workflow_handle.assert_not_called()
+        # Health checks are never shed
+        assert fastapi_client.get("/api/v1/health/").status_code == 200
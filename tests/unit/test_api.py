@@ -2,14 +2,27 @@
 
 # ================================== Imports ================================== #
 # Standard Library
-from unittest.mock import patch, AsyncMock
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import patch, AsyncMock, MagicMock
 
 # Third-party
 import pytest
 from fastapi.testclient import TestClient
+from omegaconf import OmegaConf
+from temporalio.common import WorkflowIDConflictPolicy, WorkflowIDReusePolicy
+from temporalio.converter import DataConverter
+from temporalio.api.enums.v1 import BatchOperationState, BatchOperationType
+from temporalio.api.workflowservice.v1 import DescribeBatchOperationResponse
+from temporalio.client import WorkflowUpdateFailedError
+from temporalio.exceptions import ApplicationError, WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
 
 # Local Application
-from src.models.workflow import WorkflowRequest
+from src.models.workflow import WorkflowRequest, WorkflowResponse
+from src.services.temporal_service import get_temporal_client
+from src.services.visibility import CORRELATION_ID_ATTRIBUTE, USER_ID_ATTRIBUTE
 
 
 # ================================== Test Classes ============================= #
@@ -38,6 +51,17 @@ class TestWorkflowAPI:
         assert "database_connection" in data["checks"]
         assert "redis_connection" in data["checks"]
 
+    def test_temporal_client_stats(self, fastapi_client: TestClient):
+        """Test Temporal client pool diagnostics endpoint."""
+        response = fastapi_client.get("/api/v1/health/temporal")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "pool_size" in data
+        assert "connections" in data
+        assert data["embedded_worker"]["mode"] == "none"
+        assert data["embedded_worker"]["state"] == "idle"
+
     @patch("src.services.temporal_service.get_temporal_client")
     def test_start_workflow_success(self, mock_get_client, fastapi_client: TestClient):
         """Test successful workflow start."""
@@ -57,7 +81,7 @@ class TestWorkflowAPI:
 
         response = fastapi_client.post("/api/v1/workflows/start", json=request_data)
 
-        assert response.status_code == 200
+        assert response.status_code == 201
         data = response.json()
         assert data["workflow_id"] == "test-workflow-123"
         assert data["status"] == "STARTED"
@@ -167,3 +191,1028 @@ class TestWorkflowAPI:
         assert data["workflow_id"] == workflow_id
         assert data["result"] == mock_result
         assert data["status"] == "COMPLETED"
+
+
+class TestBatchWorkflowAPI:
+    """Test cases for batch workflow endpoints."""
+
+    def test_start_workflow_batch_preserves_order(self, fastapi_client: TestClient):
+        """Test batch start returns per-item results in request order."""
+
+        async def _start_workflow(workflow_type, **kwargs):
+            if kwargs["args"][0].get("fail"):
+                raise RuntimeError("boom")
+            handle = AsyncMock()
+            handle.id = kwargs["id"]
+            return handle
+
+        mock_client = AsyncMock()
+        mock_client.start_workflow.side_effect = _start_workflow
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        request_data = [
+            {"workflow_type": "simple_workflow", "input_data": {}, "user_id": "u1"},
+            {
+                "workflow_type": "simple_workflow",
+                "input_data": {"fail": True},
+                "user_id": "u2",
+            },
+            {"workflow_type": "simple_workflow", "input_data": {}, "user_id": "u3"},
+        ]
+        response = fastapi_client.post(
+            "/api/v1/workflows/start:batch", json=request_data
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["succeeded"] == 2
+        assert data["failed"] == 1
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert data["results"][0]["response"]["workflow_id"].startswith(
+            "simple_workflow_u1_"
+        )
+        assert data["results"][1]["success"] is False
+        assert data["results"][1]["error"]["error"] == "START_FAILED"
+        assert data["results"][2]["response"]["workflow_id"].startswith(
+            "simple_workflow_u3_"
+        )
+
+    def test_start_workflow_batch_too_large(self, fastapi_client: TestClient):
+        """Test batch start rejects batches above the configured limit."""
+        OmegaConf.update(fastapi_client.app.state.config, "api.batch.max_items", 1)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: AsyncMock()
+        )
+
+        item = {"workflow_type": "simple_workflow", "input_data": {}, "user_id": "u1"}
+        response = fastapi_client.post(
+            "/api/v1/workflows/start:batch", json=[item, item]
+        )
+
+        assert response.status_code == 413
+
+    def test_start_workflow_stream_acknowledges_each_line(
+        self, fastapi_client: TestClient
+    ):
+        """Test NDJSON streaming start acknowledges every line in order."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.id = "test-workflow-123"
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        item = {"workflow_type": "simple_workflow", "input_data": {}, "user_id": "u1"}
+        body = f"{json.dumps(item)}\nnot-json\n\n{json.dumps(item)}"
+        response = fastapi_client.post(
+            "/api/v1/workflows/start:stream",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        acks = [json.loads(line) for line in response.text.splitlines()]
+        assert [ack["line"] for ack in acks] == [1, 2, 4]
+        assert [ack["success"] for ack in acks] == [True, False, True]
+        assert acks[0]["workflow_id"] == "test-workflow-123"
+        assert mock_client.start_workflow.await_count == 2
+
+    def test_start_workflow_stream_requires_ndjson(self, fastapi_client: TestClient):
+        """Test NDJSON streaming start rejects other content types."""
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: AsyncMock()
+        )
+
+        response = fastapi_client.post("/api/v1/workflows/start:stream", json=[])
+
+        assert response.status_code == 415
+
+
+class TestWorkflowReadAPI:
+    """Test cases for cached workflow read endpoints."""
+
+    def test_get_workflow_result_served_from_cache(self, fastapi_client: TestClient):
+        """Test a completed result is fetched from Temporal only once."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.result.return_value = {"success": True}
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        first = fastapi_client.get("/api/v1/workflows/wf-1/result")
+        second = fastapi_client.get("/api/v1/workflows/wf-1/result")
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert first.json()["result"] == {"success": True}
+        assert mock_workflow_handle.result.await_count == 1
+
+        stats = fastapi_client.get("/api/v1/health/caches").json()
+        assert stats["result"]["hits"] == 1
+        assert stats["result"]["misses"] == 1
+
+    def test_get_workflow_result_returns_202_after_wait(
+        self, fastapi_client: TestClient
+    ):
+        """Test a result that is not ready within the wait returns 202."""
+        cancelled = []
+
+        async def _result():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.result.side_effect = _result
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.get("/api/v1/workflows/wf-1/result?wait=0.05")
+
+        assert response.status_code == 202
+        assert response.headers["Retry-After"] == "5"
+        assert response.json()["status"] == "RUNNING"
+        assert cancelled == [True]
+
+    def test_get_workflow_status_honours_if_none_match(
+        self, fastapi_client: TestClient
+    ):
+        """Test the status ETag is the run and status and a match returns 304."""
+        mock_status = MagicMock()
+        mock_status.status.name = "RUNNING"
+        mock_status.run_id = "run-1"
+        mock_status.start_time.isoformat.return_value = "2023-01-01T00:00:00"
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.return_value = mock_status
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        first = fastapi_client.get("/api/v1/workflows/wf-1/status")
+        second = fastapi_client.get(
+            "/api/v1/workflows/wf-1/status",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+        assert first.status_code == 200
+        assert first.headers["ETag"] == '"run-1.RUNNING"'
+        assert first.json()["run_id"] == "run-1"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == '"run-1.RUNNING"'
+
+    def test_get_workflow_status_maps_only_not_found_to_404(
+        self, fastapi_client: TestClient
+    ):
+        """Test a missing workflow is a 404 but an unavailable backend is a 5xx."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.side_effect = [
+            RPCError("workflow not found", RPCStatusCode.NOT_FOUND, b""),
+            RPCError("connection refused", RPCStatusCode.UNAVAILABLE, b""),
+        ]
+        mock_client = AsyncMock()
+        mock_client.namespace = "test"
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        missing = fastapi_client.get("/api/v1/workflows/wf-1/status")
+        unavailable = fastapi_client.get("/api/v1/workflows/wf-2/status")
+
+        assert missing.status_code == 404
+        assert unavailable.status_code == 500
+
+    def test_get_workflow_result_honours_if_none_match(
+        self, fastapi_client: TestClient
+    ):
+        """Test a result's content ETag matches weakly and stale tags get a body."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.result.return_value = {"success": True}
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        first = fastapi_client.get("/api/v1/workflows/wf-1/result")
+        etag = first.headers["ETag"]
+        matching = fastapi_client.get(
+            "/api/v1/workflows/wf-1/result",
+            headers={"If-None-Match": f'"stale", W/{etag}'},
+        )
+        stale = fastapi_client.get(
+            "/api/v1/workflows/wf-1/result", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert matching.status_code == 304
+        assert matching.headers["ETag"] == etag
+        assert stale.status_code == 200
+        assert stale.content == first.content
+
+    def test_get_workflow_result_hashes_the_body_once(self, fastapi_client: TestClient):
+        """Test polls of a cached result reuse its stored ETag."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.result.return_value = {"success": True}
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        with patch(
+            "src.api.routes.workflows.content_etag", return_value='"tag"'
+        ) as content_etag:
+            first = fastapi_client.get("/api/v1/workflows/wf-1/result")
+            second = fastapi_client.get(
+                "/api/v1/workflows/wf-1/result", headers={"If-None-Match": '"tag"'}
+            )
+
+        assert first.headers["ETag"] == '"tag"'
+        assert second.status_code == 304
+        content_etag.assert_called_once()
+
+    def test_stream_workflow_events(self, fastapi_client: TestClient):
+        """Test the SSE endpoint streams status and result, then ends."""
+        mock_status = MagicMock()
+        mock_status.status.name = "COMPLETED"
+        mock_status.start_time.isoformat.return_value = "2023-01-01T00:00:00"
+        mock_client = AsyncMock()
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.return_value = mock_status
+        mock_workflow_handle.result.return_value = {"success": True}
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.get("/api/v1/workflows/wf-1/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.split(": ", 1)[1]
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events == ["status", "result", "end"]
+
+
+class TestSignalWithStartAPI:
+    """Test cases for the signal-with-start endpoint."""
+
+    def test_signal_with_start_is_one_atomic_call(self, fastapi_client: TestClient):
+        """Test the start and the signal go out as one signal-with-start call."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = MagicMock()
+        mock_workflow_handle.id = "orders-42"
+        mock_workflow_handle.result_run_id = "run-1"
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/signal-with-start",
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+                "workflow_id": "orders-42",
+                "signal_data": {"event": "paid"},
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "SIGNALED"
+        assert response.json()["run_id"] == "run-1"
+        mock_client.start_workflow.assert_awaited_once()
+        kwargs = mock_client.start_workflow.await_args.kwargs
+        assert kwargs["id"] == "orders-42"
+        assert kwargs["start_signal"] == "workflow_signal"
+        assert kwargs["start_signal_args"] == [{"event": "paid"}]
+        mock_client.get_workflow_handle.assert_not_called()
+
+    def test_new_run_drops_previous_run_from_read_caches(
+        self, fastapi_client: TestClient
+    ):
+        """Test starting a new run under a closed ID clears its cached reads."""
+        mock_client = AsyncMock()
+        mock_workflow_handle = MagicMock()
+        mock_workflow_handle.id = "orders-42"
+        mock_workflow_handle.result_run_id = "run-2"
+        mock_workflow_handle.first_execution_run_id = "run-2"
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+        state = fastapi_client.app.state
+        status_cache = state.status_cache
+
+        async def _completed():
+            return WorkflowResponse(
+                workflow_id="orders-42",
+                status="COMPLETED",
+                message="done",
+                created_at="2023-01-01T00:00:00",
+                run_id="run-1",
+            )
+
+        async def _seed():
+            await status_cache.get_or_load("orders-42", _completed)
+            await state.result_cache.put(
+                "orders-42", b'{"result": "previous"}', '"previous"'
+            )
+
+        asyncio.run(_seed())
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/signal-with-start",
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+                "workflow_id": "orders-42",
+                "signal_data": {"event": "paid"},
+            },
+        )
+
+        assert response.status_code == 200
+        assert status_cache.stats()["entries"] == 0
+        assert state.result_cache.stats()["entries"] == 0
+
+
+class TestExecuteWorkflowAPI:
+    """Test cases for the synchronous execute endpoint."""
+
+    def test_result_is_returned_from_one_update_with_start(
+        self, fastapi_client: TestClient
+    ):
+        """Test the workflow is started and its result returned in one call."""
+        result = {"success": True, "result_data": {"value": "A"}}
+        mock_client = AsyncMock()
+        mock_client.execute_update_with_start_workflow.return_value = result
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/execute",
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+                "idempotency_key": "order-42",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["status"], data["result"]) == ("COMPLETED", result)
+        call = mock_client.execute_update_with_start_workflow.await_args
+        assert call.args == ("await_result",)
+        operation = call.kwargs["start_workflow_operation"]
+        assert operation._start_workflow_input.id == data["workflow_id"]
+        assert (
+            operation._start_workflow_input.id_conflict_policy
+            == WorkflowIDConflictPolicy.USE_EXISTING
+        )
+        mock_client.start_workflow.assert_not_called()
+
+        # The result is cached for later result reads
+        mock_client.get_workflow_handle = MagicMock()
+        cached = fastapi_client.get(f"/api/v1/workflows/{data['workflow_id']}/result")
+        assert cached.json()["result"] == result
+        mock_client.get_workflow_handle.assert_not_called()
+
+    def test_deadline_returns_accepted_with_result_location(
+        self, fastapi_client: TestClient
+    ):
+        """Test a result not ready by the deadline yields 202 and a Location."""
+
+        async def _slow_update(update, start_workflow_operation):
+            # The client resolves the start handle once the start is acknowledged
+            start_workflow_operation._workflow_handle.set_result(MagicMock())
+            await asyncio.sleep(10)
+
+        mock_client = AsyncMock()
+        mock_client.execute_update_with_start_workflow.side_effect = _slow_update
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/execute",
+            params={"wait": 0.01},
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+            },
+        )
+
+        assert response.status_code == 202
+        workflow_id = response.json()["workflow_id"]
+        assert response.headers["location"].endswith(f"/{workflow_id}/result")
+        assert "retry-after" in response.headers
+
+    def test_deadline_before_start_acknowledged_returns_504(
+        self, fastapi_client: TestClient
+    ):
+        """Test no 202 is promised for a start Temporal never acknowledged."""
+
+        async def _unacknowledged(update, start_workflow_operation):
+            await asyncio.sleep(10)
+
+        mock_client = AsyncMock()
+        mock_client.execute_update_with_start_workflow.side_effect = _unacknowledged
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/execute",
+            params={"wait": 0.01},
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+            },
+        )
+
+        assert response.status_code == 504
+        assert "location" not in response.headers
+
+    def test_keyed_retry_after_completion_returns_the_result(
+        self, fastapi_client: TestClient
+    ):
+        """Test a keyed retry of a closed run gets its result instead of 409."""
+        mock_client = AsyncMock()
+        mock_client.execute_update_with_start_workflow.side_effect = (
+            WorkflowAlreadyStartedError("wf", "SimpleWorkflow")
+        )
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.result.return_value = {"success": True}
+        mock_client.get_workflow_handle = MagicMock(return_value=mock_workflow_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+        payload = {
+            "workflow_type": "SimpleWorkflow",
+            "input_data": {"request_id": "r-1"},
+            "user_id": "user-1",
+            "idempotency_key": "order-43",
+        }
+
+        first = fastapi_client.post("/api/v1/workflows/execute", json=payload)
+        second = fastapi_client.post("/api/v1/workflows/execute", json=payload)
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["result"] == second.json()["result"] == {"success": True}
+        # The retry is answered from the result cache
+        mock_client.execute_update_with_start_workflow.assert_awaited_once()
+
+    def test_rejected_update_returns_422(self, fastapi_client: TestClient):
+        """Test an update rejected by the workflow's validator is a 422."""
+        mock_client = AsyncMock()
+        mock_client.execute_update_with_start_workflow.side_effect = (
+            WorkflowUpdateFailedError(
+                ApplicationError("Input validation failed: Missing required field")
+            )
+        )
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/execute",
+            json={
+                "workflow_type": "SimpleWorkflow",
+                "input_data": {"request_id": "r-1"},
+                "user_id": "user-1",
+            },
+        )
+
+        assert response.status_code == 422
+        assert "Missing required field" in response.json()["message"]
+
+
+class TestIdempotentStartAPI:
+    """Test cases for idempotent workflow starts."""
+
+    def test_retry_with_same_key_reuses_response(self, fastapi_client: TestClient):
+        """Test a retried keyed start is answered without another Temporal RPC."""
+
+        async def _start_workflow(workflow_type, **kwargs):
+            handle = AsyncMock()
+            handle.id = kwargs["id"]
+            return handle
+
+        mock_client = AsyncMock()
+        mock_client.start_workflow.side_effect = _start_workflow
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        request_data = {
+            "workflow_type": "simple_workflow",
+            "input_data": {"required_field": "test_value"},
+            "user_id": "test_user",
+            "idempotency_key": "retry-me",
+        }
+        first = fastapi_client.post("/api/v1/workflows/start", json=request_data)
+        second = fastapi_client.post("/api/v1/workflows/start", json=request_data)
+
+        assert first.status_code == 201
+        assert first.json()["status"] == "STARTED"
+        assert second.status_code == 200
+        assert second.json()["status"] == "ALREADY_STARTED"
+        assert second.json()["workflow_id"] == first.json()["workflow_id"]
+        assert first.json()["workflow_id"].startswith("simple_workflow_test_user_")
+        mock_client.start_workflow.assert_awaited_once()
+        kwargs = mock_client.start_workflow.await_args.kwargs
+        assert kwargs["id_reuse_policy"] == WorkflowIDReusePolicy.REJECT_DUPLICATE
+        assert kwargs["id_conflict_policy"] == WorkflowIDConflictPolicy.USE_EXISTING
+
+    def test_key_of_closed_workflow_reports_already_started(
+        self, fastapi_client: TestClient
+    ):
+        """Test a key already used by a closed run is reported, not failed."""
+        mock_client = AsyncMock()
+        mock_client.start_workflow.side_effect = WorkflowAlreadyStartedError(
+            "wf", "simple_workflow"
+        )
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        request_data = {
+            "workflow_type": "simple_workflow",
+            "input_data": {},
+            "user_id": "test_user",
+            "idempotency_key": "used-before",
+        }
+        response = fastapi_client.post("/api/v1/workflows/start", json=request_data)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ALREADY_STARTED"
+
+    def test_key_of_running_workflow_reports_reuse(self, fastapi_client: TestClient):
+        """Test a key attached to an open run by USE_EXISTING is not a new start."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.id = "wf"
+        mock_workflow_handle._start_workflow_response.started = False
+        mock_client = AsyncMock()
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        request_data = {
+            "workflow_type": "simple_workflow",
+            "input_data": {},
+            "user_id": "test_user",
+            "idempotency_key": "in-flight",
+        }
+        response = fastapi_client.post("/api/v1/workflows/start", json=request_data)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ALREADY_STARTED"
+
+
+class TestBulkStatusAPI:
+    """Test cases for the bulk status endpoint."""
+
+    def test_bulk_status_uses_visibility_then_describe(
+        self, fastapi_client: TestClient
+    ):
+        """Test IDs missing from visibility fall back to describe."""
+
+        def _execution(workflow_id: str, status: str) -> MagicMock:
+            execution = MagicMock()
+            execution.id = workflow_id
+            execution.run_id = f"{workflow_id}-run"
+            execution.status.name = status
+            execution.start_time = datetime(2023, 1, 1)
+            execution.close_time = None
+            return execution
+
+        async def _list_workflows(query):
+            for execution in (_execution("wf-1", "RUNNING"),):
+                yield execution
+
+        async def _describe_wf2():
+            return _execution("wf-2", "COMPLETED")
+
+        async def _describe_missing():
+            raise RuntimeError("not found")
+
+        handles = {
+            "wf-2": MagicMock(describe=_describe_wf2),
+            "wf-3": MagicMock(describe=_describe_missing),
+        }
+        mock_client = MagicMock()
+        mock_client.list_workflows = MagicMock(side_effect=_list_workflows)
+        mock_client.get_workflow_handle = MagicMock(side_effect=handles.__getitem__)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/status:bulk",
+            json={"workflow_ids": ["wf-1", "wf-2", "wf-3", "wf-1"]},
+        )
+
+        assert response.status_code == 200
+        items = {
+            item["workflow_id"]: item
+            for item in map(json.loads, response.text.splitlines())
+        }
+        assert set(items) == {"wf-1", "wf-2", "wf-3"}
+        assert items["wf-1"]["source"] == "visibility"
+        assert items["wf-1"]["status"] == "RUNNING"
+        assert items["wf-2"]["source"] == "describe"
+        assert items["wf-2"]["status"] == "COMPLETED"
+        assert items["wf-3"]["found"] is False
+        mock_client.list_workflows.assert_called_once_with(
+            "WorkflowId IN ('wf-1', 'wf-2', 'wf-3')"
+        )
+
+
+class TestBatchSignalAPI:
+    """Test cases for the batch signal endpoint."""
+
+    def test_client_side_fan_out_reports_each_workflow(
+        self, fastapi_client: TestClient
+    ):
+        """Test each listed workflow is signalled once and reported on its own."""
+        signalled = []
+
+        def _handle(workflow_id: str) -> MagicMock:
+            async def _signal(name, payload):
+                if workflow_id == "wf-missing":
+                    raise RuntimeError("workflow not found")
+                signalled.append((workflow_id, name, payload))
+
+            return MagicMock(signal=_signal)
+
+        mock_client = MagicMock()
+        mock_client.get_workflow_handle = MagicMock(side_effect=_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/signal:batch",
+            json={
+                "workflow_ids": ["wf-1", "wf-missing", "wf-1", "wf-2"],
+                "signal_data": {"event": "deploy"},
+            },
+        )
+
+        assert response.status_code == 200
+        items = {
+            item["workflow_id"]: item
+            for item in map(json.loads, response.text.splitlines())
+        }
+        assert set(items) == {"wf-1", "wf-2", "wf-missing"}
+        assert items["wf-1"]["success"] and items["wf-2"]["success"]
+        assert items["wf-missing"]["error"] == "workflow not found"
+        assert sorted(signalled) == [
+            ("wf-1", "workflow_signal", {"event": "deploy"}),
+            ("wf-2", "workflow_signal", {"event": "deploy"}),
+        ]
+
+    def test_server_side_delegates_query_to_batch_job(self, fastapi_client: TestClient):
+        """Test server_side starts one Temporal batch job for the query."""
+        mock_client = MagicMock()
+        mock_client.namespace = "test"
+        mock_client.identity = "api"
+        mock_client.data_converter = DataConverter.default
+        mock_client.workflow_service.start_batch_operation = AsyncMock()
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/signal:batch",
+            json={
+                "query": "WorkflowType = 'SimpleWorkflow'",
+                "signal_data": {"event": "deploy"},
+                "server_side": True,
+            },
+        )
+
+        assert response.status_code == 202
+        assert response.json()["job_id"].startswith("api-batch-")
+        request = mock_client.workflow_service.start_batch_operation.await_args.args[0]
+        assert request.job_id == response.json()["job_id"]
+        assert request.visibility_query == "WorkflowType = 'SimpleWorkflow'"
+        assert request.signal_operation.signal == "workflow_signal"
+        mock_client.get_workflow_handle.assert_not_called()
+
+    def test_requires_exactly_one_target(self, fastapi_client: TestClient):
+        """Test requests with both or neither of IDs and query are rejected."""
+        fastapi_client.app.dependency_overrides[get_temporal_client] = MagicMock
+        both = fastapi_client.post(
+            "/api/v1/workflows/signal:batch",
+            json={"workflow_ids": ["wf-1"], "query": "WorkflowType = 'x'"},
+        )
+        neither = fastapi_client.post("/api/v1/workflows/signal:batch", json={})
+
+        assert both.status_code == 422
+        assert neither.status_code == 422
+
+
+class TestListWorkflowsAPI:
+    """Test cases for the workflow listing endpoint."""
+
+    def test_list_workflows_paginates_with_cursor(self, fastapi_client: TestClient):
+        """Test listing returns a cursor that fetches the next page."""
+        execution = MagicMock()
+        execution.id = "wf-1"
+        execution.run_id = "run-1"
+        execution.workflow_type = "simple_workflow"
+        execution.status.name = "RUNNING"
+        execution.start_time = datetime(2023, 1, 1)
+        execution.close_time = None
+
+        def _list_workflows(query, page_size, next_page_token):
+            executions = MagicMock()
+            executions.fetch_next_page = AsyncMock()
+            executions.current_page = [execution]
+            executions.next_page_token = None if next_page_token else b"page-2"
+            return executions
+
+        mock_client = MagicMock()
+        mock_client.list_workflows = MagicMock(side_effect=_list_workflows)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        first = fastapi_client.get(
+            "/api/v1/workflows",
+            params={"workflow_type": "simple_workflow", "page_size": 5000},
+        )
+        assert first.status_code == 200
+        data = first.json()
+        assert data["workflows"][0]["workflow_id"] == "wf-1"
+        assert data["next_cursor"]
+        mock_client.list_workflows.assert_called_with(
+            "WorkflowType = 'simple_workflow'", page_size=1000, next_page_token=None
+        )
+
+        second = fastapi_client.get(
+            "/api/v1/workflows",
+            params={"workflow_type": "simple_workflow", "cursor": data["next_cursor"]},
+        )
+        assert second.status_code == 200
+        assert second.json()["next_cursor"] is None
+        assert mock_client.list_workflows.call_args.kwargs["next_page_token"] == (
+            b"page-2"
+        )
+
+    def test_list_workflows_rejects_foreign_cursor(self, fastapi_client: TestClient):
+        """Test a cursor cannot be replayed against different filters."""
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: MagicMock()
+        )
+
+        response = fastapi_client.get(
+            "/api/v1/workflows",
+            params={"status": "RUNNING", "cursor": "bm90LWEtY3Vyc29y"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestSearchAttributesAPI:
+    """Test cases for search attributes indexed at start time."""
+
+    def test_start_workflow_indexes_user_and_correlation_id(
+        self, fastapi_client: TestClient
+    ):
+        """Test starts attach the UserId and CorrelationId search attributes."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.id = "test_workflow_123"
+        mock_client = AsyncMock()
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+        fastapi_client.app.state.workflow_starter.index_search_attributes = True
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/start",
+            json={
+                "workflow_type": "simple_workflow",
+                "input_data": {"correlation_id": "corr-1"},
+                "user_id": "test_user",
+            },
+        )
+
+        assert response.status_code == 201
+        kwargs = mock_client.start_workflow.await_args.kwargs
+        assert kwargs["search_attributes"].get(USER_ID_ATTRIBUTE) == "test_user"
+        assert kwargs["search_attributes"].get(CORRELATION_ID_ATTRIBUTE) == "corr-1"
+
+    def test_start_workflow_omits_search_attributes_by_default(
+        self, fastapi_client: TestClient
+    ):
+        """Test starts work on namespaces without the custom attributes."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.id = "test_workflow_123"
+        mock_client = AsyncMock()
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/start",
+            json={
+                "workflow_type": "simple_workflow",
+                "input_data": {},
+                "user_id": "test_user",
+            },
+        )
+
+        assert response.status_code == 201
+        assert "search_attributes" not in mock_client.start_workflow.await_args.kwargs
+
+    def test_list_user_workflows_queries_user_id(self, fastapi_client: TestClient):
+        """Test the user listing filters on the UserId search attribute."""
+        executions = MagicMock()
+        executions.fetch_next_page = AsyncMock()
+        executions.current_page = []
+        executions.next_page_token = None
+        mock_client = MagicMock()
+        mock_client.list_workflows = MagicMock(return_value=executions)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.get(
+            "/api/v1/users/test_user/workflows", params={"status": "RUNNING"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"workflows": [], "next_cursor": None}
+        mock_client.list_workflows.assert_called_with(
+            "ExecutionStatus = 'Running' AND UserId = 'test_user'",
+            page_size=100,
+            next_page_token=None,
+        )
+
+
+class TestBulkStopAPI:
+    """Test cases for the bulk cancel and terminate endpoints."""
+
+    def test_falls_back_to_api_job_when_batch_unavailable(
+        self, fastapi_client: TestClient
+    ):
+        """Test an API-side job runs when Temporal refuses the batch job."""
+        terminated = []
+
+        def _handle(workflow_id: str) -> MagicMock:
+            async def _terminate(reason):
+                if workflow_id == "wf-missing":
+                    raise RuntimeError("workflow not found")
+                terminated.append((workflow_id, reason))
+
+            return MagicMock(terminate=_terminate)
+
+        mock_client = MagicMock()
+        mock_client.namespace = "test"
+        mock_client.identity = "api"
+        mock_client.workflow_service.start_batch_operation = AsyncMock(
+            side_effect=RPCError(
+                "batch operations disabled", RPCStatusCode.PERMISSION_DENIED, b""
+            )
+        )
+        mock_client.get_workflow_handle = MagicMock(side_effect=_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        with fastapi_client:
+            response = fastapi_client.post(
+                "/api/v1/workflows/terminate:batch",
+                json={
+                    "workflow_ids": ["wf-1", "wf-missing", "wf-2", "wf-1"],
+                    "reason": "cleanup",
+                },
+            )
+            assert response.status_code == 202
+            job = response.json()
+            assert job["job_id"].startswith("api-bulk-")
+            assert not job["server_side"]
+            assert job["total"] == 3
+            assert response.headers["location"].endswith(job["job_id"])
+
+            for _ in range(100):
+                job = fastapi_client.get(response.headers["location"]).json()
+                if job["state"] != "RUNNING":
+                    break
+
+        assert job["state"] == "COMPLETED"
+        assert (job["completed"], job["failed"]) == (2, 1)
+        assert job["errors"][0]["workflow_id"] == "wf-missing"
+        assert sorted(terminated) == [("wf-1", "cleanup"), ("wf-2", "cleanup")]
+
+    def test_api_job_stops_every_match_of_a_multi_page_query(
+        self, fastapi_client: TestClient
+    ):
+        """Test stopping matches does not make later query pages skip any."""
+        running = {f"wf-{index}" for index in range(5)}
+
+        def _list_workflows(query):
+            async def _pages():
+                # Offset paging over the live result set, like page tokens
+                offset = 0
+                while page := sorted(running)[offset : offset + 2]:
+                    for workflow_id in page:
+                        yield MagicMock(id=workflow_id)
+                    offset += 2
+                    await asyncio.sleep(0)
+
+            return _pages()
+
+        def _handle(workflow_id: str) -> MagicMock:
+            async def _cancel():
+                running.discard(workflow_id)
+
+            return MagicMock(cancel=_cancel)
+
+        mock_client = MagicMock()
+        mock_client.identity = "api"
+        mock_client.list_workflows = MagicMock(side_effect=_list_workflows)
+        mock_client.get_workflow_handle = MagicMock(side_effect=_handle)
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        with fastapi_client:
+            response = fastapi_client.post(
+                "/api/v1/workflows/cancel:batch",
+                json={"query": "ExecutionStatus = 'Running'", "server_side": False},
+            )
+            assert response.status_code == 202
+            for _ in range(100):
+                job = fastapi_client.get(response.headers["location"]).json()
+                if job["state"] != "RUNNING":
+                    break
+
+        assert (job["state"], job["total"], job["completed"]) == ("COMPLETED", 5, 5)
+        assert running == set()
+
+    def test_server_side_cancel_is_polled_from_temporal(
+        self, fastapi_client: TestClient
+    ):
+        """Test a Temporal batch job is started and its progress read back."""
+        description = DescribeBatchOperationResponse(
+            state=BatchOperationState.BATCH_OPERATION_STATE_RUNNING,
+            operation_type=BatchOperationType.BATCH_OPERATION_TYPE_CANCEL,
+            total_operation_count=10,
+            complete_operation_count=4,
+            failure_operation_count=1,
+        )
+        description.start_time.FromDatetime(datetime(2023, 1, 1))
+        mock_client = MagicMock()
+        mock_client.namespace = "test"
+        mock_client.identity = "api"
+        mock_client.workflow_service.start_batch_operation = AsyncMock()
+        mock_client.workflow_service.describe_batch_operation = AsyncMock(
+            return_value=description
+        )
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+
+        response = fastapi_client.post(
+            "/api/v1/workflows/cancel:batch",
+            json={"query": "WorkflowType = 'SimpleWorkflow'"},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        request = mock_client.workflow_service.start_batch_operation.await_args.args[0]
+        assert request.job_id == job_id
+        assert request.HasField("cancellation_operation")
+
+        job = fastapi_client.get(f"/api/v1/workflows/batch-jobs/{job_id}").json()
+        assert job["server_side"]
+        assert (job["state"], job["operation"]) == ("RUNNING", "cancel")
+        assert (job["total"], job["completed"], job["failed"]) == (10, 4, 1)
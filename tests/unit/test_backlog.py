@@ -0,0 +1,114 @@
+"""Unit tests for task queue backlog backpressure."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-party
+import pytest
+from fastapi.testclient import TestClient
+from google.protobuf.duration_pb2 import Duration
+from temporalio.api.taskqueue.v1 import PollerInfo, TaskQueueStats
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueResponse
+
+# Local Application
+from src.services.backlog import (
+    QueueSaturatedError,
+    TaskQueueBacklogMonitor,
+    TaskQueueReading,
+)
+from src.services.temporal_service import get_temporal_client
+
+
+# ================================== Helper Functions ========================= #
+def _saturated_monitor(backlog_count: int) -> TaskQueueBacklogMonitor:
+    """Build a monitor holding a fresh reading with the given backlog."""
+    monitor = TaskQueueBacklogMonitor(
+        low_priority_max_backlog=10, normal_priority_max_backlog=100
+    )
+    monitor.reading = TaskQueueReading(
+        backlog_count=backlog_count,
+        backlog_age_seconds=1.0,
+        poller_count=1,
+        sampled_at=100.0,
+    )
+    return monitor
+
+
+# ================================== Test Classes ============================= #
+class TestTaskQueueBacklogMonitor:
+    """Test cases for the backlog monitor."""
+
+    @pytest.mark.asyncio
+    async def test_sample_reads_backlog_and_pollers(self):
+        """Test a sample caches backlog count, age and poller count."""
+        client = MagicMock()
+        client.workflow_service.describe_task_queue = AsyncMock(
+            return_value=DescribeTaskQueueResponse(
+                pollers=[PollerInfo(identity="w1"), PollerInfo(identity="w2")],
+                stats=TaskQueueStats(
+                    approximate_backlog_count=42,
+                    approximate_backlog_age=Duration(seconds=3),
+                ),
+            )
+        )
+        monitor = TaskQueueBacklogMonitor(task_queue="q")
+
+        reading = await monitor.sample(client)
+
+        assert (reading.backlog_count, reading.poller_count) == (42, 2)
+        assert reading.backlog_age_seconds == 3.0
+        request = client.workflow_service.describe_task_queue.await_args.args[0]
+        assert request.task_queue.name == "q"
+        assert request.report_stats
+
+    def test_thresholds_per_priority(self):
+        """Test lower priorities are rejected at lower backlogs."""
+        monitor = _saturated_monitor(backlog_count=50)
+
+        with patch("src.services.backlog.time.monotonic", return_value=101.0):
+            with pytest.raises(QueueSaturatedError):
+                monitor.check("low")
+            monitor.check("normal")
+            monitor.check("high")
+        assert monitor.stats()["rejected"] == 1
+
+    def test_stale_reading_admits(self):
+        """Test starts are admitted once the reading is stale."""
+        monitor = _saturated_monitor(backlog_count=500)
+
+        with patch("src.services.backlog.time.monotonic", return_value=1000.0):
+            monitor.check("low")
+
+
+class TestBackpressureAPI:
+    """Test cases for backlog backpressure on the start endpoint."""
+
+    def test_start_rejected_while_backlogged(self, fastapi_client: TestClient):
+        """Test saturated starts get 503 and high priority still starts."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.id = "test_workflow_123"
+        mock_client = AsyncMock()
+        mock_client.start_workflow.return_value = mock_workflow_handle
+        fastapi_client.app.dependency_overrides[get_temporal_client] = (
+            lambda: mock_client
+        )
+        fastapi_client.app.state.workflow_starter.backlog_monitor = _saturated_monitor(
+            backlog_count=500
+        )
+        request_data = {
+            "workflow_type": "simple_workflow",
+            "input_data": {},
+            "user_id": "test_user",
+        }
+
+        with patch("src.services.backlog.time.monotonic", return_value=101.0):
+            rejected = fastapi_client.post("/api/v1/workflows/start", json=request_data)
+            accepted = fastapi_client.post(
+                "/api/v1/workflows/start", json={**request_data, "priority": "high"}
+            )
+
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "5"
+        assert accepted.status_code == 201
+        mock_client.start_workflow.assert_awaited_once()
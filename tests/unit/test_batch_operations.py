@@ -0,0 +1,110 @@
+"""Unit tests for bulk workflow operations."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+
+# Third-party
+import pytest
+
+# Local Application
+from src.models.workflow import BatchOperationItem
+from src.services.batch_operations import BulkJobRegistry, run_bounded
+
+
+# ================================== Test Classes ============================= #
+class TestRunBounded:
+    """Test cases for run_bounded."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_ids_pulled_lazily(self):
+        """Test no more calls run at once than allowed and every ID is handled."""
+        in_flight = 0
+        peak = 0
+        pulled = 0
+        finished = 0
+
+        async def _ids():
+            nonlocal pulled
+            for index in range(20):
+                pulled += 1
+                # IDs are only pulled once a call slot is free
+                assert pulled - finished <= 4
+                yield f"wf-{index}"
+
+        async def _call(workflow_id: str) -> str:
+            nonlocal in_flight, peak, finished
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            finished += 1
+            return workflow_id
+
+        results = [item async for item in run_bounded(_ids(), _call, 4)]
+
+        assert sorted(results) == sorted(f"wf-{index}" for index in range(20))
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_pending_calls(self):
+        """Test abandoning the results cancels the calls still running."""
+        cancelled = []
+
+        async def _ids():
+            for index in range(5):
+                yield f"wf-{index}"
+
+        async def _call(workflow_id: str) -> str:
+            try:
+                if workflow_id != "wf-0":
+                    await asyncio.sleep(10)
+                return workflow_id
+            except asyncio.CancelledError:
+                cancelled.append(workflow_id)
+                raise
+
+        results = run_bounded(_ids(), _call, 5)
+        assert await results.__anext__() == "wf-0"
+        await results.aclose()
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == ["wf-1", "wf-2", "wf-3", "wf-4"]
+
+
+class TestBulkJobRegistry:
+    """Test cases for the bulk job registry."""
+
+    @pytest.mark.asyncio
+    async def test_local_job_progress_and_eviction(self):
+        """Test a local job records outcomes and old finished jobs are forgotten."""
+        registry = BulkJobRegistry(max_jobs=2, max_errors=1)
+        oldest = registry.record_server_job("api-batch-1", "cancel")
+
+        async def _ids():
+            for index in range(4):
+                yield f"wf-{index}"
+
+        async def _call(workflow_id: str) -> BatchOperationItem:
+            return BatchOperationItem(
+                workflow_id=workflow_id,
+                success=workflow_id in ("wf-0", "wf-1"),
+                error=None if workflow_id in ("wf-0", "wf-1") else "failed",
+            )
+
+        job = registry.start_local_job("terminate", _ids(), _call)
+        await job.task
+
+        assert (job.state, job.total, job.completed, job.failed) == (
+            "COMPLETED",
+            4,
+            2,
+            2,
+        )
+        assert len(job.errors) == 1
+        assert registry.get(oldest.job_id) is oldest
+
+        registry.record_server_job("api-batch-2", "cancel")
+
+        assert registry.get(oldest.job_id) is None
+        assert registry.get(job.job_id) is job
@@ -0,0 +1,156 @@
+"""Unit tests for negotiated response compression."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import zlib
+
+# Third-party
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+# Local Application
+from src.api.middleware import CompressionMiddleware
+from src.utils.compression import GZIP_WBITS, Compressor, negotiate_encoding
+
+# ================================== Constants ================================ #
+LARGE_BODY = b'{"value": "repetitive"}' * 1000
+
+
+# ================================== Helpers ================================== #
+def _build_client(**middleware_kwargs) -> TestClient:
+    """Create a test client for an app with a few representative routes."""
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> Response:
+        return Response(
+            LARGE_BODY, media_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    @app.get("/small")
+    async def small() -> Response:
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/events")
+    async def events() -> Response:
+        return Response(LARGE_BODY, media_type="text/event-stream")
+
+    app.add_middleware(CompressionMiddleware, **middleware_kwargs)
+    return TestClient(app)
+
+
+async def _collect_messages(middleware: CompressionMiddleware, accept: bytes):
+    """Run the middleware directly and return the messages it sends."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept)],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+# ================================== Test Classes ============================= #
+class TestNegotiateEncoding:
+    """Test cases for Accept-Encoding negotiation."""
+
+    def test_quality_values_wildcard_and_preference(self):
+        """Test q-values win, q=0 refuses, and ties follow server preference."""
+        assert negotiate_encoding("gzip, deflate, zstd") == "zstd"
+        assert negotiate_encoding("gzip;q=1.0, zstd;q=0.5") == "gzip"
+        assert negotiate_encoding("*;q=0.5, zstd;q=0", ("zstd", "gzip")) == "gzip"
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("") is None
+
+
+class TestCompressionMiddleware:
+    """Test cases for the compression middleware."""
+
+    def test_large_bodies_are_compressed(self):
+        """Test a large body is gzipped with Vary, Content-Length and a weak ETag."""
+        client = _build_client(encodings=["gzip"])
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+        assert response.content == LARGE_BODY
+
+    def test_small_excluded_and_unaccepted_bodies_pass_through(self):
+        """Test small bodies, event streams and identity requests are untouched."""
+        client = _build_client(encodings=["gzip"])
+
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        events = client.get("/events", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        for response in (small, events, identity):
+            assert "content-encoding" not in response.headers
+        assert identity.content == LARGE_BODY
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_streamed_in_chunks(self):
+        """Test a body over chunk_size is sent as several compressed messages."""
+        middleware = CompressionMiddleware(
+            Response(LARGE_BODY), chunk_size=4096, encodings=["deflate"]
+        )
+
+        messages = await _collect_messages(middleware, b"deflate")
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"content-encoding"] == b"deflate"
+        assert b"content-length" not in headers
+        bodies = [m["body"] for m in messages[1:]]
+        assert len(bodies) > 1
+        assert zlib.decompress(b"".join(bodies)) == LARGE_BODY
+
+    @pytest.mark.asyncio
+    async def test_streamed_messages_are_flushed(self):
+        """Test each streamed message can be decoded before the next arrives."""
+
+        async def lines():
+            for i in range(3):
+                yield b'{"line": %d}\n' % i * 100
+
+        middleware = CompressionMiddleware(
+            StreamingResponse(lines()), encodings=["gzip"]
+        )
+
+        messages = await _collect_messages(middleware, b"gzip")
+
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        decoded = [
+            decompressor.decompress(m["body"])
+            for m in messages[1:]
+            if m.get("more_body")
+        ]
+        assert [d for d in decoded if d] == [
+            b'{"line": %d}\n' % i * 100 for i in range(3)
+        ]
+
+
+class TestCompressor:
+    """Test cases for the compressor base class."""
+
+    def test_incomplete_codec_cannot_be_created(self):
+        """Test a codec missing finish() fails when created, not mid-response."""
+
+        class _Incomplete(Compressor):
+            def compress(self, data: bytes, flush: bool = False) -> bytes:
+                return data
+
+        with pytest.raises(TypeError):
+            _Incomplete()
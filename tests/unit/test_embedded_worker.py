@@ -0,0 +1,163 @@
+"""Unit tests for the embedded Temporal worker and loop lag monitoring."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-party
+import pytest
+
+# Local Application
+from src.utils.loop_lag import LoopLagMonitor
+from src.workers.embedded import (
+    MODE_DEDICATED_THREAD,
+    MODE_SAME_LOOP,
+    STATE_CONNECTING,
+    STATE_RUNNING,
+    EmbeddedWorker,
+)
+
+
+# ================================== Helper Classes =========================== #
+class _FakeWorker:
+    """Stand-in for ``temporalio.worker.Worker`` that runs until shut down."""
+
+    def __init__(self) -> None:
+        self.loop = None
+        self.started = threading.Event()
+        self._stopped = None
+
+    async def run(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self.started.set()
+        await self._stopped.wait()
+
+    async def shutdown(self) -> None:
+        self._stopped.set()
+
+
+# ================================== Test Classes ============================= #
+class TestLoopLagMonitor:
+    """Test cases for loop lag measurement."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_as_lag(self):
+        """Test a callback blocking the loop is reported as lag."""
+        monitor = LoopLagMonitor("test", interval_seconds=0.01)
+        monitor.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert monitor.stats()["max_lag_ms"] >= 30
+        assert monitor.samples >= 1
+
+
+class TestEmbeddedWorker:
+    """Test cases for hosting the worker inside the API process."""
+
+    def test_unknown_mode_is_rejected(self):
+        """Test an unknown mode fails fast."""
+        with pytest.raises(ValueError):
+            EmbeddedWorker(MagicMock(), mode="separate_galaxy")
+
+    @pytest.mark.asyncio
+    async def test_same_loop_shares_api_client_and_loop(self):
+        """Test same_loop runs the worker on the API loop with the pooled client."""
+        fake_worker = _FakeWorker()
+        client = MagicMock()
+        client_manager = MagicMock()
+        client_manager.get_client = AsyncMock(return_value=client)
+        embedded = EmbeddedWorker(MagicMock(), mode=MODE_SAME_LOOP)
+
+        with patch(
+            "src.workers.embedded.create_temporal_worker", return_value=fake_worker
+        ) as create_worker:
+            await embedded.start(client_manager)
+            await asyncio.sleep(0)
+            assert embedded.is_running
+            assert create_worker.call_args.args[0] is client
+            assert fake_worker.loop is asyncio.get_running_loop()
+
+            await embedded.stop()
+
+        assert not embedded.is_running
+        assert embedded.stats()["loop_lag"] is None
+
+    @pytest.mark.asyncio
+    async def test_same_loop_retries_until_temporal_is_reachable(self):
+        """Test a failed connection at startup is retried with backoff."""
+        fake_worker = _FakeWorker()
+        client_manager = MagicMock()
+        client_manager.get_client = AsyncMock(
+            side_effect=[RuntimeError("unreachable"), RuntimeError("unreachable"), None]
+        )
+        embedded = EmbeddedWorker(
+            MagicMock(),
+            mode=MODE_SAME_LOOP,
+            connect_initial_backoff_seconds=0.01,
+            connect_max_backoff_seconds=0.02,
+        )
+
+        with patch(
+            "src.workers.embedded.create_temporal_worker", return_value=fake_worker
+        ):
+            await embedded.start(client_manager)
+            await asyncio.sleep(0)
+            assert embedded.stats()["state"] == STATE_CONNECTING
+            assert embedded.stats()["last_error"] == "unreachable"
+
+            await asyncio.sleep(0.1)
+            assert embedded.stats()["state"] == STATE_RUNNING
+            assert embedded.stats()["connect_attempts"] == 3
+
+            await embedded.stop()
+
+        assert not embedded.is_running
+
+    @pytest.mark.asyncio
+    async def test_stop_while_connecting(self):
+        """Test stopping before Temporal is reachable cancels the retries."""
+        client_manager = MagicMock()
+        client_manager.get_client = AsyncMock(side_effect=RuntimeError("unreachable"))
+        embedded = EmbeddedWorker(
+            MagicMock(), mode=MODE_SAME_LOOP, connect_initial_backoff_seconds=10
+        )
+
+        await embedded.start(client_manager)
+        await asyncio.sleep(0)
+        await asyncio.wait_for(embedded.stop(), timeout=1)
+
+        assert not embedded.is_running
+
+    @pytest.mark.asyncio
+    async def test_dedicated_thread_runs_on_its_own_loop(self):
+        """Test dedicated_thread runs the worker on a separate loop and stops it."""
+        fake_worker = _FakeWorker()
+        embedded = EmbeddedWorker(
+            MagicMock(), mode=MODE_DEDICATED_THREAD, lag_interval_seconds=0.01
+        )
+
+        with (
+            patch("src.workers.embedded.connect_worker_client", AsyncMock()) as connect,
+            patch(
+                "src.workers.embedded.create_temporal_worker", return_value=fake_worker
+            ),
+        ):
+            await embedded.start(MagicMock())
+            assert await asyncio.to_thread(fake_worker.started.wait, 5)
+            await asyncio.sleep(0.05)
+
+            assert embedded.is_running
+            assert fake_worker.loop is not asyncio.get_running_loop()
+            connect.assert_awaited_once()
+
+            await embedded.stop()
+
+        assert not embedded.is_running
+        assert embedded.stats()["loop_lag"]["samples"] >= 1
@@ -0,0 +1,86 @@
+"""Unit tests for the pluggable JSON backend."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import json
+from datetime import datetime
+
+# Third-party
+import pytest
+from fastapi.testclient import TestClient
+
+# Local Application
+from src.models.workflow import ErrorResponse
+from src.utils.json_backend import (
+    AUTO_BACKEND_ORDER,
+    BACKEND_STDLIB,
+    is_json_backend_installed,
+    load_json_backend,
+)
+
+INSTALLED_BACKENDS = [
+    name for name in AUTO_BACKEND_ORDER if is_json_backend_installed(name)
+]
+
+
+# ================================== Test Classes ============================= #
+class TestJSONBackends:
+    """Test cases shared by every installed JSON backend."""
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_round_trip_matches_stdlib(self, name):
+        """Test each backend encodes compact UTF-8 and decodes what it wrote."""
+        backend = load_json_backend(name)
+        content = {"name": "ünïcode", "values": [1, 2.5, None, True], 3: "int key"}
+
+        body = backend.dumps(content)
+
+        assert json.loads(body) == {
+            "name": "ünïcode",
+            "values": [1, 2.5, None, True],
+            "3": "int key",
+        }
+        assert backend.loads(body)["name"] == "ünïcode"
+        assert b" " not in backend.dumps([1, 2])
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_unsupported_values_use_fallbacks(self, name):
+        """Test models, datetimes and huge integers still serialize."""
+        backend = load_json_backend(name)
+        model = ErrorResponse(error="E", message="m")
+
+        assert json.loads(backend.dumps({"model": model}))["model"]["error"] == "E"
+        assert json.loads(backend.dumps(datetime(2024, 1, 1))) == "2024-01-01T00:00:00"
+        assert json.loads(backend.dumps(2**80)) == 2**80
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_invalid_json_raises_stdlib_error(self, name):
+        """Test decode errors are the stdlib type FastAPI expects."""
+        with pytest.raises(json.JSONDecodeError):
+            load_json_backend(name).loads(b"{not json")
+
+    def test_selection_and_fallback(self, monkeypatch):
+        """Test auto picks the first installed backend and missing ones fall back."""
+        monkeypatch.setattr(
+            "src.utils.json_backend.is_json_backend_installed",
+            lambda name: name == BACKEND_STDLIB,
+        )
+
+        assert load_json_backend("auto").name == BACKEND_STDLIB
+        assert load_json_backend("orjson").name == BACKEND_STDLIB
+        with pytest.raises(ValueError):
+            load_json_backend("yaml")
+
+
+class TestJSONBackendAPI:
+    """Test cases for JSON handling through the API."""
+
+    def test_malformed_body_is_422(self, fastapi_client: TestClient):
+        """Test malformed request JSON is still reported as a validation error."""
+        response = fastapi_client.post(
+            "/api/v1/workflows/start",
+            content=b'{"workflow_type": ',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
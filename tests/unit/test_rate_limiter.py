@@ -0,0 +1,115 @@
+"""Unit tests for token-bucket rate limiting."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-party
+import pytest
+from fastapi.testclient import TestClient
+
+# Local Application
+from src.api.main import create_app
+from src.services.rate_limiter import RedisTokenBucketLimiter, TokenBucketLimiter
+
+
+# ================================== Test Classes ============================= #
+class TestTokenBucketLimiter:
+    """Test cases for the in-process limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self):
+        """Test a key gets its burst, is rejected, then refills over time."""
+        limiter = TokenBucketLimiter(requests_per_minute=60, burst_size=2)
+
+        with patch("src.services.rate_limiter.time.monotonic", return_value=100.0):
+            assert (await limiter.acquire("a"))[0]
+            assert (await limiter.acquire("a"))[0]
+            allowed, retry_after = await limiter.acquire("a")
+            assert not allowed
+            assert retry_after == pytest.approx(1.0)
+            # Other keys have their own bucket
+            assert (await limiter.acquire("b"))[0]
+
+        with patch("src.services.rate_limiter.time.monotonic", return_value=101.0):
+            assert (await limiter.acquire("a"))[0]
+
+    @pytest.mark.asyncio
+    async def test_idle_keys_are_evicted(self):
+        """Test buckets idle long enough to be full again are dropped."""
+        limiter = TokenBucketLimiter(requests_per_minute=60, burst_size=2)
+
+        with patch("src.services.rate_limiter.time.monotonic", return_value=100.0):
+            await limiter.acquire("a")
+            await limiter.acquire("b")
+        with patch("src.services.rate_limiter.time.monotonic", return_value=101.5):
+            await limiter.acquire("b")
+        assert limiter.stats()["keys"] == 2
+
+        with patch("src.services.rate_limiter.time.monotonic", return_value=102.0):
+            await limiter.acquire("c")
+        assert limiter.stats()["keys"] == 2
+        assert "a" not in limiter._buckets
+
+
+class TestRedisTokenBucketLimiter:
+    """Test cases for the Redis-backed limiter."""
+
+    @pytest.mark.asyncio
+    async def test_script_decision_and_fail_open(self):
+        """Test script results are honoured and Redis errors allow requests."""
+        script = AsyncMock(side_effect=[[1, 0], [0, 1500], ConnectionError("down")])
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = script
+        limiter = RedisTokenBucketLimiter(
+            redis_client, requests_per_minute=60, burst_size=1
+        )
+
+        assert await limiter.acquire("a") == (True, 0.0)
+        assert await limiter.acquire("a") == (False, 1.5)
+        assert await limiter.acquire("a") == (True, 0.0)
+        assert script.await_args.kwargs["keys"] == ["rate-limit:a"]
+        assert limiter.stats()["errors"] == 1
+
+
+class TestRateLimitMiddleware:
+    """Test cases for the rate limit middleware."""
+
+    def test_requests_over_limit_get_429(self, test_config):
+        """Test a client over its burst gets 429 with Retry-After."""
+        test_config.api.rate_limit = {
+            "enabled": True,
+            "requests_per_minute": 60,
+            "burst_size": 2,
+            "exempt_paths": ["/api/v1/health"],
+        }
+        app = create_app(test_config)
+        client = TestClient(app)
+
+        for _ in range(2):
+            assert client.get("/docs").status_code == 200
+        response = client.get("/docs")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["error"] == "RATE_LIMITED"
+        # Other clients and exempt paths are unaffected
+        other_client = TestClient(app, client=("10.0.0.2", 50000))
+        assert other_client.get("/docs").status_code == 200
+        assert client.get("/api/v1/health/").status_code == 200
+
+    def test_user_header_does_not_change_the_bucket(self, test_config):
+        """Test rotating X-User-Id does not get around the limit."""
+        test_config.api.rate_limit = {
+            "enabled": True,
+            "requests_per_minute": 60,
+            "burst_size": 2,
+        }
+        client = TestClient(create_app(test_config))
+
+        statuses = [
+            client.get("/docs", headers={"X-User-Id": f"user_{i}"}).status_code
+            for i in range(4)
+        ]
+
+        assert statuses == [200, 200, 429, 429]
@@ -0,0 +1,58 @@
+"""Unit tests for API serving."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from unittest.mock import patch
+
+# Third-party
+import pytest
+from omegaconf import OmegaConf
+
+# Local Application
+from src.api.main import APP_CONFIG_ENV_VAR, create_app_from_env
+from src.api.server import APP_FACTORY, run_api_server
+
+
+# ================================== Test Classes ============================= #
+class TestAPIServer:
+    """Test cases for the multi-process API server launcher."""
+
+    def test_multiple_workers_use_factory_and_recycling(self, test_config):
+        """Test workers get the app factory and a max request limit."""
+        test_config.api.server.workers = 4
+        test_config.app.settings = {"max_requests": 500, "timeout": 10}
+
+        with patch.dict("os.environ"), patch("src.api.server.uvicorn.run") as mock_run:
+            run_api_server(test_config)
+
+        args, kwargs = mock_run.call_args
+        assert args == (APP_FACTORY,)
+        assert kwargs["factory"] is True
+        assert kwargs["workers"] == 4
+        assert kwargs["limit_max_requests"] == 500
+        assert kwargs["timeout_graceful_shutdown"] == 10
+
+    def test_single_worker_is_not_recycled(self, test_config):
+        """Test a lone worker never exits on the max request limit."""
+        test_config.app.settings = {"max_requests": 500}
+
+        with patch.dict("os.environ"), patch("src.api.server.uvicorn.run") as mock_run:
+            run_api_server(test_config)
+
+        assert mock_run.call_args.kwargs["limit_max_requests"] is None
+
+    def test_factory_builds_app_from_exported_config(self, test_config, monkeypatch):
+        """Test worker processes rebuild the app from the exported config."""
+        monkeypatch.setenv(APP_CONFIG_ENV_VAR, OmegaConf.to_yaml(test_config))
+
+        app = create_app_from_env()
+
+        assert app.title == "Test API"
+        assert app.state.config.api.server.port == 8000
+
+    def test_factory_requires_exported_config(self, monkeypatch):
+        """Test the factory fails clearly when run without the launcher."""
+        monkeypatch.delenv(APP_CONFIG_ENV_VAR, raising=False)
+
+        with pytest.raises(RuntimeError):
+            create_app_from_env()
@@ -0,0 +1,193 @@
+"""Unit tests for the Temporal service."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Third-party
+import pytest
+
+# Local Application
+from src.services.temporal_service import (
+    SELECTION_LEAST_OUTSTANDING,
+    SingleFlight,
+    TemporalClientManager,
+    describe_workflow,
+)
+
+
+# ================================== Test Classes ============================= #
+class TestTemporalClientManager:
+    """Test cases for TemporalClientManager."""
+
+    def test_from_config(self, test_config):
+        """Test manager reads host, port and namespace from configuration."""
+        manager = TemporalClientManager.from_config(test_config)
+
+        assert manager.target_host == "localhost:7233"
+        assert manager.namespace == "test"
+        assert manager.pool_size == 1
+        assert manager.is_connected is False
+
+    def test_invalid_selection_strategy(self):
+        """Test unknown selection strategies are rejected."""
+        with pytest.raises(ValueError):
+            TemporalClientManager(selection="random")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_client_connects_once(self):
+        """Test concurrent callers share a single connection attempt."""
+        mock_client = MagicMock()
+
+        async def _connect(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_client
+
+        manager = TemporalClientManager("temporal:7233", "test")
+        with patch(
+            "src.services.temporal_service.Client.connect",
+            AsyncMock(side_effect=_connect),
+        ) as mock_connect:
+            clients = await asyncio.gather(*(manager.get_client() for _ in range(10)))
+
+        assert all(client is mock_client for client in clients)
+        mock_connect.assert_awaited_once_with("temporal:7233", namespace="test")
+
+    @pytest.mark.asyncio
+    async def test_get_client_failure_raises_runtime_error(self):
+        """Test connection failures surface as RuntimeError and can be retried."""
+        manager = TemporalClientManager()
+        with patch(
+            "src.services.temporal_service.Client.connect",
+            AsyncMock(side_effect=ConnectionError("refused")),
+        ):
+            with pytest.raises(RuntimeError):
+                await manager.get_client()
+
+        assert manager.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_round_robin_selection(self):
+        """Test round-robin selection cycles through pooled connections."""
+        pool = [MagicMock(name=f"client-{index}") for index in range(3)]
+        manager = TemporalClientManager(pool_size=3)
+        with patch(
+            "src.services.temporal_service.Client.connect",
+            AsyncMock(side_effect=pool),
+        ):
+            clients = [await manager.get_client() for _ in range(6)]
+
+        assert clients == pool + pool
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_selection_and_stats(self):
+        """Test leases pick the idlest connection and report in-flight counts."""
+        pool = [MagicMock(name=f"client-{index}") for index in range(2)]
+        manager = TemporalClientManager(
+            pool_size=2, selection=SELECTION_LEAST_OUTSTANDING
+        )
+        with patch(
+            "src.services.temporal_service.Client.connect",
+            AsyncMock(side_effect=pool),
+        ):
+            async with manager.lease() as first:
+                async with manager.lease() as second:
+                    in_flight = [
+                        connection["in_flight"]
+                        for connection in manager.stats()["connections"]
+                    ]
+
+        assert first is not second
+        assert in_flight == [1, 1]
+        assert [
+            connection["in_flight"] for connection in manager.stats()["connections"]
+        ] == [0, 0]
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_upstream_call(self):
+        """Test identical concurrent calls run once and all get the result."""
+        release = asyncio.Event()
+        upstream = AsyncMock()
+
+        async def _call():
+            await upstream()
+            await release.wait()
+            return "done"
+
+        flights = SingleFlight()
+        waiters = [asyncio.ensure_future(flights.do("key", _call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["done"] * 3
+        assert upstream.await_count == 1
+        assert flights.stats() == {
+            "in_flight": 0,
+            "calls": 1,
+            "shared": 2,
+            "abandoned": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_detaches_and_last_one_cancels(self):
+        """Test one cancelled caller leaves the call running until all leave."""
+        cancelled = asyncio.Event()
+
+        async def _call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        flights = SingleFlight()
+        first = asyncio.ensure_future(flights.do("key", _call))
+        second = asyncio.ensure_future(flights.do("key", _call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not second.done()
+        assert flights.in_flight == 1
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert flights.stats()["abandoned"] == 1
+        assert flights.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_and_not_remembered(self):
+        """Test a failed call raises for every caller and the next call retries."""
+        upstream = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+        flights = SingleFlight()
+
+        results = await asyncio.gather(
+            flights.do("key", upstream),
+            flights.do("key", upstream),
+            return_exceptions=True,
+        )
+
+        assert [type(result) for result in results] == [RuntimeError] * 2
+        assert await flights.do("key", upstream) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_describe_workflow_is_shared(self):
+        """Test concurrent describes of one workflow make one describe call."""
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.return_value = "description"
+        mock_client = MagicMock()
+        mock_client.namespace = "test"
+        mock_client.get_workflow_handle.return_value = mock_workflow_handle
+
+        results = await asyncio.gather(
+            describe_workflow(mock_client, "wf-1"),
+            describe_workflow(mock_client, "wf-1"),
+        )
+
+        assert results == ["description", "description"]
+        assert mock_workflow_handle.describe.await_count == 1
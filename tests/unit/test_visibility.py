@@ -0,0 +1,79 @@
+"""Unit tests for visibility query helpers."""
+
+# ================================== Imports ================================== #
+# Standard Library
+from datetime import datetime
+
+# Third-party
+import pytest
+
+# Local Application
+from src.services.visibility import (
+    CORRELATION_ID_ATTRIBUTE,
+    USER_ID_ATTRIBUTE,
+    build_list_filter,
+    build_search_attributes,
+    build_workflow_id_filter,
+    decode_cursor,
+    encode_cursor,
+    quote_query_value,
+)
+
+
+# ================================== Test Classes ============================= #
+class TestVisibilityQueries:
+    """Test cases for visibility query helpers."""
+
+    def test_quote_query_value_escapes_quotes(self):
+        """Test quotes and backslashes cannot break out of a literal."""
+        assert quote_query_value("plain") == "'plain'"
+        assert quote_query_value("it's") == r"'it\'s'"
+        assert quote_query_value(r"a\b") == r"'a\\b'"
+
+    def test_build_workflow_id_filter(self):
+        """Test an ID list becomes a WorkflowId IN filter."""
+        assert (
+            build_workflow_id_filter(["wf-1", "wf-2"])
+            == "WorkflowId IN ('wf-1', 'wf-2')"
+        )
+
+    def test_build_list_filter(self):
+        """Test list filters combine every given clause."""
+        query = build_list_filter(
+            workflow_type="simple_workflow",
+            status="continued_as_new",
+            user_id="user_1",
+            started_after=datetime(2024, 1, 1),
+        )
+
+        assert query == (
+            "WorkflowType = 'simple_workflow'"
+            " AND ExecutionStatus = 'ContinuedAsNew'"
+            " AND UserId = 'user_1'"
+            " AND StartTime >= '2024-01-01T00:00:00+00:00'"
+        )
+        assert build_list_filter() == ""
+        assert build_list_filter(user_id="user_1") == "UserId = 'user_1'"
+
+    def test_build_list_filter_rejects_unknown_status(self):
+        """Test unknown statuses are rejected."""
+        with pytest.raises(ValueError):
+            build_list_filter(status="SLEEPING")
+
+    def test_build_search_attributes(self):
+        """Test only the given values become search attributes."""
+        attributes = build_search_attributes(user_id="user_1", correlation_id="c-1")
+
+        assert attributes.get(USER_ID_ATTRIBUTE) == "user_1"
+        assert attributes.get(CORRELATION_ID_ATTRIBUTE) == "c-1"
+        assert CORRELATION_ID_ATTRIBUTE not in build_search_attributes(user_id="u")
+
+    def test_cursor_round_trip_is_bound_to_query(self):
+        """Test cursors decode for their own query only."""
+        cursor = encode_cursor("WorkflowType = 'a'", b"\x00token")
+
+        assert decode_cursor(cursor, "WorkflowType = 'a'") == b"\x00token"
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "WorkflowType = 'b'")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "WorkflowType = 'a'")
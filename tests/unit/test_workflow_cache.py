@@ -0,0 +1,164 @@
+"""Unit tests for workflow caches."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from unittest.mock import AsyncMock
+
+# Third-party
+import pytest
+
+# Local Application
+from src.models.workflow import WorkflowResponse
+from src.services.workflow_cache import (
+    CachedResult,
+    WorkflowResultCache,
+    WorkflowStatusCache,
+)
+
+
+# ================================== Helpers ================================== #
+def _status(workflow_id: str, status: str) -> WorkflowResponse:
+    """Build a status response for tests."""
+    return WorkflowResponse(
+        workflow_id=workflow_id,
+        status=status,
+        message=f"Workflow is {status.lower()}",
+        created_at="2023-01-01T00:00:00",
+    )
+
+
+# ================================== Test Classes ============================= #
+class TestWorkflowStatusCache:
+    """Test cases for WorkflowStatusCache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_load(self):
+        """Test concurrent lookups of one ID coalesce into a single load."""
+        cache = WorkflowStatusCache(ttl_seconds=60)
+
+        async def _describe() -> WorkflowResponse:
+            await asyncio.sleep(0.01)
+            return _status("wf-1", "RUNNING")
+
+        loader = AsyncMock(side_effect=_describe)
+        results = await asyncio.gather(
+            *(cache.get_or_load("wf-1", loader) for _ in range(5))
+        )
+
+        assert all(result.status == "RUNNING" for result in results)
+        assert loader.await_count == 1
+
+        await cache.get_or_load("wf-1", loader)
+        assert loader.await_count == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_running_status_expires_terminal_does_not(self):
+        """Test non-terminal statuses expire while terminal ones stay cached."""
+        cache = WorkflowStatusCache(ttl_seconds=0)
+        running = AsyncMock(return_value=_status("wf-1", "RUNNING"))
+        completed = AsyncMock(return_value=_status("wf-2", "COMPLETED"))
+
+        await cache.get_or_load("wf-1", running)
+        await cache.get_or_load("wf-1", running)
+        await cache.get_or_load("wf-2", completed)
+        await cache.get_or_load("wf-2", completed)
+
+        assert running.await_count == 2
+        assert completed.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache = WorkflowStatusCache(ttl_seconds=60, max_entries=2)
+        loaders = {
+            workflow_id: AsyncMock(return_value=_status(workflow_id, "COMPLETED"))
+            for workflow_id in ("wf-1", "wf-2", "wf-3")
+        }
+
+        await cache.get_or_load("wf-1", loaders["wf-1"])
+        await cache.get_or_load("wf-2", loaders["wf-2"])
+        await cache.get_or_load("wf-1", loaders["wf-1"])
+        await cache.get_or_load("wf-3", loaders["wf-3"])
+        await cache.get_or_load("wf-2", loaders["wf-2"])
+
+        assert loaders["wf-1"].await_count == 1
+        assert loaders["wf-2"].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached(self):
+        """Test loader errors propagate and are retried on the next lookup."""
+        cache = WorkflowStatusCache()
+        loader = AsyncMock(
+            side_effect=[RuntimeError("not found"), _status("wf-1", "RUNNING")]
+        )
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("wf-1", loader)
+        result = await cache.get_or_load("wf-1", loader)
+
+        assert result.status == "RUNNING"
+
+
+class TestWorkflowResultCache:
+    """Test cases for WorkflowResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_size(self):
+        """Test entries are evicted least recently used first by total bytes."""
+        cache = WorkflowResultCache(max_bytes=10)
+
+        await cache.put("wf-1", b"aaaa", '"a"')
+        await cache.put("wf-2", b"bbbb", '"b"')
+        assert await cache.get("wf-1") == CachedResult(b"aaaa", '"a"')
+        await cache.put("wf-3", b"cccc", '"c"')
+
+        assert await cache.get("wf-2") is None
+        assert await cache.get("wf-1") == CachedResult(b"aaaa", '"a"')
+        stats = cache.stats()
+        assert stats["size_bytes"] == 8
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_is_not_cached(self):
+        """Test bodies larger than the whole budget are skipped."""
+        cache = WorkflowResultCache(max_bytes=4)
+
+        await cache.put("wf-1", b"too large", '"t"')
+
+        assert await cache.get("wf-1") is None
+        assert cache.stats()["size_bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_tier(self):
+        """Test Redis stores the ETag with the body and is read on local misses."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = b'"s"\nshared'
+        cache = WorkflowResultCache(redis_client=redis_client, redis_ttl_seconds=60)
+
+        await cache.put("wf-1", b"local", '"l"')
+        assert await cache.get("wf-2") == CachedResult(b"shared", '"s"')
+        assert await cache.get("wf-2") == CachedResult(b"shared", '"s"')
+
+        redis_client.set.assert_awaited_once_with(
+            "workflow-result:wf-1", b'"l"\nlocal', ex=60
+        )
+        redis_client.get.assert_awaited_once_with("workflow-result:wf-2")
+        assert cache.stats()["redis_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_both_tiers(self):
+        """Test invalidation frees the local entry and deletes it from Redis."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        cache = WorkflowResultCache(redis_client=redis_client)
+        await cache.put("wf-1", b"previous run", '"p"')
+
+        await cache.invalidate("wf-1")
+
+        assert await cache.get("wf-1") is None
+        assert cache.stats()["size_bytes"] == 0
+        redis_client.delete.assert_awaited_once_with("workflow-result:wf-1")
@@ -0,0 +1,106 @@
+"""Unit tests for the workflow event hub."""
+
+# ================================== Imports ================================== #
+# Standard Library
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-party
+import pytest
+
+# Local Application
+from src.services.workflow_events import (
+    EVENT_END,
+    EVENT_RESULT,
+    EVENT_STATUS,
+    WorkflowEventHub,
+)
+
+
+# ================================== Helpers ================================== #
+def _description(status: str) -> MagicMock:
+    """Build a describe() result for tests."""
+    description = MagicMock()
+    description.status.name = status
+    description.start_time = datetime(2023, 1, 1)
+    return description
+
+
+async def _drain(queue: asyncio.Queue) -> list:
+    """Collect events from a subscription until the end event."""
+    events = []
+    while True:
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        events.append(event)
+        if event.event == EVENT_END:
+            return events
+
+
+# ================================== Test Classes ============================= #
+class TestWorkflowEventHub:
+    """Test cases for WorkflowEventHub."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_watcher(self):
+        """Test concurrent subscribers of one workflow share one upstream watch."""
+        release = asyncio.Event()
+
+        async def _result():
+            await release.wait()
+            return {"success": True}
+
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.side_effect = [
+            _description("RUNNING"),
+            _description("COMPLETED"),
+        ]
+        mock_workflow_handle.result.side_effect = _result
+        mock_client = MagicMock()
+        mock_client.get_workflow_handle.return_value = mock_workflow_handle
+
+        hub = WorkflowEventHub()
+        async with hub.subscribe("wf-1", mock_client) as first:
+            async with hub.subscribe("wf-1", mock_client) as second:
+                assert hub.watcher_count == 1
+                release.set()
+                first_events = await _drain(first)
+                second_events = await _drain(second)
+
+        assert [event.event for event in first_events] == [
+            EVENT_STATUS,
+            EVENT_RESULT,
+            EVENT_STATUS,
+            EVENT_END,
+        ]
+        assert first_events == second_events
+        assert first_events[2].data["status"] == "COMPLETED"
+        assert mock_workflow_handle.describe.await_count == 2
+        assert mock_workflow_handle.result.await_count == 1
+        assert hub.watcher_count == 0
+
+    @pytest.mark.asyncio
+    async def test_last_unsubscribe_cancels_watch(self):
+        """Test the upstream watch is cancelled when nobody is subscribed."""
+        cancelled = asyncio.Event()
+
+        async def _result():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_workflow_handle = AsyncMock()
+        mock_workflow_handle.describe.return_value = _description("RUNNING")
+        mock_workflow_handle.result.side_effect = _result
+        mock_client = MagicMock()
+        mock_client.get_workflow_handle.return_value = mock_workflow_handle
+
+        hub = WorkflowEventHub()
+        async with hub.subscribe("wf-1", mock_client) as queue:
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            assert event.data["status"] == "RUNNING"
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert hub.watcher_count == 0
@@ -49,6 +49,33 @@ class TestSimpleWorkflow:
         assert failure_result.error_message == "Test error"
         assert failure_result.result_data is None
 
+    def test_workflow_signal_is_recorded(self):
+        """Test the workflow_signal handler records signal payloads."""
+        with patch("src.workflows.simple_workflow.workflow.logger"):
+            simple_workflow = SimpleWorkflow(
+                WorkflowInput(request_id="r-1", user_id="u-1", parameters={})
+            )
+
+        simple_workflow.workflow_signal({"event": "paid"})
+
+        assert simple_workflow.signals == [{"event": "paid"}]
+
+    def test_await_result_validator_rejects_invalid_input(self):
+        """Test the await_result update is rejected for input that cannot succeed."""
+        with patch("src.workflows.simple_workflow.workflow.logger"):
+            valid = SimpleWorkflow(
+                WorkflowInput(
+                    request_id="r-1", user_id="u-1", parameters={"required_field": "a"}
+                )
+            )
+            invalid = SimpleWorkflow(
+                WorkflowInput(request_id="r-2", user_id="u-1", parameters={"x": 1})
+            )
+
+        valid.validate_await_result()
+        with pytest.raises(ValueError, match="Missing required field"):
+            invalid.validate_await_result()
+
 
 class TestWorkflowActivities:
     """Test cases for workflow activities."""